@@ -0,0 +1,273 @@
+import os
+import sys
+import json
+import hashlib
+import argparse
+import tempfile
+
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QImageReader
+
+from job_details import JOB_DETAILS
+
+# --- Asset Setup ---
+THUMBNAIL_DIR = os.path.join('img', 'thumbs')
+MANIFEST_PATH = os.path.join(THUMBNAIL_DIR, 'manifest.json')
+MANIFEST_FORMAT_VERSION = 1
+
+# Every box (width, height) an image is shown in; thumbnails are fitted inside it
+DISPLAY_SIZES = {
+    'job_wide': (400, 200),    # home.py job details panel
+    'job_square': (200, 200),  # test.py/testui.py job details panel
+    'intro': (300, 300),       # test.py/testui.py intro panel
+    'home': (300, 240),        # home.py home page
+}
+# Device pixel ratios thumbnails are rendered for; HiDPI screens use the @2x files
+SCALES = (1, 2)
+JPEG_QUALITY = 85
+
+# Images that are not career pictures: asset name -> (source path, display sizes)
+EXTRA_IMAGES = {
+    'allbots': ('img/allbots.png', ('intro',)),
+    'homeimg': ('img/homeimg.png', ('home',)),
+}
+CAREER_IMAGE_SIZES = ('job_wide', 'job_square')
+
+
+def asset_name(source_path):
+    """Derives a file-name-safe asset name from a source image path ("img/ux ui.png" -> "ux-ui")."""
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    return '-'.join(stem.lower().split())
+
+def thumbnail_name(name, size_name, scale, extension):
+    width, height = DISPLAY_SIZES[size_name]
+    suffix = f"@{scale}x" if scale != 1 else ''
+    return f"{name}-{width}x{height}{suffix}.{extension}"
+
+def collect_sources(job_details=JOB_DETAILS):
+    """
+    Lists every image the UI shows.
+
+    Returns:
+        tuple: ({asset_name: (source_path, display_sizes)}, {career: asset_name})
+    """
+    sources = {}
+    careers = {}
+    for career, details in job_details.items():
+        source_path = details.get('image_path')
+        if not source_path:
+            continue
+        name = asset_name(source_path)
+        sources[name] = (source_path, CAREER_IMAGE_SIZES)
+        careers[career] = name
+    for name, (source_path, size_names) in EXTRA_IMAGES.items():
+        sources[name] = (source_path, size_names)
+    return sources, careers
+
+def validate_source(source_path):
+    """
+    Returns a problem description if source_path does not exist with exactly this spelling,
+    or None if it does. Case is checked against the directory listing so a misnamed file is
+    reported on case-insensitive file systems too.
+    """
+    directory, file_name = os.path.split(source_path)
+    try:
+        entries = os.listdir(directory or '.')
+    except OSError:
+        return f"{source_path}: directory {directory!r} does not exist"
+    if file_name in entries:
+        return None
+    near_misses = [entry for entry in entries if entry.lower() == file_name.lower()]
+    if near_misses:
+        return f"{source_path}: not found; the file on disk is named {near_misses[0]!r} (check the case)"
+    return f"{source_path}: not found"
+
+def source_digest(source_path):
+    with open(source_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+# --- Building ---
+def render_thumbnail(source_path, size_name, scale, output_path):
+    """Decodes source_path fitted into the display box at scale and writes it to output_path."""
+    width, height = DISPLAY_SIZES[size_name]
+    reader = QImageReader(source_path)
+    reader.setAutoTransform(True)
+    target = reader.size().scaled(QSize(width * scale, height * scale), Qt.AspectRatioMode.KeepAspectRatio)
+    reader.setScaledSize(target)
+    image = reader.read()
+    if image.isNull():
+        raise ValueError(f"{source_path}: could not be decoded ({reader.errorString()})")
+    quality = JPEG_QUALITY if output_path.endswith('.jpg') else -1
+    if not image.save(output_path, None, quality):
+        raise OSError(f"{output_path}: could not be written")
+
+def manifest_files(manifest):
+    """Returns the names of the thumbnail files a manifest lists."""
+    return {file_name for asset in manifest.get('assets', {}).values()
+            for by_scale in asset.get('thumbnails', {}).values() for file_name in by_scale.values()}
+
+def build_assets(output_dir=THUMBNAIL_DIR, job_details=JOB_DETAILS):
+    """
+    Validates every source image, renders one thumbnail per display size and scale into
+    output_dir and writes the manifest there. Nothing is written if any source is missing.
+    Opaque images become JPEG; images with transparency stay PNG.
+
+    Returns:
+        dict: the manifest that was written.
+    """
+    sources, careers = collect_sources(job_details)
+    problems = [problem for problem in (validate_source(path) for path, _ in sources.values()) if problem]
+    if problems:
+        raise ValueError("invalid image sources:\n  " + "\n  ".join(problems))
+
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, os.path.basename(MANIFEST_PATH))
+    previous = read_manifest(manifest_path)
+    assets = {}
+    for name, (source_path, size_names) in sorted(sources.items()):
+        extension = 'png' if QImageReader(source_path).read().hasAlphaChannel() else 'jpg'
+        thumbnails = {}
+        for size_name in size_names:
+            thumbnails[size_name] = {}
+            for scale in SCALES:
+                file_name = thumbnail_name(name, size_name, scale, extension)
+                render_thumbnail(source_path, size_name, scale, os.path.join(output_dir, file_name))
+                thumbnails[size_name][str(scale)] = file_name
+        assets[name] = {
+            'source': source_path,
+            'source_sha256': source_digest(source_path),
+            'thumbnails': thumbnails,
+        }
+
+    manifest = {
+        'format_version': MANIFEST_FORMAT_VERSION,
+        'display_sizes': DISPLAY_SIZES,
+        'careers': careers,
+        'assets': assets,
+    }
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(tmp_path, manifest_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    # Drop thumbnails the previous build wrote for renamed or removed sources. Only files the
+    # previous manifest lists are removed, so other files in output_dir are never touched.
+    if previous is not None:
+        for file_name in manifest_files(previous) - manifest_files(manifest):
+            path = os.path.join(output_dir, os.path.basename(file_name))
+            if os.path.exists(path):
+                os.remove(path)
+    return manifest
+
+def check_assets(manifest_path=MANIFEST_PATH, job_details=JOB_DETAILS):
+    """Returns a list of reasons the manifest is out of date with the sources (empty if it is current)."""
+    sources, careers = collect_sources(job_details)
+    problems = [problem for problem in (validate_source(path) for path, _ in sources.values()) if problem]
+    manifest = read_manifest(manifest_path)
+    if manifest is None:
+        return problems + [f"{manifest_path}: missing or unreadable"]
+
+    output_dir = os.path.dirname(manifest_path)
+    if manifest.get('display_sizes') != {name: list(size) for name, size in DISPLAY_SIZES.items()}:
+        problems.append("display sizes changed")
+    if manifest.get('careers') != careers:
+        problems.append("career to image mapping changed")
+    assets = manifest.get('assets', {})
+    for name, (source_path, size_names) in sources.items():
+        asset = assets.get(name)
+        if asset is None or set(asset['thumbnails']) != set(size_names):
+            problems.append(f"{name}: not built for {', '.join(size_names)}")
+            continue
+        if os.path.exists(source_path) and asset['source_sha256'] != source_digest(source_path):
+            problems.append(f"{name}: {source_path} changed since the last build")
+        for by_scale in asset['thumbnails'].values():
+            for file_name in by_scale.values():
+                if not os.path.exists(os.path.join(output_dir, file_name)):
+                    problems.append(f"{name}: {file_name} is missing")
+    return problems
+
+
+# --- Runtime Lookup ---
+def read_manifest(manifest_path=MANIFEST_PATH):
+    """Returns the parsed manifest, or None if it is missing, unreadable or of another format version."""
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('format_version') != MANIFEST_FORMAT_VERSION:
+        return None
+    return manifest
+
+class AssetManifest:
+    """
+    Resolves careers and named images to the pre-built thumbnail for a display size.
+    The application reads only the manifest and the thumbnails, never the full-size sources.
+    """
+
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        self.base_dir = os.path.dirname(manifest_path)
+        manifest = read_manifest(manifest_path)
+        if manifest is None:
+            print(f"Warning: asset manifest {manifest_path} is missing or out of date; run 'python project/assets.py build'.")
+            manifest = {'careers': {}, 'assets': {}}
+        self.careers = manifest['careers']
+        self.assets = manifest['assets']
+
+    def image(self, name, size_name, device_pixel_ratio=1.0):
+        """
+        Returns the path of the thumbnail of asset name for size_name at the smallest scale
+        that is at least device_pixel_ratio (or the largest one built), or None if there is none.
+        """
+        by_scale = self.assets.get(name, {}).get('thumbnails', {}).get(size_name)
+        if not by_scale:
+            return None
+        scales = sorted(int(scale) for scale in by_scale)
+        chosen = next((scale for scale in scales if scale >= device_pixel_ratio), scales[-1])
+        return os.path.join(self.base_dir, by_scale[str(chosen)])
+
+    def career_image(self, career, size_name, device_pixel_ratio=1.0):
+        """Returns the thumbnail path for a career's picture, or None if the career has no image."""
+        name = self.careers.get(career)
+        return self.image(name, size_name, device_pixel_ratio) if name else None
+
+def display_size(size_name):
+    """Returns the display box of size_name as a QSize."""
+    return QSize(*DISPLAY_SIZES[size_name])
+
+
+# --- Command Line Interface ---
+def main(argv=None):
+    """Builds or checks the thumbnails and manifest the application loads images from."""
+    parser = argparse.ArgumentParser(description="Build the image thumbnails and asset manifest.")
+    parser.add_argument('--output-dir', default=THUMBNAIL_DIR, help="Directory for thumbnails and manifest.json.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help="Validate sources and regenerate thumbnails and the manifest.")
+    subparsers.add_parser('check', help="Report whether the manifest is up to date with the sources.")
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        try:
+            manifest = build_assets(args.output_dir)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        thumbnail_count = sum(len(by_scale) for asset in manifest['assets'].values() for by_scale in asset['thumbnails'].values())
+        print(f"Built {thumbnail_count} thumbnails for {len(manifest['assets'])} images in {args.output_dir}.")
+    elif args.command == 'check':
+        problems = check_assets(os.path.join(args.output_dir, os.path.basename(MANIFEST_PATH)))
+        if problems:
+            print("Assets out of date:\n  " + "\n  ".join(problems), file=sys.stderr)
+            return 1
+        print(f"{args.output_dir}: up to date.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
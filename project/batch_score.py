@@ -0,0 +1,258 @@
+import os
+import sys
+import csv
+import json
+import time
+import sqlite3
+import argparse
+import contextlib
+from itertools import islice
+
+import numpy as np
+
+from database import DATABASE_NAME, SurveyRepository
+from career_model import (
+    MODEL_ARTIFACT_PATH, QUESTION_KEYS,
+    DEFAULT_TOP_N, load_career_model, get_ml_career_recommendations_batch, format_industry_preferences
+)
+
+# --- Batch Scoring Setup ---
+DEFAULT_CHUNK_SIZE = 10_000
+# Answers are whole numbers on the survey's 1-7 scale
+ANSWER_MIN, ANSWER_MAX = 1, 7
+
+
+def csv_output_fields(top_n=DEFAULT_TOP_N):
+    """Columns written to CSV output, one career/score pair per top career."""
+    fields = ['student_name', 'preferred_industry', 'recommended_career', 'recommendation_score']
+    for rank in range(1, top_n + 1):
+        fields += [f'top{rank}_career', f'top{rank}_score']
+    return fields
+
+
+def detect_format(path, explicit_format=None):
+    """Returns 'csv' or 'jsonl' from an explicit choice or the file extension."""
+    if explicit_format:
+        return explicit_format
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.jsonl', '.ndjson', '.json'):
+        return 'jsonl'
+    return 'csv'
+
+def parse_answer(value):
+    """
+    Converts one answer cell to a float; blanks and nulls are unanswered (NaN).
+    Raises ValueError unless the answer is a whole number from ANSWER_MIN to ANSWER_MAX.
+    """
+    if value is None or value == '':
+        return np.nan
+    if isinstance(value, bool):
+        raise ValueError(f"{value!r} is not an answer")
+    answer = float(value)
+    if not answer.is_integer() or not ANSWER_MIN <= answer <= ANSWER_MAX:
+        raise ValueError(f"{value!r} is not a whole number from {ANSWER_MIN} to {ANSWER_MAX}")
+    return answer
+
+def read_csv_surveys(f, path):
+    """Yields (student_name, preferred_industry, answers) from an open CSV file with q1..q20 columns."""
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return
+    column_of = {name: i for i, name in enumerate(header)}
+    missing = [q_key for q_key in QUESTION_KEYS if q_key not in column_of]
+    if missing:
+        raise ValueError(f"{path}: missing question columns {', '.join(missing)}")
+    answer_columns = [column_of[q_key] for q_key in QUESTION_KEYS]
+    name_column = column_of.get('student_name')
+    industry_column = column_of.get('preferred_industry')
+
+    for line_number, row in enumerate(reader, start=2):
+        try:
+            answers = [parse_answer(row[i]) for i in answer_columns]
+        except (IndexError, ValueError) as e:
+            raise ValueError(f"{path}: line {line_number} has an invalid answer: {e}") from e
+        student_name = row[name_column] if name_column is not None else ''
+        preferred_industry = row[industry_column] if industry_column is not None else ''
+        yield student_name, preferred_industry, answers
+
+def read_jsonl_surveys(f, path):
+    """
+    Yields (student_name, preferred_industry, answers) from an open JSONL file. Answers may be
+    at the top level of each record or in a nested raw_survey_responses object, as stored
+    by the survey page. preferred_industry may be a string or an {industry: weight} object.
+    """
+    for line_number, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            responses = record.get('raw_survey_responses') or record
+            if isinstance(responses, str):
+                responses = json.loads(responses)
+            answers = [parse_answer(responses.get(q_key)) for q_key in QUESTION_KEYS]
+            preferred_industry = record.get('preferred_industry')
+            if preferred_industry is None:
+                preferred_industry = ''
+            elif isinstance(preferred_industry, dict):
+                preferred_industry = format_industry_preferences(preferred_industry)
+            elif not isinstance(preferred_industry, str):
+                raise ValueError(f"preferred_industry must be a string or an object, not {type(preferred_industry).__name__}")
+        except (AttributeError, TypeError, ValueError) as e:
+            raise ValueError(f"{path}: line {line_number} is not a valid survey: {e}") from e
+        yield record.get('student_name') or '', preferred_industry, answers
+
+def read_surveys(path, input_format):
+    """Lazily yields (student_name, preferred_industry, answers) for every survey in the file."""
+    with open(path, newline='', encoding='utf-8') as f:
+        if input_format == 'csv':
+            yield from read_csv_surveys(f, path)
+        else:
+            yield from read_jsonl_surveys(f, path)
+
+def iter_chunks(iterable, chunk_size):
+    """Yields lists of at most chunk_size items without materializing the whole iterable."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def format_output_row(student_name, preferred_industry, result, output_format):
+    """Builds one output record (a dict for csv.DictWriter, or a JSON line)."""
+    recommended_career, recommendation_score, top_careers = result
+    if output_format == 'jsonl':
+        return json.dumps({
+            'student_name': student_name,
+            'preferred_industry': preferred_industry,
+            'recommended_career': recommended_career,
+            'recommendation_score': recommendation_score,
+            'top_careers': top_careers,
+        }, ensure_ascii=False) + '\n'
+
+    row = {
+        'student_name': student_name,
+        'preferred_industry': preferred_industry,
+        'recommended_career': recommended_career,
+        'recommendation_score': f"{recommendation_score:.4f}",
+    }
+    for rank, (career, score) in enumerate(top_careers, start=1):
+        row[f'top{rank}_career'] = career
+        row[f'top{rank}_score'] = f"{score:.4f}"
+    return row
+
+def raw_responses_dict(answers):
+    """Converts one answer row to the {q_key: value} dict stored by submit_survey."""
+    return {q_key: int(value) for q_key, value in zip(QUESTION_KEYS, answers) if not np.isnan(value)}
+
+def score_file(input_path, output_path=None, database_name=None, chunk_size=DEFAULT_CHUNK_SIZE,
+               input_format=None, output_format=None, artifact_path=MODEL_ARTIFACT_PATH, top_n=DEFAULT_TOP_N):
+    """
+    Streams surveys from input_path in chunks of chunk_size, scores each chunk with one
+    batch call and writes the results, with the top_n careers of each survey, to output_path
+    and/or the survey_responses table. Only one chunk is held in memory at a time.
+
+    Nothing is written unless every survey is scored: output goes to a temporary file that
+    replaces output_path at the end, and all rows are inserted in one transaction, so an
+    invalid survey late in the file leaves neither a truncated output nor inserted rows.
+
+    Returns:
+        tuple: (rows_scored, elapsed_seconds)
+    """
+    ml_model, feature_names, career_outcomes = load_career_model(artifact_path)
+    input_format = detect_format(input_path, input_format)
+
+    output_file = writer = repository = tmp_output_path = None
+    if output_path:
+        output_format = detect_format(output_path, output_format)
+        tmp_output_path = f"{output_path}.{os.getpid()}.tmp" # Same directory, so the final rename is atomic
+        output_file = open(tmp_output_path, 'x', newline='', encoding='utf-8')
+        if output_format == 'csv':
+            writer = csv.DictWriter(output_file, fieldnames=csv_output_fields(top_n))
+            writer.writeheader()
+    if database_name:
+        repository = SurveyRepository(database_name)
+
+    rows_scored = 0
+    start_time = time.perf_counter()
+    try:
+        with repository.transaction() if repository else contextlib.nullcontext():
+            for chunk in iter_chunks(read_surveys(input_path, input_format), chunk_size):
+                names = [student_name for student_name, _, _ in chunk]
+                industries = [preferred_industry for _, preferred_industry, _ in chunk]
+                answers = np.array([row_answers for _, _, row_answers in chunk], dtype=float)
+
+                results = get_ml_career_recommendations_batch(
+                    ml_model, feature_names, career_outcomes, answers, industries, top_n=top_n
+                )
+
+                if output_file:
+                    for student_name, preferred_industry, result in zip(names, industries, results):
+                        record = format_output_row(student_name, preferred_industry, result, output_format)
+                        if writer:
+                            writer.writerow(record)
+                        else:
+                            output_file.write(record)
+                if repository:
+                    repository.add_submissions([
+                        (student_name, raw_responses_dict(row_answers), preferred_industry, result[0], result[1])
+                        for student_name, preferred_industry, row_answers, result
+                        in zip(names, industries, answers, results)
+                    ])
+                rows_scored += len(chunk)
+
+            # Every survey is scored: publish the output, then the transaction commits
+            if output_file:
+                output_file.close()
+                os.replace(tmp_output_path, output_path)
+                tmp_output_path = None
+    finally:
+        if output_file:
+            output_file.close()
+        if tmp_output_path is not None and os.path.exists(tmp_output_path):
+            os.remove(tmp_output_path)
+        if repository:
+            repository.close()
+
+    return rows_scored, time.perf_counter() - start_time
+
+
+# --- Command Line Interface ---
+def main(argv=None):
+    """Scores a CSV or JSONL file of surveys without starting the Qt application."""
+    parser = argparse.ArgumentParser(description="Score a file of career surveys in batches.")
+    parser.add_argument('input', help="CSV (q1..q20 columns) or JSONL file of surveys.")
+    parser.add_argument('-o', '--output', help="Write results to this CSV or JSONL file.")
+    parser.add_argument('--to-db', action='store_true', help="Insert results into the survey_responses table.")
+    parser.add_argument('--database', default=DATABASE_NAME, help="SQLite database used with --to-db.")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Surveys scored per batch.")
+    parser.add_argument('--input-format', choices=['csv', 'jsonl'], help="Override input format detection.")
+    parser.add_argument('--output-format', choices=['csv', 'jsonl'], help="Override output format detection.")
+    parser.add_argument('--artifact', default=MODEL_ARTIFACT_PATH, help="Path of the model artifact file.")
+    parser.add_argument('--top-n', type=int, default=DEFAULT_TOP_N, help="Top careers written per survey.")
+    args = parser.parse_args(argv)
+
+    if not args.output and not args.to_db:
+        parser.error("nothing to do: pass --output and/or --to-db")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+    if args.top_n < 1:
+        parser.error("--top-n must be positive")
+
+    try:
+        rows_scored, elapsed = score_file(
+            args.input, args.output, args.database if args.to_db else None, args.chunk_size,
+            args.input_format, args.output_format, args.artifact, args.top_n
+        )
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    rate = rows_scored / elapsed if elapsed > 0 else float('inf')
+    print(f"Scored {rows_scored} surveys in {elapsed:.2f}s ({rate:,.0f} rows/sec).")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+import os
+import sys
+import time
+import argparse
+import statistics
+
+# --- Benchmark Setup ---
+DEFAULT_REPEAT = 20
+# (style, figsize) of the results chart in each GUI script
+CHART_STYLES = {'donut': (7, 4), 'pie': (6, 6)}
+CHART_SIZE = (700, 400)
+
+# A typical top-3 recommendation, plus one that changes every run so nothing is reused between renders
+SAMPLE_TOP_CAREERS = [("Software Engineer", 54.2), ("Data Scientist", 28.7), ("Researcher", 17.1)]
+
+
+def sample_top_careers(run):
+    shift = run % 10
+    return [(career, score + (shift if i == 0 else -shift / 2)) for i, (career, score) in enumerate(SAMPLE_TOP_CAREERS)]
+
+def render_seconds(chart, repeat):
+    """
+    Times showing new data in chart and rendering it to a pixmap, the work done each time
+    the results page is shown.
+
+    Returns:
+        list: seconds per render
+    """
+    chart.resize(*CHART_SIZE)
+    chart.set_top_careers(SAMPLE_TOP_CAREERS)
+    chart.grab() # Warm-up: fonts, first layout
+    times = []
+    for run in range(repeat):
+        start_time = time.perf_counter()
+        chart.set_top_careers(sample_top_careers(run))
+        chart.grab()
+        times.append(time.perf_counter() - start_time)
+    return times
+
+
+# --- Command Line Interface ---
+def main(argv=None):
+    """Prints the median render time of the native and matplotlib results charts for each chart style."""
+    parser = argparse.ArgumentParser(description="Compare render times of the native and matplotlib results charts.")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="Renders per chart; the median is reported.")
+    args = parser.parse_args(argv)
+
+    if not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt6.QtWidgets import QApplication
+    from career_chart import RENDERERS, create_results_chart
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    start_time = time.perf_counter()
+    import matplotlib.pyplot # Imported by the matplotlib renderer when the results page is built
+    from matplotlib.backends import backend_qt5agg
+    print(f"matplotlib import: {(time.perf_counter() - start_time) * 1000:.0f} ms (paid once, by the matplotlib renderer only)")
+
+    for style, figsize in CHART_STYLES.items():
+        medians = {}
+        for renderer in RENDERERS:
+            start_time = time.perf_counter()
+            chart = create_results_chart(renderer, style, figsize)
+            create_ms = (time.perf_counter() - start_time) * 1000
+            times = render_seconds(chart, args.repeat)
+            medians[renderer] = statistics.median(times)
+            print(f"{style:5} {renderer:10}: create {create_ms:6.1f} ms, render {medians[renderer] * 1000:6.2f} ms "
+                  f"(median of {len(times)}, min {min(times) * 1000:.2f} ms)")
+            chart.close()
+        print(f"{style:5} native is {medians['matplotlib'] / medians['native']:.1f}x faster")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
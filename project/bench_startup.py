@@ -0,0 +1,166 @@
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+from database import DATABASE_NAME
+from career_model import MODEL_ARTIFACT_PATH
+
+# --- Benchmark Setup ---
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(PROJECT_DIR)
+SCRIPTS = ('home', 'test', 'testui')
+DEFAULT_REPEAT = 5
+
+# Modules that must not be imported before the first window is painted
+DEFERRED_MODULES = ('pandas', 'sklearn', 'scipy', 'matplotlib')
+
+# Run in a fresh interpreter: builds the window of one script and prints the wall-clock
+# time of its first paint event, then exits
+FIRST_PAINT_SNIPPET = '''
+import sys, time
+from PyQt6.QtCore import QObject, QEvent, QTimer
+from PyQt6.QtWidgets import QApplication
+
+app = QApplication(sys.argv)
+import {script}
+
+class FirstPaintFilter(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and not hasattr(self, 'painted_at'):
+            self.painted_at = time.time()
+            QTimer.singleShot(0, app.quit)
+        return False
+
+first_paint = FirstPaintFilter()
+window = {script}.CareerApp()
+window.installEventFilter(first_paint)
+window.show()
+app.exec()
+print(first_paint.painted_at)
+window.close()
+'''
+
+
+def child_env():
+    """Environment for child interpreters: project modules importable, offscreen Qt when headless."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [PROJECT_DIR, env.get('PYTHONPATH')]))
+    if not env.get('DISPLAY') and not env.get('WAYLAND_DISPLAY'):
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return env
+
+def prepare_sandbox(directory):
+    """
+    Sets directory up as the working directory of the child interpreters, which the apps
+    resolve img/, the database and the model artifact against. img/ links to the repository's
+    images; the database and artifact are copies, so running the benchmark never migrates the
+    checked-in database or writes a model artifact into the repository.
+    """
+    os.symlink(os.path.join(REPO_ROOT, 'img'), os.path.join(directory, 'img'), target_is_directory=True)
+    for name in (DATABASE_NAME, MODEL_ARTIFACT_PATH):
+        if os.path.exists(os.path.join(REPO_ROOT, name)):
+            shutil.copy2(os.path.join(REPO_ROOT, name), os.path.join(directory, name))
+
+def import_times(script, sandbox):
+    """
+    Imports script in a fresh interpreter under -X importtime, with sandbox as working directory.
+
+    Returns:
+        list: (module, self_seconds, cumulative_seconds) for every module imported.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {script}'],
+        cwd=sandbox, env=child_env(), capture_output=True, text=True, check=True
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules.append((name.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6))
+    return modules
+
+def first_paint_seconds(script, sandbox):
+    """
+    Returns the wall-clock seconds from launching a fresh interpreter (working directory
+    sandbox) to the first paint of script's window.
+    """
+    launched_at = time.time()
+    result = subprocess.run(
+        [sys.executable, '-c', FIRST_PAINT_SNIPPET.format(script=script)],
+        cwd=sandbox, env=child_env(), capture_output=True, text=True, check=True
+    )
+    painted_at = float(result.stdout.strip().splitlines()[-1])
+    return painted_at - launched_at
+
+def benchmark_script(script, sandbox, repeat=DEFAULT_REPEAT, top=8):
+    """
+    Measures one script's import cost and time to first paint, running it in sandbox
+    (a directory set up by prepare_sandbox).
+
+    Returns:
+        dict: import_seconds, deferred_imports (heavy modules imported at start-up),
+              heaviest_imports, first_paint_seconds (one per run)
+    """
+    modules = import_times(script, sandbox)
+    script_entry = next((entry for entry in modules if entry[0] == script), (script, 0.0, 0.0))
+    deferred_imports = sorted({name.split('.')[0] for name, _, _ in modules if name.split('.')[0] in DEFERRED_MODULES})
+    top_level = [entry for entry in modules if '.' not in entry[0] and entry[0] != script]
+    heaviest = sorted(top_level, key=lambda entry: entry[2], reverse=True)[:top]
+    return {
+        'import_seconds': script_entry[2],
+        'deferred_imports': deferred_imports,
+        'heaviest_imports': [(name, cumulative) for name, _, cumulative in heaviest],
+        'first_paint_seconds': [first_paint_seconds(script, sandbox) for _ in range(repeat)],
+    }
+
+def run_benchmarks(scripts, sandbox, repeat, max_first_paint=None):
+    """Benchmarks and reports each script; returns True if any failed or exceeded its limits."""
+    failed = False
+    for script in scripts:
+        try:
+            result = benchmark_script(script, sandbox, repeat)
+        except (subprocess.CalledProcessError, ValueError, IndexError) as e:
+            stderr = getattr(e, 'stderr', '') or ''
+            print(f"{script}: benchmark failed: {e}\n{stderr}", file=sys.stderr)
+            failed = True
+            continue
+
+        paint_times = result['first_paint_seconds']
+        median_paint = statistics.median(paint_times)
+        print(f"{script}: import {result['import_seconds']:.3f}s, first paint {median_paint:.3f}s "
+              f"(median of {len(paint_times)}, min {min(paint_times):.3f}s)")
+        print("  heaviest imports: " + ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in result['heaviest_imports']))
+        if result['deferred_imports']:
+            print(f"  FAIL: imported at start-up: {', '.join(result['deferred_imports'])}")
+            failed = True
+        if max_first_paint is not None and median_paint > max_first_paint:
+            print(f"  FAIL: first paint {median_paint:.3f}s exceeds {max_first_paint:.3f}s")
+            failed = True
+    return failed
+
+
+# --- Command Line Interface ---
+def main(argv=None):
+    """Prints start-up timings for each GUI script and fails if a deferred module is imported eagerly."""
+    parser = argparse.ArgumentParser(description="Measure import time and time to first paint of the GUI scripts.")
+    parser.add_argument('scripts', nargs='*', help=f"Scripts to measure: {', '.join(SCRIPTS)} (default: all).")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="First-paint runs per script; the median is reported.")
+    parser.add_argument('--max-first-paint', type=float, help="Fail if a script's median time to first paint exceeds this many seconds.")
+    args = parser.parse_args(argv)
+    unknown = [script for script in args.scripts if script not in SCRIPTS]
+    if unknown:
+        parser.error(f"unknown script: {', '.join(unknown)}")
+
+    with tempfile.TemporaryDirectory(prefix='career_startup-') as sandbox:
+        prepare_sandbox(sandbox)
+        return 1 if run_benchmarks(args.scripts or SCRIPTS, sandbox, args.repeat, args.max_first_paint) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,378 @@
+import io
+import os
+import sys
+import json
+import time
+import random
+import sqlite3
+import argparse
+import platform
+import tempfile
+import contextlib
+import statistics
+
+import numpy as np
+
+from database import SurveyRepository, INSERT_ANSWER_SQL, NUM_QUESTIONS
+from job_details import CATALOG
+from tree_engine import TreeModel, TREE_LEAF
+from career_model import (
+    FEATURE_NAMES, QUESTION_KEYS, TRAINING_PARAMS, RecommendationCache, top_k_indices,
+    generate_dummy_data, train_career_model, load_career_model,
+    get_ml_career_recommendation, get_ml_career_recommendations_batch
+)
+
+# --- Benchmark Setup ---
+RESULTS_FORMAT_VERSION = 1
+DEFAULT_OUTPUT = 'bench_results.json'
+DEFAULT_REPEAT = 5
+# compare flags a benchmark whose median is this much slower than the baseline's
+DEFAULT_TOLERANCE = 0.25
+
+DATA_SIZES = (1_000, 10_000, 100_000)
+TRAIN_SIZES = (200, 10_000, 100_000)
+BATCH_SIZES = (1, 100, 10_000)
+CAREER_COUNTS = (15, 100, 1_000, 10_000, 100_000) # Catalog sizes for the ranking benchmarks
+DB_SIZES = (1_000, 100_000, 1_000_000)
+HISTORY_PAGE_SIZE = 100 # Rows per page in the home.py history table
+UI_DB_SIZE = 100_000 # Submissions in the database the GUI benchmarks run against
+
+# Seeded databases are kept between runs; bump when the seeded data changes
+SEED_FORMAT_VERSION = 1
+DEFAULT_DB_DIR = os.path.join(tempfile.gettempdir(), 'career_bench')
+# The scoring and GUI benchmarks use their own model artifact in the benchmark directory, trained
+# with the default classifier parameters, so they never retrain or read the app's career_model.pkl
+BENCH_ARTIFACT_NAME = 'bench-career_model.pkl'
+SEED_BATCH_SIZE = 10_000
+SEED_START_EPOCH = 1_700_000_000
+
+SEED_SUBMISSION_SQL = (
+    "INSERT INTO survey_responses (student_name, preferred_industry, recommended_career, recommendation_score, timestamp) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+SAMPLE_TOP_CAREERS = [("Software Engineer", 54.2), ("Data Scientist", 28.7), ("Researcher", 17.1)]
+
+
+def measure(function, repeat=DEFAULT_REPEAT):
+    """
+    Calls function() repeat times (after one untimed warm-up call).
+
+    Returns:
+        dict: median_s, min_s and runs (seconds per call)
+    """
+    function()
+    runs = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        runs.append(time.perf_counter() - start_time)
+    return {'median_s': statistics.median(runs), 'min_s': min(runs), 'runs': runs}
+
+def quietly(function):
+    """Wraps function so the progress it prints does not repeat on every timed call."""
+    def call():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return function()
+    return call
+
+def bench_artifact(db_dir=DEFAULT_DB_DIR):
+    """Returns the path of the benchmarks' model artifact, training it on first use (or when stale)."""
+    os.makedirs(db_dir, exist_ok=True)
+    path = os.path.join(db_dir, BENCH_ARTIFACT_NAME)
+    with contextlib.redirect_stdout(sys.stderr):
+        load_career_model(path)
+    return path
+
+def random_surveys(rng, count):
+    """Returns count {q_key: value} surveys with uniformly random 1-7 answers."""
+    answers = rng.integers(1, 8, size=(count, len(QUESTION_KEYS)))
+    return [dict(zip(QUESTION_KEYS, row.tolist())) for row in answers]
+
+
+# --- Model and Scoring ---
+def bench_model(repeat):
+    results = {}
+    for size in DATA_SIZES:
+        results[f'model.generate_dummy_data[{size}]'] = measure(lambda: generate_dummy_data(size, random_state=0), repeat)
+    for size in TRAIN_SIZES:
+        params = dict(TRAINING_PARAMS, num_samples=size)
+        results[f'model.train_career_model[{size}]'] = measure(quietly(lambda: train_career_model(params)), repeat)
+    return results
+
+def bench_scoring(repeat, db_dir=DEFAULT_DB_DIR):
+    artifact_path = bench_artifact(db_dir)
+    rng = np.random.default_rng(0)
+    industries = CATALOG.industries
+    survey = random_surveys(rng, 1)[0]
+    batches = {size: random_surveys(rng, size) for size in BATCH_SIZES}
+    results = {}
+
+    # The NumPy tree the apps score with, and the scikit-learn pipeline it was exported from
+    for engine_name, use_engine in (('scoring', True), ('scoring.sklearn', False)):
+        ml_model, feature_names, career_outcomes = quietly(lambda: load_career_model(artifact_path, use_engine=use_engine))()
+        results[f'{engine_name}.single'] = measure(
+            lambda: get_ml_career_recommendation(ml_model, feature_names, career_outcomes, survey, industries[0]), repeat
+        )
+        for size, surveys in batches.items():
+            preferred = [industries[i % len(industries)] for i in range(size)]
+            results[f'{engine_name}.batch[{size}]'] = measure(
+                lambda: get_ml_career_recommendations_batch(ml_model, feature_names, career_outcomes, surveys, preferred), repeat
+            )
+
+    # A repeated answer pattern, as served to the GUI from its recommendation cache
+    ml_model, feature_names, career_outcomes = quietly(lambda: load_career_model(artifact_path))()
+    cache = RecommendationCache()
+    results['scoring.cached_single'] = measure(
+        lambda: cache.recommend(ml_model, feature_names, career_outcomes, survey, industries[0]), repeat
+    )
+    return results
+
+def synthetic_tree_model(num_careers, rng):
+    """A one-leaf TreeModel over num_careers careers with random probabilities, standing in for a large catalog."""
+    num_features = len(FEATURE_NAMES)
+    return TreeModel(
+        [f"Career {i}" for i in range(num_careers)], np.zeros(num_features), np.ones(num_features),
+        [TREE_LEAF], [TREE_LEAF], [0], [0.0], rng.dirichlet(np.ones(num_careers), size=1)
+    )
+
+def bench_ranking(repeat):
+    """Per-request cost as the number of careers grows: the whole recommendation, and top-k against a full sort."""
+    rng = np.random.default_rng(0)
+    survey = random_surveys(rng, 1)[0]
+    results = {}
+    for num_careers in CAREER_COUNTS:
+        ml_model = synthetic_tree_model(num_careers, rng)
+        career_outcomes = ml_model.classes_.tolist() # Built once when a model is loaded, not per request
+        results[f'ranking.recommendation[{num_careers}]'] = measure(
+            lambda: get_ml_career_recommendation(ml_model, FEATURE_NAMES, career_outcomes, survey, "IT"), repeat
+        )
+        scores = ml_model.value * 100
+        results[f'ranking.top_k[{num_careers}]'] = measure(lambda: top_k_indices(scores, 3), repeat)
+        results[f'ranking.full_sort[{num_careers}]'] = measure(lambda: np.argsort(-scores, axis=1, kind='stable')[:, :3], repeat)
+    return results
+
+
+# --- Database ---
+def seeded_database(num_rows, db_dir=DEFAULT_DB_DIR):
+    """
+    Returns the path of a database holding num_rows random submissions with their answers,
+    creating it on first use. Seeded databases are reused by later runs.
+    """
+    os.makedirs(db_dir, exist_ok=True)
+    path = os.path.join(db_dir, f'seed-v{SEED_FORMAT_VERSION}-{num_rows}.db')
+    if os.path.exists(path):
+        return path
+
+    print(f"Seeding {num_rows} submissions into {path}...", file=sys.stderr)
+    tmp_path = path + '.tmp'
+    for stale in (tmp_path, tmp_path + '-wal', tmp_path + '-shm'):
+        if os.path.exists(stale):
+            os.remove(stale)
+    repository = SurveyRepository(tmp_path)
+    rng = random.Random(num_rows)
+    careers = CATALOG.names
+    industries = CATALOG.industries
+    try:
+        with repository.conn:
+            for first_id in range(1, num_rows + 1, SEED_BATCH_SIZE):
+                ids = range(first_id, min(first_id + SEED_BATCH_SIZE, num_rows + 1))
+                repository.conn.executemany(SEED_SUBMISSION_SQL, (
+                    (f"Student {i}", rng.choice(industries), rng.choice(careers), rng.uniform(20, 100), SEED_START_EPOCH + i * 60)
+                    for i in ids
+                ))
+                repository.conn.executemany(INSERT_ANSWER_SQL, (
+                    (i, question, rng.randint(1, 7)) for i in ids for question in range(1, NUM_QUESTIONS + 1)
+                ))
+        repository.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        repository.close()
+    os.replace(tmp_path, path)
+    return path
+
+def bench_database(repeat, db_dir=DEFAULT_DB_DIR):
+    rng = np.random.default_rng(0)
+    results = {}
+    for size in DB_SIZES:
+        repository = SurveyRepository(seeded_database(size, db_dir))
+        try:
+            surveys = iter(random_surveys(rng, repeat + 1))
+            results[f'db.insert_submission[{size}]'] = measure(
+                lambda: repository.insert_submission("Benchmark", next(surveys), "IT", "Software Engineer", 75.0), repeat
+            )
+            results[f'db.latest_recommendation[{size}]'] = measure(repository.latest_recommendation, repeat)
+            results[f'db.history_first_page[{size}]'] = measure(lambda: repository.history_page(limit=HISTORY_PAGE_SIZE), repeat)
+
+            # A page from the middle of the history, as reached by scrolling down
+            middle = repository.conn.execute(
+                "SELECT timestamp, id FROM survey_responses ORDER BY timestamp DESC, id DESC LIMIT 1 OFFSET ?", (size // 2,)
+            ).fetchone()
+            results[f'db.history_middle_page[{size}]'] = measure(
+                lambda: repository.history_page(after=tuple(middle), limit=HISTORY_PAGE_SIZE), repeat
+            )
+        finally:
+            repository.close()
+    return results
+
+
+# --- GUI (offscreen) ---
+def bench_ui(repeat, db_dir=DEFAULT_DB_DIR):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)
+    import home
+
+    window = home.CareerApp(seeded_database(UI_DB_SIZE, db_dir), bench_artifact(db_dir))
+    window.show()
+    app.processEvents()
+    careers = CATALOG.names
+    calls = {'count': 0}
+
+    def next_career():
+        calls['count'] += 1
+        return careers[calls['count'] % len(careers)]
+
+    def show_history_page():
+        window.show_history_page()
+        app.processEvents()
+
+    def display_job_details():
+        window.display_job_details(next_career()) # A different career each call; the same one returns early
+        app.processEvents()
+
+    def show_results_page():
+        window.show_results_page("Benchmark", next_career(), 54.2, SAMPLE_TOP_CAREERS)
+        app.processEvents()
+
+    results = {}
+    try:
+        results['ui.show_history_page'] = measure(show_history_page, repeat)
+        results['ui.display_job_details'] = measure(display_job_details, repeat)
+        results['ui.show_results_page'] = measure(show_results_page, repeat)
+    finally:
+        window.close()
+        app.processEvents()
+    return results
+
+
+GROUPS = {
+    'model': bench_model,
+    'scoring': bench_scoring,
+    'ranking': bench_ranking,
+    'database': bench_database,
+    'ui': bench_ui,
+}
+
+
+def environment_info():
+    """Describes the machine and library versions the results were measured with."""
+    import sklearn
+    from PyQt6.QtCore import PYQT_VERSION_STR
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'sklearn': sklearn.__version__,
+        'sqlite': sqlite3.sqlite_version,
+        'pyqt': PYQT_VERSION_STR,
+    }
+
+def run_benchmarks(groups, repeat=DEFAULT_REPEAT, db_dir=DEFAULT_DB_DIR):
+    """Runs the named benchmark groups and returns the results document written to JSON."""
+    benchmarks = {}
+    for group in groups:
+        print(f"Running {group} benchmarks...", file=sys.stderr)
+        if group in ('scoring', 'database', 'ui'):
+            benchmarks.update(GROUPS[group](repeat, db_dir))
+        else:
+            benchmarks.update(GROUPS[group](repeat))
+    return {
+        'format_version': RESULTS_FORMAT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'repeat': repeat,
+        'environment': environment_info(),
+        'benchmarks': benchmarks,
+    }
+
+def write_results(results, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+
+def read_results(path):
+    with open(path, encoding='utf-8') as f:
+        results = json.load(f)
+    if results.get('format_version') != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported benchmark results format {results.get('format_version')}")
+    return results
+
+def compare_results(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compares the median of every benchmark present in both result documents.
+
+    Returns:
+        list: (name, baseline_median_s, median_s, ratio, regressed) sorted by name
+    """
+    rows = []
+    for name in sorted(results['benchmarks'].keys() & baseline['benchmarks'].keys()):
+        before = baseline['benchmarks'][name]['median_s']
+        after = results['benchmarks'][name]['median_s']
+        ratio = after / before if before > 0 else float('inf')
+        rows.append((name, before, after, ratio, ratio > 1 + tolerance))
+    return rows
+
+def print_results(results):
+    for name, timing in results['benchmarks'].items():
+        print(f"{name:42} {timing['median_s'] * 1000:10.3f} ms  (min {timing['min_s'] * 1000:.3f} ms)")
+
+def print_comparison(rows, tolerance):
+    """Prints a comparison table; returns True if any benchmark regressed beyond tolerance."""
+    print(f"{'benchmark':42} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, before, after, ratio, regressed in rows:
+        flag = '  REGRESSED' if regressed else ''
+        print(f"{name:42} {before * 1000:9.3f} ms {after * 1000:9.3f} ms {(ratio - 1) * 100:+7.1f}%{flag}")
+    regressions = [row for row in rows if row[4]]
+    print(f"{len(regressions)} of {len(rows)} benchmarks more than {tolerance:.0%} slower than the baseline.")
+    return bool(regressions)
+
+
+# --- Command Line Interface ---
+def main(argv=None):
+    """Runs the benchmark suite or compares two result files."""
+    parser = argparse.ArgumentParser(description="Benchmark the model, scoring, database and GUI hot paths.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="Run benchmarks and write the results as JSON.")
+    run_parser.add_argument('groups', nargs='*', help=f"Groups to run: {', '.join(GROUPS)} (default: all).")
+    run_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="Timed calls per benchmark; the median is reported.")
+    run_parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Where to write the results JSON.")
+    run_parser.add_argument('--db-dir', default=DEFAULT_DB_DIR, help="Directory of the seeded benchmark databases and model artifact.")
+    run_parser.add_argument('--baseline', help="Results JSON to compare against; exits with 1 on a regression.")
+    run_parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help="Allowed slowdown before a benchmark counts as regressed.")
+
+    compare_parser = subparsers.add_parser('compare', help="Compare a results JSON against a baseline results JSON.")
+    compare_parser.add_argument('results')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help="Allowed slowdown before a benchmark counts as regressed.")
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        unknown = [group for group in args.groups if group not in GROUPS]
+        if unknown:
+            parser.error(f"unknown group: {', '.join(unknown)}")
+        results = run_benchmarks(args.groups or list(GROUPS), args.repeat, args.db_dir)
+        write_results(results, args.output)
+        print_results(results)
+        print(f"Results written to {args.output}.")
+        if args.baseline:
+            return 1 if print_comparison(compare_results(results, read_results(args.baseline), args.tolerance), args.tolerance) else 0
+        return 0
+
+    results, baseline = read_results(args.results), read_results(args.baseline)
+    return 1 if print_comparison(compare_results(results, baseline, args.tolerance), args.tolerance) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
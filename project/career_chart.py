@@ -0,0 +1,219 @@
+import math
+
+from PyQt6.QtCore import Qt, QPointF, QRectF, QSize
+from PyQt6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+
+# --- Chart Setup ---
+# 'native' paints the chart with QPainter; 'matplotlib' keeps the original matplotlib charts
+RENDERERS = ('native', 'matplotlib')
+
+NO_DATA_TEXT = "មិនមានទិន្នន័យគ្រប់គ្រាន់សម្រាប់បង្ហាញក្រាហ្វិកទេ។"
+TOP_CAREERS_TITLE = "ការណែនាំអាជីពកំពូលទាំង ៣"
+
+# matplotlib's 'Paired' colormap, so both renderers colour the donut the same way
+PAIRED_COLORS = [
+    '#a6cee3', '#1f78b4', '#b2df8a', '#33a02c', '#fb9a99', '#e31a1c',
+    '#fdbf6f', '#ff7f00', '#cab2d6', '#6a3d9a', '#ffff99', '#b15928'
+]
+
+# Chart styles used by the GUI scripts: home.py shows a donut with a legend,
+# test.py/testui.py an exploded pie with a title
+STYLES = {
+    'donut': {
+        'colors': None, # Spread over PAIRED_COLORS
+        'start_angle': 90,
+        'hole_ratio': 0.6,
+        'explode_first': False,
+        'percent_color': '#ffffff',
+        'title': None,
+        'legend_title': "Careers",
+    },
+    'pie': {
+        'colors': ['#4CAF50', '#FFC107', '#2196F3'], # Green, Yellow, Blue for top 3
+        'start_angle': 140,
+        'hole_ratio': 0.0,
+        'explode_first': True,
+        'percent_color': '#000000',
+        'title': TOP_CAREERS_TITLE,
+        'legend_title': None,
+    },
+}
+
+
+def paired_colors(count):
+    """Returns count colours sampled evenly across PAIRED_COLORS, as matplotlib's colormap does."""
+    if count <= 1:
+        return PAIRED_COLORS[:count]
+    return [PAIRED_COLORS[min(int(i / (count - 1) * len(PAIRED_COLORS)), len(PAIRED_COLORS) - 1)] for i in range(count)]
+
+def chart_slices(top_careers):
+    """Returns (labels, sizes) of the chartable top careers; sizes are clamped at zero."""
+    labels = [f"{career} ({score:.1f}%)" for career, score in top_careers]
+    sizes = [max(0, score) for career, score in top_careers]
+    return labels, sizes
+
+
+class CareerPieChart(QWidget):
+    """
+    Pie or donut chart of the top recommended careers, painted directly with QPainter.
+    Updating the data only schedules a repaint of this widget; no figure is laid out or rasterized.
+    """
+
+    def __init__(self, style='donut', parent=None):
+        super().__init__(parent)
+        self.style = STYLES[style]
+        self.labels, self.sizes = [], []
+        self.setMinimumSize(QSize(400, 300))
+
+    def set_top_careers(self, top_careers):
+        """Shows (career, score) pairs, largest first."""
+        self.labels, self.sizes = chart_slices(top_careers)
+        self.update()
+
+    def colors(self):
+        return [QColor(color) for color in (self.style['colors'] or paired_colors(len(self.sizes)))]
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        area = QRectF(self.rect()).adjusted(10, 10, -10, -10)
+
+        if self.style['title']:
+            painter.setFont(QFont("Khmer OS Muol Light", 14))
+            painter.setPen(QColor('#333333'))
+            title_height = painter.fontMetrics().height() + 10
+            painter.drawText(QRectF(area.left(), area.top(), area.width(), title_height), Qt.AlignmentFlag.AlignCenter, self.style['title'])
+            area.setTop(area.top() + title_height)
+
+        total = sum(self.sizes)
+        if total <= 0:
+            painter.setFont(QFont("Khmer OS Siemreap", 12))
+            painter.setPen(QColor('gray'))
+            painter.drawText(area, Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, NO_DATA_TEXT)
+            return
+
+        # Pie on the left, legend on the right
+        legend_width = min(area.width() * 0.45, 260)
+        diameter = min(area.width() - legend_width, area.height()) * 0.9
+        center = QPointF(area.left() + (area.width() - legend_width) / 2, area.center().y())
+        radius = diameter / 2
+        hole = radius * self.style['hole_ratio']
+        colors = self.colors()
+
+        painter.setFont(QFont("Khmer OS Siemreap", 10, QFont.Weight.Bold))
+        angle = self.style['start_angle']
+        for i, size in enumerate(self.sizes):
+            span = size / total * 360
+            mid = math.radians(angle + span / 2)
+            slice_center = QPointF(center)
+            if self.style['explode_first'] and i == 0:
+                slice_center += QPointF(math.cos(mid), -math.sin(mid)) * (radius * 0.1)
+
+            outer = QRectF(slice_center.x() - radius, slice_center.y() - radius, diameter, diameter)
+            path = QPainterPath()
+            if hole > 0:
+                inner = QRectF(slice_center.x() - hole, slice_center.y() - hole, hole * 2, hole * 2)
+                path.arcMoveTo(outer, angle)
+                path.arcTo(outer, angle, span)
+                path.arcTo(inner, angle + span, -span)
+            else:
+                path.moveTo(slice_center)
+                path.arcTo(outer, angle, span)
+            path.closeSubpath()
+            painter.setPen(QPen(QColor('white'), 2))
+            painter.setBrush(colors[i % len(colors)])
+            painter.drawPath(path)
+
+            if size > 0:
+                text_radius = (radius + hole) / 2 if hole > 0 else radius * 0.6
+                text_center = slice_center + QPointF(math.cos(mid), -math.sin(mid)) * text_radius
+                painter.setPen(QColor(self.style['percent_color']))
+                painter.drawText(QRectF(text_center.x() - 30, text_center.y() - 10, 60, 20),
+                                 Qt.AlignmentFlag.AlignCenter, f"{size / total * 100:.1f}%")
+            angle += span
+
+        # Legend
+        painter.setFont(QFont("Khmer OS Siemreap", 10))
+        line_height = painter.fontMetrics().height() + 6
+        rows = len(self.labels) + (1 if self.style['legend_title'] else 0)
+        x = area.right() - legend_width + 10
+        y = center.y() - rows * line_height / 2
+        painter.setPen(QColor('#333333'))
+        if self.style['legend_title']:
+            painter.drawText(QRectF(x, y, legend_width - 10, line_height), Qt.AlignmentFlag.AlignVCenter, self.style['legend_title'])
+            y += line_height
+        for i, label in enumerate(self.labels):
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(colors[i % len(colors)])
+            painter.drawRect(QRectF(x, y + (line_height - 12) / 2, 12, 12))
+            painter.setPen(QColor('#333333'))
+            painter.drawText(QRectF(x + 18, y, legend_width - 28, line_height),
+                             Qt.AlignmentFlag.AlignVCenter | Qt.TextFlag.TextSingleLine, label)
+            y += line_height
+
+
+class MatplotlibPieChart(QWidget):
+    """The original matplotlib chart of the top recommended careers. Imports matplotlib when created."""
+
+    def __init__(self, style='donut', figsize=(7, 4), parent=None):
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+
+        super().__init__(parent)
+        self.style = style
+        self.fig, self.ax = plt.subplots(figsize=figsize)
+        self.canvas = FigureCanvas(self.fig)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.canvas)
+
+    def set_top_careers(self, top_careers):
+        """Shows (career, score) pairs, largest first, and redraws the figure."""
+        self.ax.clear()
+        labels, sizes = chart_slices(top_careers)
+        if self.style == 'donut':
+            self.draw_donut(labels, sizes)
+            self.fig.tight_layout()
+        else:
+            self.draw_pie(labels, sizes)
+        self.canvas.draw()
+
+    def draw_donut(self, labels, sizes):
+        if sum(sizes) == 0:
+            self.ax.text(0.5, 0.5, NO_DATA_TEXT,
+                         horizontalalignment='center', verticalalignment='center',
+                         transform=self.ax.transAxes, fontsize=12, color='gray')
+            self.ax.set_xticks([])
+            self.ax.set_yticks([])
+            return
+
+        wedges, texts, autotexts = self.ax.pie(sizes, autopct='%1.1f%%', startangle=90, colors=paired_colors(len(sizes)),
+                                               pctdistance=0.85,
+                                               wedgeprops=dict(width=0.4, edgecolor='w'))
+        for autotext in autotexts:
+            autotext.set_color('white')
+            autotext.set_fontsize(10)
+            autotext.set_fontweight('bold')
+
+        self.ax.legend(wedges, labels,
+                       title="Careers",
+                       loc="center left",
+                       bbox_to_anchor=(1, 0, 0.5, 1))
+        self.ax.axis('equal')
+
+    def draw_pie(self, labels, sizes):
+        colors = STYLES['pie']['colors']
+        explode = [0.1 if i == 0 else 0 for i in range(len(sizes))] # Explode the largest slice
+        self.ax.pie(sizes, explode=explode, labels=labels, colors=colors,
+                    autopct=lambda p: '{:.1f}%'.format(p) if p > 0 else '', # Only show percentage if > 0
+                    shadow=True, startangle=140, textprops={'fontsize': 10, 'color': 'black', 'fontname': 'Khmer OS Siemreap'})
+        self.ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
+        self.ax.set_title(TOP_CAREERS_TITLE, fontsize=14, fontname='Khmer OS Muol Light')
+
+
+def create_results_chart(renderer='native', style='donut', figsize=(7, 4)):
+    """Returns a chart widget with a set_top_careers(top_careers) method, drawn by the given renderer."""
+    if renderer == 'matplotlib':
+        return MatplotlibPieChart(style, figsize)
+    return CareerPieChart(style)
@@ -0,0 +1,728 @@
+import os
+import sys
+import json
+import pickle
+import math
+import hashlib
+import argparse
+import tempfile
+import weakref
+from collections import OrderedDict
+import importlib.metadata
+import numpy as np
+
+# pandas and scikit-learn are slow to import, so they are imported inside the functions
+# that train the model; loading the artifact and recommendations only need NumPy.
+
+from job_details import CATALOG, JOB_DETAILS
+from tree_engine import TreeModel, export_pipeline
+
+# --- Model Artifact Setup ---
+MODEL_ARTIFACT_PATH = 'career_model.pkl'
+ARTIFACT_FORMAT_VERSION = 4
+
+# Aggregated features (0-10 scale) the model is trained on
+FEATURE_NAMES = [
+    'math_interest', 'science_interest', 'coding_interest', 'design_interest',
+    'problem_solving_skill', 'communication_skill', 'creativity_skill', 'leadership_skill'
+]
+
+# Parameters passed to generate_dummy_data(); part of the artifact fingerprint
+TRAINING_PARAMS = {'num_samples': 200, 'random_state': 42}
+
+# Default DecisionTreeClassifier parameters. Parameters published by train_search.py are kept in
+# the artifact's params file (see classifier_params_path) and take their place in every retrain.
+CLASSIFIER_PARAMS = {'random_state': 42}
+
+
+# --- Dummy Data Generation for ML Model Training ---
+# Rules that assign a career from the aggregated features (mimicking real patterns).
+# Each rule is ((feature, threshold), (feature, threshold), careers): a sample whose
+# two features both exceed their thresholds gets one of the careers, picked uniformly.
+# The first matching rule wins; samples matching no rule get a random career.
+# This mapping needs to be expanded to cover all new careers.
+CAREER_RULES = [
+    (('coding_interest', 7), ('problem_solving_skill', 6), ["Software Engineer", "Data Scientist"]),
+    (('math_interest', 7), ('science_interest', 6), ["Data Scientist", "Researcher"]),
+    (('design_interest', 7), ('creativity_skill', 6), ["UX/UI Designer"]),
+    (('leadership_skill', 7), ('communication_skill', 6), ["Project Manager", "Human Resource (HR)"]),
+    (('science_interest', 7), ('problem_solving_skill', 6), ["Doctor", "Researcher"]),
+    (('communication_skill', 7), ('creativity_skill', 6), ["Artist", "Digital Marketer"]),
+    (('math_interest', 7), ('problem_solving_skill', 6), ["Accountant", "Civil Site Engineer", "Architecture"]),
+    (('leadership_skill', 7), ('problem_solving_skill', 6), ["Fire Fighter", "Lawyer"]),
+]
+
+# Bumped whenever the sampling logic changes, so stale model artifacts are detected
+DATA_GENERATOR_VERSION = 2
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+def _generate_chunk(rng, num_samples, career_outcomes):
+    """
+    Draws one block of samples with rng.
+    Returns the (num_samples, n_features) feature matrix and the career index of each row.
+    """
+    feature_index = {name: i for i, name in enumerate(FEATURE_NAMES)}
+    X = rng.uniform(1, 10, size=(num_samples, len(FEATURE_NAMES)))
+
+    # Default random pick, overridden below by the first matching rule
+    labels = rng.integers(0, len(career_outcomes), size=num_samples)
+    # One uniform draw per row picks among a rule's careers; only one rule applies per row
+    choice_draw = rng.random(num_samples)
+    unassigned = np.ones(num_samples, dtype=bool)
+
+    career_index = {career: i for i, career in enumerate(career_outcomes)}
+    for (feature_a, threshold_a), (feature_b, threshold_b), careers in CAREER_RULES:
+        mask = unassigned & (X[:, feature_index[feature_a]] > threshold_a) & (X[:, feature_index[feature_b]] > threshold_b)
+        choices = np.array([career_index[career] for career in careers])
+        picks = (choice_draw[mask] * len(choices)).astype(np.intp)
+        labels[mask] = choices[picks]
+        unassigned &= ~mask
+
+    return X, labels
+
+def _iter_chunks(num_samples, chunk_size, random_state):
+    """Generator behind iter_dummy_data_chunks, which validates the arguments first."""
+    career_outcomes = list(JOB_DETAILS.keys())
+    career_names = np.array(career_outcomes, dtype=object)
+
+    num_chunks = -(-num_samples // chunk_size)
+    chunk_seeds = np.random.SeedSequence(random_state).spawn(num_chunks)
+    for chunk_number, seed in enumerate(chunk_seeds):
+        rows = min(chunk_size, num_samples - chunk_number * chunk_size)
+        X, labels = _generate_chunk(np.random.default_rng(seed), rows, career_outcomes)
+        yield X, career_names[labels]
+
+def iter_dummy_data_chunks(num_samples=200, chunk_size=DEFAULT_CHUNK_SIZE, random_state=None):
+    """
+    Yields the synthetic dataset in blocks of at most chunk_size rows, for training
+    on datasets that do not fit in memory.
+
+    Every chunk has its own random stream derived from random_state, so the output
+    for a given (num_samples, chunk_size, random_state) is always the same.
+    Raises ValueError right away if num_samples is negative or chunk_size is not positive.
+
+    Yields:
+        tuple: (X, y) where X is a float array of shape (rows, len(FEATURE_NAMES))
+        and y is an object array of career names.
+    """
+    if num_samples < 0:
+        raise ValueError(f"num_samples must not be negative, not {num_samples}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, not {chunk_size}")
+    return _iter_chunks(num_samples, chunk_size, random_state)
+
+def generate_dummy_data(num_samples=200, random_state=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Generates a synthetic dataset for training the ML model.
+    Maps aggregated survey responses to career outcomes.
+    """
+    # Define the aggregated features (0-10 scale)
+    feature_names = list(FEATURE_NAMES)
+
+    # Define possible career outcomes - using all keys from JOB_DETAILS
+    career_outcomes = list(JOB_DETAILS.keys())
+
+    chunks = list(iter_dummy_data_chunks(num_samples, chunk_size, random_state))
+    if chunks:
+        data = np.concatenate([X for X, _ in chunks])
+        labels = np.concatenate([y for _, y in chunks])
+    else:
+        data = np.empty((0, len(feature_names)))
+        labels = np.empty(0, dtype=object)
+
+    import pandas as pd
+
+    X = pd.DataFrame(data, columns=feature_names)
+    y = pd.Series(labels)
+
+    return X, y, feature_names, career_outcomes
+
+# --- Machine Learning Model Training ---
+def train_career_model(training_params=TRAINING_PARAMS, classifier_params=CLASSIFIER_PARAMS):
+    """
+    Trains a Decision Tree Classifier model for career recommendation.
+    training_params are passed to generate_dummy_data() and classifier_params to
+    DecisionTreeClassifier; the saved artifact is always trained with TRAINING_PARAMS.
+    """
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.tree import DecisionTreeClassifier
+
+    X, y, feature_names, career_outcomes = generate_dummy_data(**training_params)
+
+    # Create a pipeline with scaling and a classifier
+    model_pipeline = Pipeline([
+        ('scaler', StandardScaler()),
+        ('classifier', DecisionTreeClassifier(**classifier_params))
+    ])
+
+    # Fit on plain arrays so recommendations can pass NumPy input straight to the model
+    model_pipeline.fit(X.to_numpy(), y.to_numpy())
+    print("Machine Learning model trained successfully.")
+    return model_pipeline, feature_names, career_outcomes
+
+# --- ML-based Recommendation Logic ---
+# Survey question keys, in column order for batch input
+QUESTION_KEYS = [f'q{i}' for i in range(1, 21)]
+
+# Mapping survey questions to aggregated features
+QUESTION_TO_FEATURE = {
+    'q1': 'math_interest', 'q2': 'math_interest',
+    'q3': 'science_interest', 'q4': 'science_interest',
+    'q5': 'coding_interest', 'q6': 'coding_interest', 'q7': 'coding_interest',
+    'q8': 'design_interest', 'q9': 'design_interest',
+    'q10': 'problem_solving_skill', 'q11': 'problem_solving_skill', 'q12': 'problem_solving_skill',
+    'q13': 'communication_skill', 'q14': 'communication_skill', 'q15': 'communication_skill',
+    'q16': 'creativity_skill', 'q17': 'creativity_skill',
+    'q18': 'leadership_skill', 'q19': 'leadership_skill', 'q20': 'leadership_skill',
+}
+
+# Preferred industry boost (post-prediction)
+INDUSTRY_BOOST_FACTOR = 1.2
+CAREER_INDUSTRY_MAPPING = CATALOG.industry_mapping # Each career's industries, from careers.json
+INDUSTRIES = CATALOG.industries # Industries a student can prefer; also listed in the survey form
+INDUSTRY_INDEX = {industry: i for i, industry in enumerate(INDUSTRIES)}
+# Careers returned for display by default
+DEFAULT_TOP_N = 3
+# Up to this many careers one full sort is cheaper than partitioning's fixed per-call cost
+FULL_SORT_MAX_CAREERS = 1024
+
+# A preference may name several industries with weights: "IT:2, Design:1"
+INDUSTRY_SEPARATOR = ','
+INDUSTRY_WEIGHT_SEPARATOR = ':'
+
+# Weights of each question in each feature it contributes to. Every question currently
+# counts once towards a single feature, but a question may list several features.
+QUESTION_FEATURE_WEIGHTS = {q_key: {feature: 1.0} for q_key, feature in QUESTION_TO_FEATURE.items()}
+
+def map_scale(value):
+    return (value - 1) * (10 / 6) # Map 1-7 scale to 0-10
+
+def build_question_weight_matrix(feature_names=FEATURE_NAMES, question_weights=QUESTION_FEATURE_WEIGHTS):
+    """
+    Compiles the question-to-feature mapping into a (20, len(feature_names)) weight
+    matrix whose columns each sum to 1, so answers @ matrix is the weighted average
+    of each feature's questions. Features without questions get an all-zero column.
+    """
+    feature_column = {feature: j for j, feature in enumerate(feature_names)}
+    weights = np.zeros((len(QUESTION_KEYS), len(feature_names)))
+    for i, q_key in enumerate(QUESTION_KEYS):
+        for feature, weight in question_weights.get(q_key, {}).items():
+            if feature in feature_column:
+                weights[i, feature_column[feature]] += weight
+    totals = weights.sum(axis=0)
+    return weights / np.where(totals > 0, totals, 1.0)
+
+# Column of each question in (N, 20) answer arrays
+QUESTION_COLUMNS = {q_key: i for i, q_key in enumerate(QUESTION_KEYS)}
+
+# Precompiled once at import; see aggregate_survey_features()
+QUESTION_WEIGHT_MATRIX = build_question_weight_matrix()
+
+def surveys_to_array(surveys):
+    """
+    Converts an iterable of raw_survey_responses dicts into an (N, 20) float array
+    with one column per QUESTION_KEYS entry. Unanswered questions are NaN.
+    """
+    rows = []
+    for raw_survey_responses in surveys:
+        row = [np.nan] * len(QUESTION_KEYS)
+        for q_key, response_value in raw_survey_responses.items():
+            column = QUESTION_COLUMNS.get(q_key)
+            if column is not None:
+                row[column] = response_value
+        rows.append(row)
+    return np.array(rows, dtype=float).reshape(len(rows), len(QUESTION_KEYS))
+
+def aggregate_survey_features(answers, weight_matrix=QUESTION_WEIGHT_MATRIX):
+    """
+    Aggregates an (N, 20) array of 1-7 answers into an (N, n_features) array of
+    interest/skill scores on the 0-10 scale with a single matrix product.
+    Unanswered (NaN) questions are left out of their feature's average; features
+    with no answered questions default to neutral (4 on 1-7 scale, ~5 on 0-10).
+    """
+    answers = np.asarray(answers, dtype=float)
+    answered = ~np.isnan(answers)
+    if answered.all():
+        # map_scale is affine, so scaling the averages equals averaging the scaled answers
+        return map_scale(answers @ weight_matrix)
+
+    coverage = answered @ weight_matrix
+    sums = np.where(answered, answers, 0.0) @ weight_matrix
+    averages = np.divide(sums, coverage, out=np.full_like(sums, 4.0), where=coverage > 0)
+    return map_scale(averages)
+
+def parse_industry_preferences(preferred_industry):
+    """
+    Parses a preferred industry ("IT") or several weighted ones ("IT:2, Design:1") into
+    {industry: weight} with weights summing to 1. Industries not in the catalog and
+    unusable weights (not a finite positive number) are ignored; an empty dict means no preference.
+    """
+    weights = {}
+    for part in (preferred_industry or '').split(INDUSTRY_SEPARATOR):
+        industry, _, weight = part.partition(INDUSTRY_WEIGHT_SEPARATOR)
+        industry = industry.strip()
+        try:
+            weight = float(weight) if weight.strip() else 1.0
+        except ValueError:
+            continue
+        if industry not in INDUSTRY_INDEX or not (math.isfinite(weight) and weight > 0):
+            continue
+        combined = weights.get(industry, 0.0) + weight
+        if math.isfinite(combined):
+            weights[industry] = combined
+    # Scaled by the largest weight first, so the total cannot overflow
+    largest = max(weights.values(), default=1.0)
+    total = sum(weight / largest for weight in weights.values())
+    return {industry: weight / largest / total for industry, weight in weights.items()}
+
+def format_industry_preferences(weights):
+    """Formats {industry: weight} as a preference string; a single industry is written without a weight."""
+    if len(weights) == 1:
+        return next(iter(weights))
+    return f"{INDUSTRY_SEPARATOR} ".join(f"{industry}{INDUSTRY_WEIGHT_SEPARATOR}{weight:g}" for industry, weight in weights.items())
+
+# Boost matrix of each model in use, built the first time the model recommends. Keyed by the
+# model object, so a lookup costs the same however many careers the model has.
+_INDUSTRY_BOOST_MATRICES = weakref.WeakKeyDictionary()
+
+def build_industry_boost_matrix(classes):
+    """
+    Returns the (industries + 1, careers) matrix of boost factors for the careers in classes
+    (in ml_model.classes_ order): INDUSTRY_BOOST_FACTOR where the career belongs to the
+    industry, 1 elsewhere. The last row, all ones, stands for no preference.
+    """
+    membership = np.array([
+        [industry in CAREER_INDUSTRY_MAPPING.get(career, []) for career in classes]
+        for industry in INDUSTRIES
+    ], dtype=bool).reshape(len(INDUSTRIES), len(classes))
+    matrix = np.vstack([np.where(membership, INDUSTRY_BOOST_FACTOR, 1.0), np.ones((1, len(classes)))])
+    matrix.setflags(write=False)
+    return matrix
+
+def industry_boost_matrix(ml_model):
+    """Returns the boost matrix for ml_model's classes, built once per model."""
+    matrix = _INDUSTRY_BOOST_MATRICES.get(ml_model)
+    if matrix is None:
+        matrix = build_industry_boost_matrix(ml_model.classes_)
+        _INDUSTRY_BOOST_MATRICES[ml_model] = matrix
+    return matrix
+
+def industry_boost_factors(preferences, ml_model):
+    """
+    Returns one row of per-career boost factors (aligned to ml_model.classes_) for each
+    preference string: the preference's industry weights times the model's boost matrix.
+    """
+    weights = np.zeros((len(preferences), len(INDUSTRIES) + 1))
+    for row, preference in enumerate(preferences):
+        industry_weights = parse_industry_preferences(preference)
+        if not industry_weights:
+            weights[row, -1] = 1.0 # No preference: every factor is 1
+        for industry, weight in industry_weights.items():
+            weights[row, INDUSTRY_INDEX[industry]] = weight
+    return weights @ industry_boost_matrix(ml_model)
+
+def top_k_indices(scores, k):
+    """
+    Returns the column indices of the k highest scores in each row of scores, highest first.
+    Ties keep column order, as a stable full sort would. The k-th highest score is found by
+    partitioning in linear time and only the k selected columns are sorted, so ranking stays
+    cheap however many careers there are. NaN scores rank last, as in the full sort.
+    """
+    num_rows, num_columns = scores.shape
+    k = min(k, num_columns)
+    if k == num_columns or num_columns <= FULL_SORT_MAX_CAREERS:
+        return np.argsort(-scores, axis=1, kind='stable')[:, :k]
+
+    # Rows with NaN scores cannot be partitioned by comparison; fully sort just those
+    nan_rows = np.isnan(scores).any(axis=1)
+    if nan_rows.any():
+        top_k = np.empty((num_rows, k), dtype=np.intp)
+        top_k[nan_rows] = np.argsort(-scores[nan_rows], axis=1, kind='stable')[:, :k]
+        top_k[~nan_rows] = top_k_indices(scores[~nan_rows], k)
+        return top_k
+
+    kth_scores = -np.partition(-scores, k - 1, axis=1)[:, k - 1:k]
+    above = scores > kth_scores
+    tied = scores == kth_scores
+    # Of the columns tied with the k-th score, keep the leftmost ones that still fit
+    remaining = k - above.sum(axis=1, keepdims=True)
+    selected = above | (tied & (np.cumsum(tied, axis=1) <= remaining))
+    columns = np.nonzero(selected)[1].reshape(num_rows, k) # Exactly k per row, in column order
+
+    order = np.argsort(-np.take_along_axis(scores, columns, axis=1), axis=1, kind='stable')
+    return np.take_along_axis(columns, order, axis=1)
+
+def get_ml_career_recommendations_batch(ml_model, feature_names, career_outcomes, surveys, preferred_industries, top_n=DEFAULT_TOP_N):
+    """
+    Uses the trained ML model to get career recommendations for many surveys at once.
+
+    Args:
+        ml_model (TreeModel or Pipeline): The trained model (anything with predict_proba and classes_).
+        feature_names (list): List of feature names used during training.
+        career_outcomes (list): List of possible career outcomes.
+        surveys (np.ndarray or iterable): An (N, 20) array of 1-7 answers in QUESTION_KEYS
+            order (NaN for unanswered), or an iterable of raw_survey_responses dicts.
+        preferred_industries (str or sequence): One preferred industry per survey, or a single
+            one applied to all of them. Each may name several weighted industries ("IT:2, Design:1").
+        top_n (int): Number of top careers returned for display, at least 1.
+
+    Returns:
+        list: One (recommended_career, recommendation_score, top_careers_for_display)
+        tuple per survey, in input order.
+    """
+    if top_n < 1:
+        raise ValueError(f"top_n must be at least 1, not {top_n}")
+    if isinstance(surveys, np.ndarray):
+        answers = surveys.astype(float, copy=False)
+    else:
+        answers = surveys_to_array(surveys)
+    num_surveys = answers.shape[0]
+    if num_surveys == 0:
+        return []
+
+    if list(feature_names) == FEATURE_NAMES:
+        weight_matrix = QUESTION_WEIGHT_MATRIX
+    else:
+        weight_matrix = build_question_weight_matrix(feature_names)
+    input_features = aggregate_survey_features(answers, weight_matrix)
+
+    # Get probability predictions for each career, one row per survey
+    probabilities = ml_model.predict_proba(input_features)
+    classes = np.asarray(ml_model.classes_)
+
+    if len(classes) == 0:
+        return [("Uncertain", 0.0, []) for _ in range(num_surveys)]
+
+    # Apply preferred industry boost: one row of per-career factors per distinct preference
+    if isinstance(preferred_industries, str):
+        preferred_industries = [preferred_industries] * num_surveys
+    preferences, preference_rows = np.unique(np.asarray(preferred_industries, dtype=str), return_inverse=True)
+    boost_factors = industry_boost_factors(preferences, ml_model)[preference_rows.reshape(-1)]
+    probabilities = np.minimum(1.0, probabilities * boost_factors) # Cap at 1.0
+
+    # Convert probabilities to scores (e.g., out of 100)
+    career_scores = probabilities * 100
+
+    # Tied careers keep the original class order
+    top_indices = top_k_indices(career_scores, top_n)
+    top_careers = classes[top_indices].tolist()
+    top_scores = np.take_along_axis(career_scores, top_indices, axis=1).tolist()
+
+    results = []
+    for careers, scores in zip(top_careers, top_scores):
+        top_careers_for_display = list(zip(careers, scores))
+        results.append((careers[0], scores[0], top_careers_for_display))
+    return results
+
+def get_ml_career_recommendation(ml_model, feature_names, career_outcomes, raw_survey_responses, preferred_industry,
+                                 top_n=DEFAULT_TOP_N):
+    """
+    Uses the trained ML model to get career recommendations.
+
+    Args:
+        ml_model (TreeModel or Pipeline): The trained model (anything with predict_proba and classes_).
+        feature_names (list): List of feature names used during training.
+        career_outcomes (list): List of possible career outcomes.
+        raw_survey_responses (dict): A dictionary containing responses to the 20 questions (1-7 scale).
+        preferred_industry (str): The user's preferred industry, or several weighted ones ("IT:2, Design:1").
+        top_n (int): Number of top careers returned for display, at least 1.
+
+    Returns:
+        tuple: (recommended_career, recommendation_score, top_careers_for_display)
+    """
+    return get_ml_career_recommendations_batch(
+        ml_model, feature_names, career_outcomes, [raw_survey_responses], [preferred_industry], top_n
+    )[0]
+
+
+# --- Recommendation Cache ---
+# Distinct (answers, industry) pairs kept; a classroom repeats far fewer patterns than this
+DEFAULT_RECOMMENDATION_CACHE_SIZE = 1024
+
+def pack_answers(raw_survey_responses):
+    """
+    Packs the answers to q1..q20 into 20 bytes (0 for an unanswered question), for use as a cache key.
+    Returns None if an answer is not a whole number on the 1-7 scale.
+    """
+    packed = bytearray()
+    for q_key in QUESTION_KEYS:
+        value = raw_survey_responses.get(q_key)
+        if value is None:
+            packed.append(0)
+        elif value in range(1, 8):
+            packed.append(int(value))
+        else:
+            return None
+    return bytes(packed)
+
+class RecommendationCache:
+    """
+    Bounded LRU cache in front of get_ml_career_recommendation(), keyed by
+    (packed answers, preferred industry, top_n, model fingerprint).
+    The cache empties itself when it is given a different model than before, so
+    recommendations from a retrained or reloaded model are never served from it.
+    """
+
+    def __init__(self, max_entries=DEFAULT_RECOMMENDATION_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.model = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def recommend(self, ml_model, feature_names, career_outcomes, raw_survey_responses, preferred_industry,
+                  top_n=DEFAULT_TOP_N):
+        """Same arguments and result as get_ml_career_recommendation()."""
+        if ml_model is not self.model:
+            self.clear()
+            self.model = ml_model
+
+        answers = pack_answers(raw_survey_responses)
+        if answers is None:
+            return get_ml_career_recommendation(
+                ml_model, feature_names, career_outcomes, raw_survey_responses, preferred_industry, top_n
+            )
+
+        key = (answers, preferred_industry, top_n, getattr(ml_model, 'fingerprint', None))
+        result = self.entries.get(key)
+        if result is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        else:
+            self.misses += 1
+            recommended_career, recommendation_score, top_careers_for_display = get_ml_career_recommendation(
+                ml_model, feature_names, career_outcomes, raw_survey_responses, preferred_industry, top_n
+            )
+            result = (recommended_career, recommendation_score, tuple(top_careers_for_display))
+            self.entries[key] = result
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+        recommended_career, recommendation_score, top_careers_for_display = result
+        return recommended_career, recommendation_score, list(top_careers_for_display)
+
+    def stats(self):
+        """Returns hit/miss/eviction counters and the current number of entries."""
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'entries': len(self.entries)}
+
+    def clear(self):
+        """Drops every cached recommendation; counters are kept."""
+        self.entries.clear()
+
+
+# --- Model Artifact Persistence ---
+def model_fingerprint(classifier_params=CLASSIFIER_PARAMS):
+    """
+    Returns a hash of everything the trained model depends on: the career list,
+    the feature list, the data generator parameters and the classifier parameters.
+    An artifact whose fingerprint differs from this value is considered stale.
+    """
+    payload = {
+        'format_version': ARTIFACT_FORMAT_VERSION,
+        'careers': list(JOB_DETAILS.keys()),
+        'features': FEATURE_NAMES,
+        'training_params': TRAINING_PARAMS,
+        'classifier_params': classifier_params,
+        'generator_version': DATA_GENERATOR_VERSION,
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+def installed_sklearn_version():
+    """Returns the installed scikit-learn version without importing it, or None if it is not installed."""
+    try:
+        return importlib.metadata.version('scikit-learn')
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+def _write_atomically(path, data, prefix):
+    """
+    Writes data (bytes) to path through a temporary file in the same directory that is
+    renamed over the old file, so a crash never leaves a half-written file behind.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=prefix, suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def classifier_params_path(path=MODEL_ARTIFACT_PATH):
+    """Returns the path of the params file of the artifact at path (career_model.params.json for career_model.pkl)."""
+    return os.path.splitext(path)[0] + '.params.json'
+
+def load_classifier_params(path=MODEL_ARTIFACT_PATH):
+    """
+    Returns the classifier parameters the artifact at path is trained with: those published
+    in its params file, or CLASSIFIER_PARAMS when there is none. Delete the params file to
+    go back to the defaults.
+    """
+    params_path = classifier_params_path(path)
+    if not os.path.exists(params_path):
+        return dict(CLASSIFIER_PARAMS)
+    try:
+        with open(params_path, encoding='utf-8') as f:
+            params = json.load(f)['classifier_params']
+        if not isinstance(params, dict):
+            raise ValueError("classifier_params is not an object")
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Warning: could not read classifier parameters {params_path}: {e}")
+        return dict(CLASSIFIER_PARAMS)
+    return params
+
+def save_classifier_params(classifier_params, path=MODEL_ARTIFACT_PATH):
+    """Publishes classifier_params for the artifact at path; every later retrain of it uses them."""
+    encoded = json.dumps({'classifier_params': classifier_params}, indent=2, sort_keys=True) + '\n'
+    _write_atomically(classifier_params_path(path), encoded.encode('utf-8'), '.career_model_params-')
+
+def save_model_artifact(ml_model, feature_names, career_outcomes, path=MODEL_ARTIFACT_PATH,
+                        classifier_params=CLASSIFIER_PARAMS):
+    """
+    Writes the trained pipeline, its NumPy export and their metadata to disk atomically.
+    classifier_params are the parameters ml_model was trained with; they are recorded in
+    the artifact and its fingerprint.
+    The pipeline is stored as nested pickle bytes, so loading the NumPy model never imports scikit-learn.
+    """
+    artifact = {
+        'fingerprint': model_fingerprint(classifier_params),
+        'classifier_params': classifier_params,
+        'sklearn_version': installed_sklearn_version(),
+        'engine': export_pipeline(ml_model).to_arrays(),
+        'model': pickle.dumps(ml_model, protocol=pickle.HIGHEST_PROTOCOL),
+        'feature_names': list(feature_names),
+        'career_outcomes': list(career_outcomes),
+    }
+    _write_atomically(path, pickle.dumps(artifact, protocol=pickle.HIGHEST_PROTOCOL), '.career_model-')
+
+def load_model_artifact(path=MODEL_ARTIFACT_PATH, use_engine=True):
+    """
+    Loads a previously saved model artifact.
+
+    Args:
+        use_engine (bool): Return the NumPy TreeModel (no scikit-learn needed) instead of
+            the scikit-learn pipeline. The pipeline is only usable with the scikit-learn
+            version it was trained with.
+
+    Returns:
+        tuple: (ml_model, feature_names, career_outcomes), or None if the artifact
+        is missing, unreadable or was built for a different fingerprint (including
+        classifier parameters other than load_classifier_params(path)).
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            artifact = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+        print(f"Warning: could not read model artifact {path}: {e}")
+        return None
+
+    if not isinstance(artifact, dict) or artifact.get('fingerprint') != model_fingerprint(load_classifier_params(path)):
+        return None
+    if use_engine:
+        ml_model = TreeModel.from_arrays(artifact['engine'], artifact['fingerprint'])
+    else:
+        if artifact.get('sklearn_version') != installed_sklearn_version():
+            return None
+        ml_model = pickle.loads(artifact['model'])
+    return ml_model, artifact['feature_names'], artifact['career_outcomes']
+
+def load_career_model(path=MODEL_ARTIFACT_PATH, force_retrain=False, use_engine=True):
+    """
+    Returns the career model, loading it from the on-disk artifact when it is
+    up to date and retraining (and rewriting the artifact) only when it is stale.
+    Retraining uses the artifact's published classifier parameters (see load_classifier_params).
+    By default the model is the NumPy TreeModel; use_engine=False returns the scikit-learn pipeline.
+    """
+    if not force_retrain:
+        loaded = load_model_artifact(path, use_engine)
+        if loaded is not None:
+            print("Machine Learning model loaded from artifact.")
+            return loaded
+
+    classifier_params = load_classifier_params(path)
+    ml_model, feature_names, career_outcomes = train_career_model(TRAINING_PARAMS, classifier_params)
+    try:
+        save_model_artifact(ml_model, feature_names, career_outcomes, path, classifier_params)
+    except OSError as e:
+        print(f"Warning: could not save model artifact {path}: {e}")
+    if use_engine:
+        ml_model = export_pipeline(ml_model, model_fingerprint(classifier_params))
+    return ml_model, feature_names, career_outcomes
+
+def verify_engine(path=MODEL_ARTIFACT_PATH, num_rows=100_000, random_state=0):
+    """
+    Checks that the artifact's NumPy model returns exactly the pipeline's probabilities
+    for a batch of random feature rows and for single rows. The artifact is only read,
+    never retrained or rewritten.
+
+    Returns:
+        bool: True if every probability is identical, or None if the artifact cannot be
+        verified (missing, stale, or its pipeline was saved with another scikit-learn version).
+    """
+    engine_loaded = load_model_artifact(path)
+    pipeline_loaded = load_model_artifact(path, use_engine=False)
+    if engine_loaded is None or pipeline_loaded is None:
+        return None
+    engine, feature_names, _ = engine_loaded
+    pipeline = pipeline_loaded[0]
+    rng = np.random.default_rng(random_state)
+    features = rng.uniform(0, 10, size=(num_rows, len(feature_names)))
+    features[:num_rows // 2] = np.round(features[:num_rows // 2] * 2) / 2 # Survey answers produce half steps
+
+    batch_identical = np.array_equal(engine.predict_proba(features), pipeline.predict_proba(features))
+    single_identical = all(
+        np.array_equal(engine.predict_proba(row), pipeline.predict_proba(row.reshape(1, -1)))
+        for row in features[:100]
+    )
+    return batch_identical and single_identical
+
+
+# --- Command Line Interface ---
+def main(argv=None):
+    """Operator commands for managing the model artifact."""
+    parser = argparse.ArgumentParser(description="Manage the career recommendation model artifact.")
+    parser.add_argument('--artifact', default=MODEL_ARTIFACT_PATH, help="Path of the model artifact file.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('retrain', help="Retrain the model with its published classifier parameters and rewrite the artifact.")
+    subparsers.add_parser('status', help="Report whether the artifact is up to date.")
+    subparsers.add_parser('verify-engine', help="Check the NumPy model against the scikit-learn pipeline.")
+    args = parser.parse_args(argv)
+
+    if args.command == 'retrain':
+        load_career_model(args.artifact, force_retrain=True)
+        print(f"Model artifact written to {args.artifact}.")
+    elif args.command == 'status':
+        classifier_params = load_classifier_params(args.artifact)
+        source = classifier_params_path(args.artifact) if os.path.exists(classifier_params_path(args.artifact)) else "defaults"
+        print(f"Classifier parameters ({source}): {classifier_params}")
+        if load_model_artifact(args.artifact) is not None:
+            print(f"{args.artifact}: up to date ({model_fingerprint(classifier_params)[:12]}).")
+        else:
+            print(f"{args.artifact}: missing or stale.")
+            return 1
+    elif args.command == 'verify-engine':
+        verified = verify_engine(args.artifact)
+        if verified is None:
+            print(f"{args.artifact}: cannot verify: missing, stale or saved with another scikit-learn version.")
+            return 1
+        if verified:
+            print(f"{args.artifact}: NumPy model matches the scikit-learn pipeline.")
+        else:
+            print(f"{args.artifact}: NumPy model probabilities differ from the scikit-learn pipeline.")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
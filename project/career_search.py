@@ -0,0 +1,87 @@
+import re
+from collections import defaultdict
+
+from PyQt6.QtCore import QSortFilterProxyModel
+
+# Catalog fields searched besides the career name
+SEARCHED_FIELDS = ('description', 'skills', 'schools', 'companies')
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def tokenize(text):
+    """Splits text into lowercase word tokens ("Problem-solving" -> ["problem", "solving"])."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class CareerSearchIndex:
+    """
+    In-memory full-text index over the career catalog: names, descriptions, skills,
+    schools and companies. Built once; every prefix of every token maps to the set of
+    careers containing it, so a lookup costs one dictionary access per query word
+    however large the catalog grows. Career names are also matched by substring, as
+    the career list has always been filtered ("gineer" finds "Engineer").
+
+    Careers are identified by their position in careers (sorted by name), which is
+    also their row in a list model built from that list.
+    """
+
+    def __init__(self, job_details):
+        self.careers = sorted(job_details)
+        self.lowercase_names = [career.lower() for career in self.careers]
+        token_postings = defaultdict(set)
+        for career_id, career in enumerate(self.careers):
+            details = job_details[career]
+            texts = [career]
+            for field in SEARCHED_FIELDS:
+                value = details.get(field, '')
+                texts.extend(value if isinstance(value, list) else [value])
+            for text in texts:
+                for token in tokenize(text):
+                    token_postings[token].add(career_id)
+
+        # Expand each distinct token into its prefixes; set unions keep this fast for large catalogs
+        self.prefix_postings = defaultdict(set)
+        for token, career_ids in token_postings.items():
+            for end in range(1, len(token) + 1):
+                self.prefix_postings[token[:end]] |= career_ids
+        self.prefix_postings = dict(self.prefix_postings)
+
+    def search(self, query):
+        """
+        Returns the ids of careers containing every word of query, each word matching
+        the start of a token ("stat anal" finds "Statistical Analysis"), plus the careers
+        whose name contains the whole query, ignoring case ("scien" finds "Data Scientist").
+        A query without words matches every career.
+        """
+        words = tokenize(query)
+        if not words:
+            return set(range(len(self.careers)))
+        postings = sorted((self.prefix_postings.get(word, set()) for word in words), key=len)
+        matches = postings[0].intersection(*postings[1:])
+
+        # Substring match on names: a linear scan, but only over the names
+        substring = query.strip().lower()
+        matches.update(career_id for career_id, name in enumerate(self.lowercase_names) if substring in name)
+        return matches
+
+
+class CareerFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters a list model of CareerSearchIndex.careers by a search query. Typing only
+    changes which source rows are accepted; the source model and view are never rebuilt.
+    """
+
+    def __init__(self, search_index, parent=None):
+        super().__init__(parent)
+        self.search_index = search_index
+        self.matching_rows = None # None: no filter
+
+    def set_query(self, query):
+        matching_rows = self.search_index.search(query) if query.strip() else None
+        if matching_rows != self.matching_rows:
+            self.matching_rows = matching_rows
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.matching_rows is None or source_row in self.matching_rows
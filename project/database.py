@@ -0,0 +1,345 @@
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from collections import namedtuple
+
+# --- Database Setup ---
+DATABASE_NAME = 'career_data.db'
+
+# Number of Likert questions in a survey (q1..q20)
+NUM_QUESTIONS = 20
+# Answers are whole numbers on a 1-7 scale
+ANSWER_MIN, ANSWER_MAX = 1, 7
+
+# How long a writer waits for another connection's lock before raising, in milliseconds
+BUSY_TIMEOUT_MS = 5000
+
+# Number of prepared statements kept per connection
+STATEMENT_CACHE_SIZE = 64
+
+# One row of the survey history; timestamp is Unix epoch seconds (UTC) and
+# raw_survey_responses is the {q_key: value} answers dict
+HistoryRecord = namedtuple('HistoryRecord', [
+    'id', 'student_name', 'preferred_industry', 'recommended_career',
+    'recommendation_score', 'timestamp', 'raw_survey_responses'
+])
+
+# Summary of one submission for paginated history views (no survey answers)
+HistorySummary = namedtuple('HistorySummary', [
+    'id', 'student_name', 'preferred_industry', 'recommended_career',
+    'recommendation_score', 'timestamp'
+])
+
+# --- Schema Migrations ---
+# Each migration upgrades the schema by one version and PRAGMA user_version records
+# the last one applied. Append new migrations to MIGRATIONS; never edit applied ones.
+EPOCH_NOW_SQL = "CAST(strftime('%s', 'now') AS INTEGER)"
+
+def _migration_create_survey_responses(conn):
+    """Version 1: the original table, with the submission time as TEXT."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS survey_responses (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_name TEXT NOT NULL,
+            raw_survey_responses TEXT,
+            preferred_industry TEXT,
+            recommended_career TEXT,
+            recommendation_score REAL,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+def _migration_epoch_timestamps_and_indexes(conn):
+    """
+    Version 2: stores timestamp as integer Unix epoch seconds (UTC) and indexes it,
+    recommended_career and student_name. SQLite cannot change a column type in place,
+    so the table is rebuilt.
+    """
+    conn.execute(f'''
+        CREATE TABLE survey_responses_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_name TEXT NOT NULL,
+            raw_survey_responses TEXT,
+            preferred_industry TEXT,
+            recommended_career TEXT,
+            recommendation_score REAL,
+            timestamp INTEGER NOT NULL DEFAULT ({EPOCH_NOW_SQL})
+        )
+    ''')
+    conn.execute(f'''
+        INSERT INTO survey_responses_new (id, student_name, raw_survey_responses, preferred_industry,
+                                          recommended_career, recommendation_score, timestamp)
+        SELECT id, student_name, raw_survey_responses, preferred_industry,
+               recommended_career, recommendation_score,
+               COALESCE(CAST(strftime('%s', timestamp) AS INTEGER), {EPOCH_NOW_SQL})
+        FROM survey_responses
+    ''')
+    conn.execute("DROP TABLE survey_responses")
+    conn.execute("ALTER TABLE survey_responses_new RENAME TO survey_responses")
+    # id orders ties within a second; recommended_career lets latest_recommendation() stay in the index
+    conn.execute("CREATE INDEX idx_survey_responses_timestamp ON survey_responses (timestamp, id, recommended_career)")
+    conn.execute("CREATE INDEX idx_survey_responses_career ON survey_responses (recommended_career)")
+    conn.execute("CREATE INDEX idx_survey_responses_student ON survey_responses (student_name)")
+
+def _migration_survey_answers(conn):
+    """
+    Version 3: stores the Likert answers one row per (submission, question) in
+    survey_answers, so SQL can aggregate them, and backfills existing JSON answers.
+    raw_survey_responses is kept for old rows but is no longer written.
+    Submissions whose answers are not a JSON object, and answers that are not a whole
+    number on the 1-7 scale, are skipped and counted rather than failing the migration.
+    """
+    conn.execute('''
+        CREATE TABLE survey_answers (
+            submission_id INTEGER NOT NULL REFERENCES survey_responses (id) ON DELETE CASCADE,
+            question SMALLINT NOT NULL,
+            value SMALLINT NOT NULL,
+            PRIMARY KEY (submission_id, question)
+        ) WITHOUT ROWID
+    ''')
+    # Covers per-question averages and distributions without touching the table
+    conn.execute("CREATE INDEX idx_survey_answers_question_value ON survey_answers (question, value)")
+
+    skipped_submissions = skipped_answers = 0
+    cursor = conn.execute("SELECT id, raw_survey_responses FROM survey_responses WHERE raw_survey_responses IS NOT NULL")
+    for submission_id, raw_survey_responses in cursor.fetchall():
+        try:
+            answers = json.loads(raw_survey_responses)
+        except (TypeError, ValueError):
+            answers = None
+        if not isinstance(answers, dict):
+            print(f"Warning: skipping unreadable survey answers of submission {submission_id}.")
+            skipped_submissions += 1
+            continue
+        rows = answer_rows(submission_id, answers)
+        skipped_answers += sum(value is not None for value in answers.values()) - len(rows)
+        conn.executemany(INSERT_ANSWER_SQL, rows)
+    if skipped_submissions or skipped_answers:
+        print(f"Warning: skipped the answers of {skipped_submissions} unreadable submissions and "
+              f"{skipped_answers} answers that were not a question's 1-7 value.")
+
+def _migration_remove_invalid_answers(conn):
+    """
+    Version 4: removes answers that are not on the 1-7 scale or belong to no question,
+    which version 3 and earlier batch imports could store.
+    """
+    cursor = conn.execute(
+        "DELETE FROM survey_answers WHERE value NOT BETWEEN ? AND ? OR question NOT BETWEEN 1 AND ?",
+        (ANSWER_MIN, ANSWER_MAX, NUM_QUESTIONS)
+    )
+    if cursor.rowcount:
+        print(f"Warning: removed {cursor.rowcount} survey answers outside the 1-7 scale.")
+
+MIGRATIONS = [
+    _migration_create_survey_responses,
+    _migration_epoch_timestamps_and_indexes,
+    _migration_survey_answers,
+    _migration_remove_invalid_answers,
+]
+
+def migrate(conn):
+    """
+    Applies every migration newer than the database's user_version, each in its own
+    transaction, so existing databases are upgraded in place.
+    Returns the resulting schema version.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version > len(MIGRATIONS):
+        raise sqlite3.DatabaseError(
+            f"Database schema version {version} is newer than this application supports ({len(MIGRATIONS)})."
+        )
+    for number, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+        conn.execute("BEGIN")
+        try:
+            migration(conn)
+            conn.execute(f"PRAGMA user_version={number}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        print(f"Database migrated to schema version {number}.")
+    return len(MIGRATIONS)
+
+def question_number(q_key):
+    """Returns the number of a 'q1'..'q20' question key, or None for any other key."""
+    if not isinstance(q_key, str) or not q_key.startswith('q') or not q_key[1:].isdigit():
+        return None
+    number = int(q_key[1:])
+    return number if 1 <= number <= NUM_QUESTIONS else None
+
+def answer_value(value):
+    """Returns value as an int if it is a whole number from ANSWER_MIN to ANSWER_MAX, else None."""
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    if not number.is_integer() or not ANSWER_MIN <= number <= ANSWER_MAX:
+        return None
+    return int(number)
+
+def answer_rows(submission_id, raw_survey_responses):
+    """
+    Converts a {q_key: value} answers dict into (submission_id, question, value) rows.
+    Only q1..q20 keys with whole-number 1-7 values are kept; anything else, including
+    unanswered (None) questions, is left out.
+    """
+    rows = []
+    for q_key, value in raw_survey_responses.items():
+        question, answer = question_number(q_key), answer_value(value)
+        if question is not None and answer is not None:
+            rows.append((submission_id, question, answer))
+    return rows
+
+def format_timestamp(epoch_seconds):
+    """Formats a stored epoch timestamp the way CURRENT_TIMESTAMP used to read (UTC)."""
+    return datetime.fromtimestamp(epoch_seconds, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+# SQL is kept in constants so every call reuses the same cached prepared statement
+INSERT_SUBMISSION_SQL = (
+    "INSERT INTO survey_responses (student_name, preferred_industry, recommended_career, recommendation_score) "
+    "VALUES (?, ?, ?, ?)"
+)
+INSERT_ANSWER_SQL = "INSERT INTO survey_answers (submission_id, question, value) VALUES (?, ?, ?)"
+LATEST_RECOMMENDATION_SQL = "SELECT recommended_career FROM survey_responses ORDER BY timestamp DESC, id DESC LIMIT 1"
+LIST_HISTORY_SQL = (
+    "SELECT id, student_name, preferred_industry, recommended_career, recommendation_score, timestamp "
+    "FROM survey_responses ORDER BY timestamp DESC, id DESC"
+)
+ALL_ANSWERS_SQL = "SELECT submission_id, question, value FROM survey_answers"
+
+# Keyset pagination: each page continues strictly after the (timestamp, id) of the last row seen
+HISTORY_FIRST_PAGE_SQL = (
+    "SELECT id, student_name, preferred_industry, recommended_career, recommendation_score, timestamp "
+    "FROM survey_responses ORDER BY timestamp DESC, id DESC LIMIT ?"
+)
+HISTORY_NEXT_PAGE_SQL = (
+    "SELECT id, student_name, preferred_industry, recommended_career, recommendation_score, timestamp "
+    "FROM survey_responses WHERE (timestamp, id) < (?, ?) ORDER BY timestamp DESC, id DESC LIMIT ?"
+)
+SUBMISSION_ANSWERS_SQL = "SELECT question, value FROM survey_answers WHERE submission_id = ? ORDER BY question"
+
+# Aggregates over the (question, value) index
+QUESTION_AVERAGES_SQL = "SELECT question, AVG(value), COUNT(*) FROM survey_answers GROUP BY question ORDER BY question"
+ANSWER_DISTRIBUTION_SQL = "SELECT question, value, COUNT(*) FROM survey_answers GROUP BY question, value ORDER BY question, value"
+
+# One row per submission with a column per question (NULL when unanswered), e.g. for retraining
+ANSWER_MATRIX_SQL = (
+    "SELECT submission_id, "
+    + ", ".join(f"MAX(CASE WHEN question = {q} THEN value END)" for q in range(1, NUM_QUESTIONS + 1))
+    + " FROM survey_answers GROUP BY submission_id ORDER BY submission_id"
+)
+
+
+class SurveyRepository:
+    """
+    Data access for the survey_responses and survey_answers tables over a single long-lived connection.
+    The connection runs in WAL mode so history reads never block a submission.
+    Must be used from the thread that created it.
+    """
+
+    def __init__(self, database_name=DATABASE_NAME):
+        self.database_name = database_name
+        self.conn = sqlite3.connect(database_name, cached_statements=STATEMENT_CACHE_SIZE)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # NORMAL is durable against application crashes in WAL mode and avoids an fsync per commit
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        migrate(self.conn)
+        print("Database initialized successfully.")
+
+    def _insert(self, student_name, raw_survey_responses, preferred_industry, recommended_career, recommendation_score):
+        cursor = self.conn.execute(
+            INSERT_SUBMISSION_SQL, (student_name, preferred_industry, recommended_career, recommendation_score)
+        )
+        self.conn.executemany(INSERT_ANSWER_SQL, answer_rows(cursor.lastrowid, raw_survey_responses))
+        return cursor.lastrowid
+
+    def insert_submission(self, student_name, raw_survey_responses, preferred_industry, recommended_career, recommendation_score):
+        """
+        Stores one survey submission and its {q_key: value} answers, and returns its id.
+        """
+        with self.conn:
+            return self._insert(student_name, raw_survey_responses, preferred_industry, recommended_career, recommendation_score)
+
+    def insert_submissions(self, rows):
+        """
+        Stores many submissions in one transaction.
+        rows are (student_name, raw_survey_responses, preferred_industry, recommended_career, recommendation_score)
+        tuples, with raw_survey_responses a {q_key: value} dict.
+        """
+        with self.conn:
+            self.add_submissions(rows)
+
+    def add_submissions(self, rows):
+        """
+        Stores many submissions, like insert_submissions, without committing them:
+        use inside transaction() to commit several batches together.
+        """
+        for row in rows:
+            self._insert(*row)
+
+    @contextmanager
+    def transaction(self):
+        """Commits the work done in the block when it completes and rolls all of it back if it raises."""
+        with self.conn:
+            yield
+
+    def latest_recommendation(self):
+        """Returns the most recently recommended career, or None if there are no submissions."""
+        row = self.conn.execute(LATEST_RECOMMENDATION_SQL).fetchone()
+        return row[0] if row else None
+
+    def list_history(self):
+        """Returns every submission as a HistoryRecord with its answers dict, newest first."""
+        answers_by_submission = {}
+        for submission_id, question, value in self.conn.execute(ALL_ANSWERS_SQL):
+            answers_by_submission.setdefault(submission_id, {})[f'q{question}'] = value
+        return [
+            HistoryRecord._make(row + (answers_by_submission.get(row[0], {}),))
+            for row in self.conn.execute(LIST_HISTORY_SQL)
+        ]
+
+    def history_page(self, after=None, limit=100):
+        """
+        Returns up to limit HistorySummary rows, newest first.
+        after is the (timestamp, id) of the last row already shown, or None for the first page.
+        """
+        if after is None:
+            cursor = self.conn.execute(HISTORY_FIRST_PAGE_SQL, (limit,))
+        else:
+            cursor = self.conn.execute(HISTORY_NEXT_PAGE_SQL, (after[0], after[1], limit))
+        return [HistorySummary._make(row) for row in cursor]
+
+    def submission_answers(self, submission_id):
+        """Returns the {q_key: value} survey answers of one submission (empty if none were stored)."""
+        return {f'q{question}': value for question, value in self.conn.execute(SUBMISSION_ANSWERS_SQL, (submission_id,))}
+
+    def question_averages(self):
+        """Returns {question_number: (average_value, answer_count)} for every answered question."""
+        return {question: (average, count) for question, average, count in self.conn.execute(QUESTION_AVERAGES_SQL)}
+
+    def answer_distribution(self):
+        """Returns {question_number: {value: count}} over all submissions."""
+        distribution = {}
+        for question, value, count in self.conn.execute(ANSWER_DISTRIBUTION_SQL):
+            distribution.setdefault(question, {})[value] = count
+        return distribution
+
+    def answer_matrix(self):
+        """
+        Returns (submission_ids, rows) where each row lists the answers to questions
+        1..NUM_QUESTIONS of one submission, with None for unanswered questions.
+        """
+        submission_ids, rows = [], []
+        for submission_id, *values in self.conn.execute(ANSWER_MATRIX_SQL):
+            submission_ids.append(submission_id)
+            rows.append(values)
+        return submission_ids, rows
+
+    def close(self):
+        """Closes the underlying connection."""
+        self.conn.close()
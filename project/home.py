@@ -1,610 +1,218 @@
 import sys
 import sqlite3
-import pandas as pd
-import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QComboBox, QScrollArea, QFrame, QMessageBox,
     QTextEdit, QStackedWidget, QRadioButton, QButtonGroup, QSpacerItem, QSizePolicy,
-    QListWidget # Added for the left panel career list
+    QProgressBar,
+    QListView, # Added for the left panel career list
+    QTableView, QHeaderView, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont, QColor, QPalette, QBrush, QLinearGradient, QPixmap
-
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-
-import json
-from collections import defaultdict
-
-# --- Scikit-learn imports ---
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
-from sklearn.tree import DecisionTreeClassifier
-
-# --- Database Setup ---
-DATABASE_NAME = 'career_data.db'
-
-def init_db():
-    """Initializes the SQLite database and creates the survey_responses table."""
-    conn = sqlite3.connect(DATABASE_NAME)
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS survey_responses (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_name TEXT NOT NULL,
-            raw_survey_responses TEXT,
-            preferred_industry TEXT,
-            recommended_career TEXT,
-            recommendation_score REAL,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    conn.commit()
-    conn.close()
-    print("Database initialized successfully.")
-
-# --- JOB DETAILS (Incorporating all data from Ai_Jobs.docx) ---
-JOB_DETAILS = {
-    "Doctor": {
-        "description": "Diagnose and treat illnesses, perform check-ups, prescribe medicine, and guide patients to recovery.",
-        "salary_range": "$11,000 - $40,000 per year (Annual)",
-        "skills": [
-            "Clinical Diagnosis",
-            "Treatment Planning",
-            "Patient Care",
-            "Medical Procedures",
-            "Communication",
-            "Problem-solving"
-        ],
-        "schools": [
-            "University of Health Sciences",
-            "International University",
-            "Norton University",
-            "University of Puthisastra",
-            "Cambodian University for Specialties"
-        ],
-        "companies": [
-            "Royal Phnom Penh Hospital",
-            "Calmette Hospital",
-            "Sunrise Japan Hospital Phnom Penh",
-            "SenSok International University Hospital",
-            "Raffles Medical Phnom Penh"
-        ],
-        "image_path": "img/doctor.jpg"
-    },
-    "Project Manager": {
-        "description": "leads and oversees projects from start to finish—planning, coordinating resources, ensuring timelines and budgets are met, managing teams, and communicating with stakeholders.",
-        "salary_range": "$5,000 - $19,000 per year (Annual)",
-        "skills": [
-            "Planning",
-            "Budget Management",
-            "Team Leadership",
-            "Risk Management",
-            "Communication"
-        ],
-        "schools": [
-            "CamEd Business School",
-            "University of Puthisatra",
-            "National Institute of Business",
-            "National University of Management",
-            "Norton University"
-        ],
-        "companies": [
-            "Vattanac Bank Cambodia",
-            "ACLEDA Company",
-            "Oddatelier Company"
-        ],
-        "image_path": "img/Project manager.png"
-    },
-    "Researcher": {
-        "description": "Researchers conduct systematic investigations to establish facts, develop new theories, or revise existing ones. They often work in academic institutions, government agencies, or private companies, designing experiments, collecting and analyzing data, and reporting their findings. Strong analytical skills, attention to detail, and a commitment to scientific integrity are crucial.",
-        "salary_range": "$5,000 - $18,000 per year (Annual)",
-        "skills": [
-            "Research Design",
-            "Data Collection",
-            "Statistical Analysis",
-            "Report Writing",
-            "Critical Thinking"
-        ],
-        "schools": [
-            "Royal University of Phnom Penh (RUPP)",
-            "University of Health Sciences (UHS)",
-            "Institute of Technology of Cambodia (ITC)",
-            "American University of Phnom Penh (AUPP)"
-        ],
-        "companies": [
-            "Universities",
-            "Government Labs",
-            "Pharmaceutical Companies",
-            "R&D Departments",
-            "Innovative Research Firms"
-        ],
-        "image_path": "img/Researcher.png"
-    },
-    "UX/UI Designer": {
-        "description": "focuses on creating intuitive, efficient, and enjoyable user experiences for websites, apps, and software. They research user needs, design interfaces, and test prototypes to ensure products are user-friendly.",
-        "salary_range": "$6,000 - $20,000 per year (Annual)",
-        "skills": [
-            "User Research",
-            "Wireframing",
-            "Prototyping",
-            "Usability Testing",
-            "Figma/Sketch/Adobe XD",
-            "Communication"
-        ],
-        "schools": [
-            "Limkokwing University of Creative Technology",
-            "Royal University of Phnom Penh (RUPP)",
-            "Pannasastra University of Cambodia (PUC)",
-            "Cambodia Academy of Digital Technology (CADT)"
-        ],
-        "companies": [
-            "Tech Startups",
-            "Digital Agencies",
-            "E-commerce Companies",
-            "Software Development Firms",
-            "Banks"
-        ],
-        "image_path": "img/ux ui.png"
-    },
-    "Data Scientist": {
-        "description": "Data Scientists analyze complex datasets to extract insights and knowledge. They use statistical analysis, machine learning, and programming to build predictive models and inform business decisions. A strong background in mathematics and statistics is beneficial.",
-        "salary_range": "$7,000 - $24,000 per year (Annual)",
-        "skills": [
-            "Programming (Python, R, SQL)",
-            "Data Analysis Tools",
-            "Machine Learning",
-            "Data Visualization",
-            "Problem-solving",
-            "Critical thinking",
-            "Communication"
-        ],
-        "schools": [
-            "American University of Phnom Penh (AUPP)",
-            "Institute of Technology of Cambodia (ITC)",
-            "Royal University of Phnom Penh (RUPP)",
-            "Step IT Academy",
-            "Cambodia Academy of Digital Technology (CADT)"
-        ],
-        "companies": [
-            "Banks & Microfinance Company: ABA Bank, Acleda Bank, Wing Bank",
-            "Telecom: Smart Axiata, Metfone, Cellcard",
-            "Tech Companies / Startups: Codingate, Pathmazing, Slash"
-        ],
-        "image_path": "img/Data Scientist.png"
-    },
-    "Software Engineer": {
-        "description": "design, develop, and maintain software applications. They apply engineering principles to build robust, scalable, and efficient systems.",
-        "salary_range": "$6,000 - $22,000 per year (Annual)",
-        "skills": [
-            "Programming (Java, Python, C++, JavaScript)",
-            "Data Structures & Algorithms",
-            "Software Development Life Cycle (SDLC)",
-            "Database Management",
-            "Problem-solving",
-            "Teamwork"
-        ],
-        "schools": [
-            "Royal University of Phnom Penh (RUPP)",
-            "Institute of Technology of Cambodia (ITC)",
-            "National University of Management (NUM)",
-            "American University of Phnom Penh (AUPP)",
-            "SETEC Institute"
-        ],
-        "companies": [
-            "Tech Companies (e.g., Agoda, Pruksa)",
-            "Banks & FinTech",
-            "Telecoms",
-            "Software Outsourcing Firms",
-            "E-commerce Platforms"
-        ],
-        "image_path": "img/Software enginee.png"
-    },
-    "Fire Fighter": {
-        "description": "Firefighters respond to emergencies, extinguish fires, rescue people from dangerous situations, and provide first aid. They also educate the public on fire safety.",
-        "salary_range": "$3,000 - $8,000 per year (Annual)",
-        "skills": [
-            "Emergency Response",
-            "First Aid/CPR",
-            "Physical Fitness",
-            "Teamwork",
-            "Stress Management"
-        ],
-        "schools": [
-            "National Police Academy of Cambodia (specific firefighter training programs)",
-            "Various provincial training centers"
-        ],
-        "companies": [
-            "Fire and Rescue Department (under Ministry of Interior)",
-            "Airport Fire Services",
-            "Industrial Fire Brigades (large factories, complexes)"
-        ],
-        "image_path": "img/firefigher.jpg" 
-    },
-    "Lawyer": {
-        "description": "Lawyers provide legal advice, represent clients in court, and prepare legal documents. They specialize in various fields like criminal law, civil law, or corporate law.",
-        "salary_range": "$8,000 - $30,000 per year (Annual)",
-        "skills": [
-            "Legal Research",
-            "Advocacy",
-            "Negotiation",
-            "Contract Drafting",
-            "Communication",
-            "Analytical Thinking"
-        ],
-        "schools": [
-            "Royal University of Law and Economics (RULE)",
-            "Pannasastra University of Cambodia (PUC)",
-            "National University of Management (NUM)",
-            "University of Cambodia (UC)"
-        ],
-        "companies": [
-            "Law Firms",
-            "Corporate Legal Departments",
-            "Government Ministries",
-            "NGOs",
-            "International Organizations"
-        ],
-        "image_path": "img/lawyer.jpg"
-    },
-    "High School Teacher": {
-        "description": "High school teachers educate students in various subjects, prepare lesson plans, assess student progress, and foster a positive learning environment.",
-        "salary_range": "$3,000 - $10,000 per year (Annual)",
-        "skills": [
-            "Lesson Planning",
-            "Classroom Management",
-            "Subject Matter Expertise",
-            "Communication",
-            "Student Assessment",
-            "Adaptability"
-        ],
-        "schools": [
-            "National Institute of Education (NIE)",
-            "Royal University of Phnom Penh (RUPP) - Education Dept.",
-            "Phnom Penh International University (PPIU) - Education Dept."
-        ],
-        "companies": [
-            "Public High Schools (Ministry of Education, Youth and Sport)",
-            "Private International Schools",
-            "Community Learning Centers"
-        ],
-        "image_path": "img/teacher.jpg" 
-    },
-    "Accountant": {
-        "description": "Accountants prepare and examine financial records, ensure financial statements are accurate, and help individuals and businesses manage their finances and comply with tax laws.",
-        "salary_range": "$4,000 - $15,000 per year (Annual)",
-        "skills": [
-            "Financial Reporting",
-            "Tax Preparation",
-            "Auditing",
-            "Bookkeeping",
-            "Data Analysis",
-            "Attention to Detail"
-        ],
-        "schools": [
-            "CamEd Business School",
-            "National University of Management (NUM)",
-            "Royal University of Law and Economics (RULE)",
-            "University of Cambodia (UC)"
-        ],
-        "companies": [
-            "Accounting Firms",
-            "Banks & Financial Institutions",
-            "Manufacturing Companies",
-            "NGOs",
-            "Government Agencies"
-        ],
-        "image_path": "img/accountant.jpg"
-    },
-    "Civil Site Engineer": {
-        "description": "Civil Site Engineers plan, design, and manage construction projects such as buildings, roads, bridges, and infrastructure, ensuring they are built safely and efficiently.",
-        "salary_range": "$5,000 - $18,000 per year (Annual)",
-        "skills": [
-            "Project Management",
-            "Structural Analysis",
-            "AutoCAD/Design Software",
-            "Site Supervision",
-            "Problem-solving",
-            "Safety Regulations"
-        ],
-        "schools": [
-            "Institute of Technology of Cambodia (ITC)",
-            "National University of Management (NUM)",
-            "Norton University",
-            "Royal University of Phnom Penh (RUPP) - Engineering Dept."
-        ],
-        "companies": [
-            "Construction Companies",
-            "Real Estate Developers",
-            "Consulting Engineering Firms",
-            "Government Public Works Departments",
-            "Infrastructure Development Companies"
-        ],
-        "image_path": "img/enginee.jpg"
-    },
-    "Architecture": {
-        "description": "Architects design buildings and other physical structures. They blend aesthetics with functionality, considering safety, sustainability, and client needs.",
-        "salary_range": "$5,000 - $17,000 per year (Annual)",
-        "skills": [
-            "Architectural Design",
-            "AutoCAD/Revit",
-            "Sketching & Rendering",
-            "Building Codes",
-            "Project Management",
-            "Creativity"
-        ],
-        "schools": [
-            "Royal University of Phnom Penh (RUPP) - Dept. of Architecture",
-            "Limkokwing University of Creative Technology",
-            "Pannasastra University of Cambodia (PUC) - Architecture"
-        ],
-        "companies": [
-            "Architectural Firms",
-            "Construction Companies",
-            "Real Estate Development Firms",
-            "Interior Design Companies",
-            "Government Urban Planning Departments"
-        ],
-        "image_path": "img/architect.jpg"
-    },
-    "Artist": {
-        "description": "Artists create visual, performing, or literary works. This broad field includes painters, sculptors, musicians, writers, and digital artists, who use their creativity to express ideas and evoke emotions.",
-        "salary_range": "$2,000 - $10,000 per year (Annual) - Highly variable",
-        "skills": [
-            "Creativity",
-            "Specific Art Medium (e.g., painting, digital art, music)",
-            "Self-promotion",
-            "Attention to Detail",
-            "Adaptability"
-        ],
-        "schools": [
-            "Royal University of Fine Arts (RUFA)",
-            "Limkokwing University of Creative Technology",
-            "Phare Ponleu Selpak (Artistic training NGO)"
-        ],
-        "companies": [
-            "Art Galleries",
-            "Design Studios",
-            "Entertainment Industry",
-            "Advertising Agencies",
-            "Freelance/Self-employed"
-        ],
-        "image_path": "img/job1.png"
-    },
-    "Digital Marketer": {
-        "description": "Digital marketers promote products or services online using various digital channels like social media, search engines, email, and websites. They focus on increasing brand awareness, driving traffic, and generating leads.",
-        "salary_range": "$2,000 - $9,000 per year (Annual)",
-        "skills": [
-            "Social Media Marketing",
-            "Content Creation",
-            "SEO (Search Engine Optimization)",
-            "Email Marketing",
-            "Google Analytics",
-            "Campaign Management"
-        ],
-        "schools": [
-            "National University of Management (NUM) - Marketing",
-            "Pannasastra University of Cambodia (PUC) - Marketing",
-            "Royal University of Phnom Penh (RUPP) - Media & Communication"
-        ],
-        "companies": [
-            "Digital Marketing Agencies",
-            "E-commerce Businesses",
-            "Tech Startups",
-            "Large Corporations (in-house marketing teams)",
-            "NGOs"
-        ],
-        "image_path": "img/Digital marketer.png"
-    },
-    "Human Resource (HR)": {
-        "description": "manages recruitment, employee relations, training, and company policies to support staff and help the organization run smoothly.",
-        "salary_range": "$2,000 - $9,000 per year (Annual)",
-        "skills": [
-            "Recruitment and interviewing",
-            "Knowledge of Cambodian labor law",
-            "Payroll and benefits administration",
-            "Communication and interpersonal skills",
-            "Problem-solving and conflict management"
-        ],
-        "schools": [
-            "Human Resource University",
-            "Pannasastra University of Cambodia",
-            "Royal University of Phnom Penh",
-            "The Knowledge Academy",
-            "Cambodian Mekong University"
-        ],
-        "companies": [
-            "private companies",
-            "non-profit organizations",
-            "government agencies",
-            "Consulting Firms",
-            "International Organizations"
-        ],
-        "image_path": "img/HR.jpg"
-    }
+from PyQt6.QtCore import Qt, QSize, QTimer, QAbstractTableModel, QModelIndex, QStringListModel
+from PyQt6.QtGui import QFont, QColor, QPalette, QBrush, QLinearGradient, QTextDocument
+
+from database import DATABASE_NAME, SurveyRepository, format_timestamp
+from job_details import CATALOG, JOB_DETAILS
+from career_model import MODEL_ARTIFACT_PATH, INDUSTRIES, RecommendationCache, format_industry_preferences
+from model_worker import ModelLoaderThread
+from image_cache import PixmapCache
+from assets import AssetManifest, display_size
+from page_registry import PageRegistry
+from career_search import CareerSearchIndex, CareerFilterProxyModel
+from career_chart import create_results_chart
+
+
+# Display text for each answer on the 1-7 survey scale
+RESPONSE_LABELS = {
+    1: "Strongly Disagree", 2: "Disagree", 3: "Slightly Disagree",
+    4: "Neutral", 5: "Slightly Agree", 6: "Agree", 7: "Strongly Agree"
 }
 
-
-# --- Dummy Data Generation for ML Model Training ---
-def generate_dummy_data(num_samples=200):
+# Survey questions, in q1..q20 order
+SURVEY_QUESTIONS = [
+    "I enjoy solving complex mathematical problems.",
+    "I find working with numbers and data engaging.",
+    "I am curious about how the natural world and scientific principles work.",
+    "I enjoy learning about new scientific discoveries and theories.",
+    "I enjoy writing code and developing software applications.",
+    "I like to build and troubleshoot computer systems.",
+    "I am interested in artificial intelligence and machine learning.",
+    "I enjoy creating visual designs and artistic layouts.",
+    "I pay attention to user experience and interface aesthetics.",
+    "I enjoy breaking down complex problems into smaller, manageable parts.",
+    "I like to find innovative solutions to challenges.",
+    "I am good at analytical thinking and logical reasoning.",
+    "I am comfortable presenting ideas and information to groups.",
+    "I enjoy collaborating with others to achieve a common goal.",
+    "I can clearly explain complex topics to different audiences.",
+    "I enjoy generating new and original ideas.",
+    "I am comfortable thinking outside the box and experimenting.",
+    "I like to take charge and guide a team towards a goal.",
+    "I am good at organizing tasks and managing resources.",
+    "I enjoy motivating others and resolving conflicts."
+]
+
+# Display sizes (see assets.DISPLAY_SIZES) of the job details panel images and the home page illustration
+JOB_IMAGE = 'job_wide'
+JOB_IMAGE_SIZE = display_size(JOB_IMAGE)
+HOME_IMAGE = 'home'
+HOME_IMAGE_SIZE = display_size(HOME_IMAGE)
+
+# Results chart renderer (see career_chart.RENDERERS); 'matplotlib' restores the original chart
+RESULTS_CHART_RENDERER = 'native'
+# Careers listed in the results chart
+TOP_CAREERS_SHOWN = 3
+
+# Preferred industry selected when the survey opens, and how a second industry choice is weighted against the first
+DEFAULT_INDUSTRY = "IT"
+FIRST_INDUSTRY_WEIGHT = 2
+SECOND_INDUSTRY_WEIGHT = 1
+
+
+# --- Survey History Model ---
+class HistoryTableModel(QAbstractTableModel):
     """
-    Generates a synthetic dataset for training the ML model.
-    Maps aggregated survey responses to career outcomes.
-    """
-    # Define the aggregated features (0-10 scale)
-    feature_names = [
-        'math_interest', 'science_interest', 'coding_interest', 'design_interest',
-        'problem_solving_skill', 'communication_skill', 'creativity_skill', 'leadership_skill'
-    ]
-    
-    # Define possible career outcomes - using all keys from JOB_DETAILS
-    career_outcomes = list(JOB_DETAILS.keys())
-
-    data = []
-    labels = []
-
-    for _ in range(num_samples):
-        # Generate random aggregated scores
-        features = {name: np.random.uniform(1, 10) for name in feature_names}
-        
-        # Simple logic to assign a career based on features (mimicking real patterns)
-        # This mapping needs to be expanded to cover all new careers
-        career = np.random.choice(career_outcomes) # Default random pick
-
-        # More specific assignments
-        if features['coding_interest'] > 7 and features['problem_solving_skill'] > 6:
-            career = np.random.choice(["Software Engineer", "Data Scientist"])
-        elif features['math_interest'] > 7 and features['science_interest'] > 6:
-            career = np.random.choice(["Data Scientist", "Researcher"])
-        elif features['design_interest'] > 7 and features['creativity_skill'] > 6:
-            career = "UX/UI Designer"
-        elif features['leadership_skill'] > 7 and features['communication_skill'] > 6:
-            career = np.random.choice(["Project Manager", "Human Resource (HR)"])
-        elif features['science_interest'] > 7 and features['problem_solving_skill'] > 6:
-            career = np.random.choice(["Doctor", "Researcher"])
-        elif features['communication_skill'] > 7 and features['creativity_skill'] > 6:
-            career = np.random.choice(["Artist", "Digital Marketer"])
-        elif features['math_interest'] > 7 and features['problem_solving_skill'] > 6:
-            career = np.random.choice(["Accountant", "Civil Site Engineer", "Architecture"])
-        elif features['leadership_skill'] > 7 and features['problem_solving_skill'] > 6:
-            career = np.random.choice(["Fire Fighter", "Lawyer"])
-        # Add more specific rules as needed for better accuracy
-
-        data.append(list(features.values()))
-        labels.append(career)
-
-    X = pd.DataFrame(data, columns=feature_names)
-    y = pd.Series(labels)
-    
-    return X, y, feature_names, career_outcomes
-
-# --- Machine Learning Model Training ---
-def train_career_model():
+    Table model over survey_responses that loads one keyset-paginated page at a time
+    as the view scrolls, so only rows that have been scrolled into view are fetched.
     """
-    Trains a Decision Tree Classifier model for career recommendation.
-    """
-    X, y, feature_names, career_outcomes = generate_dummy_data()
-
-    # Create a pipeline with scaling and a classifier
-    model_pipeline = Pipeline([
-        ('scaler', StandardScaler()),
-        ('classifier', DecisionTreeClassifier(random_state=42))
-    ])
-
-    model_pipeline.fit(X, y)
-    print("Machine Learning model trained successfully.")
-    return model_pipeline, feature_names, career_outcomes
-
-# --- ML-based Recommendation Logic ---
-def get_ml_career_recommendation(ml_model, feature_names, career_outcomes, raw_survey_responses, preferred_industry):
-    """
-    Uses the trained ML model to get career recommendations.
-
-    Args:
-        ml_model (Pipeline): The trained Scikit-learn pipeline.
-        feature_names (list): List of feature names used during training.
-        career_outcomes (list): List of possible career outcomes.
-        raw_survey_responses (dict): A dictionary containing responses to the 20 questions (1-7 scale).
-        preferred_industry (str): The user's selected preferred industry.
-
-    Returns:
-        tuple: (recommended_career, recommendation_score, top_careers_for_display)
-    """
-    def map_scale(value):
-        return (value - 1) * (10 / 6) # Map 1-7 scale to 0-10
-
-    # Aggregate raw survey responses into interest/skill categories (0-10 scale)
-    category_scores = defaultdict(float)
-    category_counts = defaultdict(int)
-
-    # Mapping survey questions to aggregated features
-    q_to_category = {
-        'q1': 'math_interest', 'q2': 'math_interest',
-        'q3': 'science_interest', 'q4': 'science_interest',
-        'q5': 'coding_interest', 'q6': 'coding_interest', 'q7': 'coding_interest',
-        'q8': 'design_interest', 'q9': 'design_interest',
-        'q10': 'problem_solving_skill', 'q11': 'problem_solving_skill', 'q12': 'problem_solving_skill',
-        'q13': 'communication_skill', 'q14': 'communication_skill', 'q15': 'communication_skill',
-        'q16': 'creativity_skill', 'q17': 'creativity_skill',
-        'q18': 'leadership_skill', 'q19': 'leadership_skill', 'q20': 'leadership_skill',
-    }
-
-    for q_key, response_value in raw_survey_responses.items():
-        category = q_to_category.get(q_key)
-        if category:
-            category_scores[category] += map_scale(response_value)
-            category_counts[category] += 1
-
-    aggregated_data = {}
-    for feature in feature_names:
-        if category_counts[feature] > 0:
-            aggregated_data[feature] = category_scores[feature] / category_counts[feature]
-        else:
-            aggregated_data[feature] = map_scale(4) # Default to neutral (4 on 1-7 scale, mapped to ~5 on 0-10) if no questions contributed
-
-    # Prepare features for the model in the correct order
-    input_features = pd.DataFrame([list(aggregated_data.values())], columns=feature_names)
-
-    # Get probability predictions for each career
-    probabilities = ml_model.predict_proba(input_features)[0]
-    
-    # Create a dictionary of career probabilities
-    career_probs = {career: prob for career, prob in zip(ml_model.classes_, probabilities)}
-
-    # Apply preferred industry boost (post-prediction)
-    industry_boost_factor = 1.2
-    career_industry_mapping = {
-        "Software Engineer": ["IT", "Technology"],
-        "Data Scientist": ["IT", "Research", "Finance"],
-        "UX/UI Designer": ["Design", "IT"],
-        "Project Manager": ["Management", "General"],
-        "Researcher": ["Research", "Science"],
-        "Doctor": ["Healthcare"],
-        "Fire Fighter": ["Public Service", "General"],
-        "Lawyer": ["Legal", "General"],
-        "High School Teacher": ["Education", "General"],
-        "Accountant": ["Finance", "General"],
-        "Civil Site Engineer": ["Engineering", "Construction"],
-        "Architecture": ["Design", "Construction"],
-        "Artist": ["Arts", "Design"],
-        "Digital Marketer": ["Marketing", "IT"],
-        "Human Resource (HR)": ["Management", "General"]
+    PAGE_SIZE = 100
+    HEADERS = ["ID", "ឈ្មោះនិស្សិត", "ឧស្សាហកម្មពេញចិត្ត", "អាជីពណែនាំ", "អត្រាសមត្ថភាព", "កាលបរិច្ឆេទ"]
+
+    def __init__(self, repository, parent=None):
+        super().__init__(parent)
+        self.repository = repository
+        self.records = []
+        self.has_more = True
+
+    def reload(self):
+        """Drops the loaded rows and fetches the first page again."""
+        self.beginResetModel()
+        self.records = []
+        self.has_more = True
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def record(self, row):
+        """Returns the HistorySummary shown in the given row."""
+        return self.records[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        record = self.records[index.row()]
+        column = index.column()
+        if column == 0:
+            return str(record.id)
+        if column == 1:
+            return record.student_name
+        if column == 2:
+            return record.preferred_industry
+        if column == 3:
+            return record.recommended_career
+        if column == 4:
+            return f"{record.recommendation_score:.2f}%" if record.recommendation_score is not None else ""
+        return format_timestamp(record.timestamp)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def stop(self):
+        """Stops loading pages, e.g. before the repository is closed; the loaded rows stay."""
+        self.has_more = False
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self.has_more
+
+    def fetchMore(self, parent):
+        if parent.isValid() or not self.has_more:
+            return
+        after = (self.records[-1].timestamp, self.records[-1].id) if self.records else None
+        page = self.repository.history_page(after, self.PAGE_SIZE)
+        if len(page) < self.PAGE_SIZE:
+            self.has_more = False
+        if page:
+            first_row = len(self.records)
+            self.beginInsertRows(QModelIndex(), first_row, first_row + len(page) - 1)
+            self.records.extend(page)
+            self.endInsertRows()
+
+
+def render_job_details_html(career_name, details):
+    """Renders the text of each section of a career's detail view (rich text where the widget shows HTML)."""
+    def bullet_list(items):
+        return "<ul>" + "".join(f"<li>{item}</li>" for item in items) + "</ul>"
+
+    return {
+        'title': f"ព័ត៌មានលម្អិតសម្រាប់៖ {career_name}",
+        'description': f"<p>{details['description']}</p>",
+        'skills': bullet_list(details.get('skills', [])),
+        'schools': bullet_list(details.get('schools', [])),
+        'companies': bullet_list(details.get('companies', [])),
+        'salary': details['salary_range'],
     }
 
-    for career, prob in career_probs.items():
-        if preferred_industry in career_industry_mapping.get(career, []):
-            career_probs[career] = min(1.0, prob * industry_boost_factor) # Cap at 1.0
-
-    # Convert probabilities to scores (e.g., out of 100)
-    career_scores = {career: prob * 100 for career, prob in career_probs.items()}
-
-    # Get the top recommended career and its score
-    if career_scores:
-        recommended_career = max(career_scores, key=career_scores.get)
-        recommendation_score = career_scores[recommended_career]
-    else:
-        recommended_career = "Uncertain"
-        recommendation_score = 0.0
-
-    # Get top 3 careers for pie chart display
-    sorted_careers = sorted(career_scores.items(), key=lambda item: item[1], reverse=True)
-    top_careers_for_display = [(career, score) for career, score in sorted_careers[:3]]
-
-    return recommended_career, recommendation_score, top_careers_for_display
-
 
 # --- Main Application Window ---
 class CareerApp(QWidget):
-    def __init__(self):
+    def __init__(self, database_name=DATABASE_NAME, artifact_path=MODEL_ARTIFACT_PATH):
         super().__init__()
         self.setWindowTitle("ប្រព័ន្ធវិភាគសមត្ថភាព និងផ្តល់យោបល់ការងារ") # Competency Analysis and Career Counseling System
         self.setGeometry(100, 100, 1200, 800) # Increased width
 
-        self.ml_model, self.feature_names, self.career_outcomes = train_career_model()
-
+        # The model is prepared on a worker thread; the survey submit button waits for it
+        self.ml_model, self.feature_names, self.career_outcomes = None, None, None
+        self.model_error = None
+        self.model_loader = ModelLoaderThread(artifact_path, parent=self)
+        self.model_loader.model_ready.connect(self.on_model_ready)
+        self.model_loader.failed.connect(self.on_model_failed)
+        QTimer.singleShot(0, self.model_loader.start) # Started from the event loop, once the window has been shown
+
+        self.repository = SurveyRepository(database_name)
+        self.asset_manifest = AssetManifest()
+        self.pixmap_cache = PixmapCache()
+        self.recommendation_cache = RecommendationCache() # Repeated answer patterns are not re-scored
+        self.questions = SURVEY_QUESTIONS
         self.init_ui()
-        init_db()
+
+    def on_model_ready(self, ml_model, feature_names, career_outcomes):
+        """Stores the prepared model and enables survey submission."""
+        self.ml_model, self.feature_names, self.career_outcomes = ml_model, feature_names, career_outcomes
+        if self.pages.is_built('survey'):
+            self.update_model_status()
+
+    def on_model_failed(self, message):
+        """Reports that the model could not be prepared; submission stays disabled."""
+        self.model_error = message
+        if self.pages.is_built('survey'):
+            self.update_model_status()
+
+    def update_model_status(self):
+        """Shows the model's loading state on the survey page and enables submission once it is ready."""
+        if self.ml_model is not None:
+            self.model_status_label.hide()
+            self.model_progress_bar.hide()
+            self.submit_button.setEnabled(True)
+        elif self.model_error is not None:
+            self.model_progress_bar.hide()
+            self.model_status_label.setText(f"មិនអាចរៀបចំម៉ូដែលបានទេ: {self.model_error}") # Could not prepare the model
+            self.model_status_label.setStyleSheet("color: #dc3545;")
+
+    def closeEvent(self, event):
+        """Waits for the background workers and closes the database connection when the window closes."""
+        self.model_loader.wait()
+        self.pixmap_cache.wait_for_pending()
+        if self.pages.is_built('history'):
+            self.history_model.stop() # The view may still ask for more rows after the connection is closed
+        self.repository.close()
+        super().closeEvent(event)
 
     def init_ui(self):
         """Initializes the user interface."""
@@ -628,20 +236,16 @@ class CareerApp(QWidget):
         main_layout.addWidget(self.stacked_widget)
 
 
-        self.home_page = self.create_home_page()
-        self.survey_page = self.create_survey_page()
-        self.results_page = self.create_results_page()
-        self.job_details_page = self.create_job_details_page() # This page will now be used by the left panel
-        self.history_page = self.create_history_page()
-
-        self.stacked_widget.addWidget(self.home_page)
-        self.stacked_widget.addWidget(self.survey_page)
-        self.stacked_widget.addWidget(self.results_page)
-        self.stacked_widget.addWidget(self.job_details_page)
-        self.stacked_widget.addWidget(self.history_page)
+        # Pages are built on first navigation
+        self.pages = PageRegistry(self.stacked_widget)
+        self.pages.register('home', self.create_home_page)
+        self.pages.register('survey', self.create_survey_page)
+        self.pages.register('results', self.create_results_page)
+        self.pages.register('job_details', self.create_job_details_page) # This page will now be used by the left panel
+        self.pages.register('history', self.create_history_page)
 
         # Start on the main career details page
-        self.stacked_widget.setCurrentIndex(3) # Display job_details_page initially
+        self.pages.show('job_details') # Display job_details_page initially; other pages are built on first visit
 
 
     def create_home_page(self):
@@ -657,6 +261,13 @@ class CareerApp(QWidget):
 
         widget.setStyleSheet("background-color: #EBEBEB;")
 
+        # Decoded in the background; a placeholder is shown until it arrives
+        home_image_label = QLabel()
+        home_image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        dpr = self.devicePixelRatioF()
+        self.pixmap_cache.set_label_image(home_image_label, self.asset_manifest.image('homeimg', HOME_IMAGE, dpr), HOME_IMAGE_SIZE, dpr)
+        layout.addWidget(home_image_label)
+
         title_label = QLabel("ប្រព័ន្ធវិភាគសមត្ថភាព និងផ្តល់យោបល់ការងារ")
         title_label.setFont(QFont("Khmer OS Muol Light", 24))
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -686,7 +297,7 @@ class CareerApp(QWidget):
             "background-color: #2DAF4B; "
             "}"
         )
-        start_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(1)) # Link to survey page directly
+        start_button.clicked.connect(lambda: self.pages.show('survey')) # Link to survey page directly
         layout.addWidget(start_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
         history_button = QPushButton("មើលប្រវត្តិការស្ទង់មតិ") # View survey history
@@ -716,7 +327,7 @@ class CareerApp(QWidget):
             "background-color: #2DAF4B; "
             "}"
         )
-        view_job_types_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(3)) # Link to job details page directly
+        view_job_types_button.clicked.connect(lambda: self.pages.show('job_details')) # Link to job details page directly
         layout.addWidget(view_job_types_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
         layout.addStretch(1)
@@ -769,15 +380,7 @@ class CareerApp(QWidget):
         industry_label = QLabel("ឧស្សាហកម្មដែលពេញចិត្ត:")
         industry_label.setFont(QFont("Khmer OS Siemreap", 12)) # Increased font size
         self.survey_layout.addWidget(industry_label)
-        self.survey_industry_combo = QComboBox()
-        # Updated industry options to cover all new jobs better
-        self.survey_industry_combo.addItems([
-            "IT", "Design", "Management", "Research", "Finance", "Education",
-            "Healthcare", "Public Service", "Legal", "Construction", "Engineering",
-            "Arts", "Marketing", "General"
-        ])
-        self.survey_industry_combo.setFont(QFont("Khmer OS Siemreap", 11))
-        self.survey_industry_combo.setStyleSheet(
+        combo_style = (
             "QComboBox { "
             "padding: 10px; border: 1px solid #a0a0a0; border-radius: 8px; "
             "background-color: #f8f8f8; "
@@ -785,32 +388,24 @@ class CareerApp(QWidget):
             "}"
             "QComboBox::drop-down { border: none; }"
         )
+        self.survey_industry_combo = QComboBox()
+        self.survey_industry_combo.addItems(INDUSTRIES) # Same industry list the recommendation boost uses
+        self.survey_industry_combo.setCurrentText(DEFAULT_INDUSTRY)
+        self.survey_industry_combo.setFont(QFont("Khmer OS Siemreap", 11))
+        self.survey_industry_combo.setStyleSheet(combo_style)
         self.survey_layout.addWidget(self.survey_industry_combo)
-        self.survey_layout.addSpacing(30)
 
-
-        self.questions = [
-            "I enjoy solving complex mathematical problems.",
-            "I find working with numbers and data engaging.",
-            "I am curious about how the natural world and scientific principles work.",
-            "I enjoy learning about new scientific discoveries and theories.",
-            "I enjoy writing code and developing software applications.",
-            "I like to build and troubleshoot computer systems.",
-            "I am interested in artificial intelligence and machine learning.",
-            "I enjoy creating visual designs and artistic layouts.",
-            "I pay attention to user experience and interface aesthetics.",
-            "I enjoy breaking down complex problems into smaller, manageable parts.",
-            "I like to find innovative solutions to challenges.",
-            "I am good at analytical thinking and logical reasoning.",
-            "I am comfortable presenting ideas and information to groups.",
-            "I enjoy collaborating with others to achieve a common goal.",
-            "I can clearly explain complex topics to different audiences.",
-            "I enjoy generating new and original ideas.",
-            "I am comfortable thinking outside the box and experimenting.",
-            "I like to take charge and guide a team towards a goal.",
-            "I am good at organizing tasks and managing resources.",
-            "I enjoy motivating others and resolving conflicts."
-        ]
+        second_industry_label = QLabel("ឧស្សាហកម្មទីពីរ (ស្រេចចិត្ត):") # Second industry (optional)
+        second_industry_label.setFont(QFont("Khmer OS Siemreap", 12))
+        self.survey_layout.addWidget(second_industry_label)
+        self.survey_second_industry_combo = QComboBox()
+        self.survey_second_industry_combo.addItem("-", "") # No second industry
+        for industry in INDUSTRIES:
+            self.survey_second_industry_combo.addItem(industry, industry)
+        self.survey_second_industry_combo.setFont(QFont("Khmer OS Siemreap", 11))
+        self.survey_second_industry_combo.setStyleSheet(combo_style)
+        self.survey_layout.addWidget(self.survey_second_industry_combo)
+        self.survey_layout.addSpacing(30)
 
         self.question_button_groups = {}
 
@@ -864,10 +459,22 @@ class CareerApp(QWidget):
 
         self.survey_layout.addSpacing(30)
 
-        submit_button = QPushButton("បំពេញការស្ទង់មតិ")
-        submit_button.setFont(QFont("Khmer OS Siemreap", 14, QFont.Weight.Bold))
-        submit_button.setFixedSize(250, 55)
-        submit_button.setStyleSheet(
+        # Shown until the model has been loaded or trained in the background
+        self.model_status_label = QLabel("កំពុងរៀបចំម៉ូដែល...") # Preparing the model...
+        self.model_status_label.setFont(QFont("Khmer OS Siemreap", 10))
+        self.model_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.model_status_label.setStyleSheet("color: #555555;")
+        self.survey_layout.addWidget(self.model_status_label)
+        self.model_progress_bar = QProgressBar()
+        self.model_progress_bar.setRange(0, 0) # Busy indicator
+        self.model_progress_bar.setFixedWidth(250)
+        self.model_progress_bar.setTextVisible(False)
+        self.survey_layout.addWidget(self.model_progress_bar, alignment=Qt.AlignmentFlag.AlignCenter)
+
+        self.submit_button = QPushButton("បំពេញការស្ទង់មតិ")
+        self.submit_button.setFont(QFont("Khmer OS Siemreap", 14, QFont.Weight.Bold))
+        self.submit_button.setFixedSize(250, 55)
+        self.submit_button.setStyleSheet(
             "QPushButton { "
             "background-color: #28a745; color: white; border-radius: 27px; "
             "border: none; padding: 10px 20px; "
@@ -875,9 +482,14 @@ class CareerApp(QWidget):
             "QPushButton:hover { "
             "background-color: #218838; "
             "}"
+            "QPushButton:disabled { "
+            "background-color: #a5d6b1; "
+            "}"
         )
-        submit_button.clicked.connect(self.submit_survey)
-        self.survey_layout.addWidget(submit_button, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.submit_button.setEnabled(False)
+        self.submit_button.clicked.connect(self.submit_survey)
+        self.survey_layout.addWidget(self.submit_button, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.update_model_status() # The model may have finished loading before this page was first shown
 
         back_button = QPushButton("ត្រឡប់ទៅទំព័រដើម")
         back_button.setFont(QFont("Khmer OS Siemreap", 11))
@@ -892,7 +504,7 @@ class CareerApp(QWidget):
             "}"
         )
         # Modified back button to go to job_details_page (main view)
-        back_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(3))
+        back_button.clicked.connect(lambda: self.pages.show('job_details'))
         self.survey_layout.addWidget(back_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
         self.survey_layout.addStretch(1)
@@ -929,9 +541,8 @@ class CareerApp(QWidget):
         layout.addWidget(self.recommendation_score_label)
 
         # Pie Chart for Suitable Jobs
-        self.fig, self.ax = plt.subplots(figsize=(7, 4))
-        self.canvas = FigureCanvas(self.fig)
-        layout.addWidget(self.canvas)
+        self.results_chart = create_results_chart(RESULTS_CHART_RENDERER, 'donut', figsize=(7, 4))
+        layout.addWidget(self.results_chart)
         layout.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
 
         self.view_details_button = QPushButton("មើលព័ត៌មានលម្អិតការងារ")
@@ -962,7 +573,7 @@ class CareerApp(QWidget):
             "}"
         )
         # Modified back button to go to job_details_page (main view)
-        back_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(3))
+        back_button.clicked.connect(lambda: self.pages.show('job_details'))
         layout.addWidget(back_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
         return widget
@@ -999,7 +610,7 @@ class CareerApp(QWidget):
         survey_button_clone = QPushButton("បំពេញការស្ទង់មតិ")
         survey_button_clone.setFont(QFont("Khmer OS Siemreap", 11))
         survey_button_clone.setStyleSheet("background-color: #28a745; color: white; padding: 10px; border-radius: 5px;")
-        survey_button_clone.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(1))
+        survey_button_clone.clicked.connect(lambda: self.pages.show('survey'))
         left_layout.addWidget(survey_button_clone)
 
         history_button_clone = QPushButton("មើលប្រវត្តិការស្ទង់មតិ")
@@ -1019,17 +630,24 @@ class CareerApp(QWidget):
         self.search_input_job_details_page.textChanged.connect(self.filter_career_list_job_details_page)
         left_layout.addWidget(self.search_input_job_details_page)
 
-        self.career_list_widget_job_details_page = QListWidget() # Separate list for this page
-        self.career_list_widget_job_details_page.setFont(QFont("Khmer OS Siemreap", 10))
-        self.career_list_widget_job_details_page.setStyleSheet("border: 1px solid #ced4da; border-radius: 4px;")
-        self.career_list_widget_job_details_page.itemClicked.connect(self.on_career_selected) # Re-use the handler
-        left_layout.addWidget(self.career_list_widget_job_details_page)
-        
-        self.populate_career_list_job_details_page() # Populate its own list
+        # Careers are listed once; typing only changes which rows the search proxy accepts
+        self.career_search_index = CareerSearchIndex(JOB_DETAILS)
+        self.career_list_model = QStringListModel(self.career_search_index.careers, self)
+        self.career_filter_model = CareerFilterProxyModel(self.career_search_index, self)
+        self.career_filter_model.setSourceModel(self.career_list_model)
+
+        self.career_list_view_job_details_page = QListView() # Separate list for this page
+        self.career_list_view_job_details_page.setModel(self.career_filter_model)
+        self.career_list_view_job_details_page.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.career_list_view_job_details_page.setFont(QFont("Khmer OS Siemreap", 10))
+        self.career_list_view_job_details_page.setStyleSheet("border: 1px solid #ced4da; border-radius: 4px;")
+        self.career_list_view_job_details_page.clicked.connect(self.on_career_selected) # Re-use the handler
+        self.career_list_view_job_details_page.selectionModel().currentChanged.connect(self.on_career_selected) # Arrow-key browsing
+        left_layout.addWidget(self.career_list_view_job_details_page)
 
         left_layout.addStretch(1)
         self.left_panel_for_stacked_widget.setFixedWidth(300)
-        self.career_list_widget_job_details_page.setMinimumHeight(250)
+        self.career_list_view_job_details_page.setMinimumHeight(250)
         main_h_layout.addWidget(self.left_panel_for_stacked_widget)
 
 
@@ -1039,6 +657,64 @@ class CareerApp(QWidget):
         self.detailed_job_display_layout.setContentsMargins(20, 20, 20, 20)
         self.detailed_job_display_layout.setSpacing(15)
 
+        # The detail widgets are built once; selecting a career only changes their text and image
+        self.job_details_view = QWidget()
+        details_layout = QVBoxLayout(self.job_details_view)
+        details_layout.setContentsMargins(0, 0, 0, 0)
+        details_layout.setSpacing(15)
+
+        # Job Title
+        self.job_title_label = QLabel()
+        self.job_title_label.setFont(QFont("Khmer OS Muol Light", 16, QFont.Weight.Bold))
+        self.job_title_label.setStyleSheet("color: #007bff; margin-bottom: 10px;") # Removed border and padding
+        self.job_title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        details_layout.addWidget(self.job_title_label)
+
+        # Image Display - Moved here, and border removed
+        self.job_image_label = QLabel()
+        self.job_image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.job_image_label.setStyleSheet("margin-bottom: 15px;") # Keep some margin below it
+        details_layout.addWidget(self.job_image_label)
+
+        def add_section(title, height):
+            section_label = QLabel(title)
+            section_label.setFont(QFont("Khmer OS Siemreap", 12, QFont.Weight.Bold))
+            details_layout.addWidget(section_label)
+            section_text = QTextEdit()
+            section_text.setReadOnly(True)
+            section_text.setFont(QFont("Khmer OS Siemreap", 11))
+            section_text.setFixedHeight(height)
+            section_text.setStyleSheet("background-color: #f0f0f0; border-radius: 5px; padding: 10px;")
+            details_layout.addWidget(section_text)
+            return section_text
+
+        self.job_section_texts = {
+            'description': add_section("អំពីការងារ:", 120), # Description
+            'skills': add_section("តម្រូវការជំនាញនេះ:", 100), # Skill Requirements
+            'schools': add_section("សាលាដែលមានបង្រៀនជំនាញនេះ:", 80), # Schools
+            'companies': add_section("ក្រុមហ៊ុនដែលអាចរកការងារនេះបានមាន:", 100), # Example Companies
+        }
+
+        # Salary Range
+        salary_label = QLabel("ប្រាក់ខែដែលអាចទទួលបាន:")
+        salary_label.setFont(QFont("Khmer OS Siemreap", 12, QFont.Weight.Bold))
+        details_layout.addWidget(salary_label)
+        self.job_salary_label = QLabel()
+        self.job_salary_label.setFont(QFont("Khmer OS Siemreap", 11))
+        details_layout.addWidget(self.job_salary_label)
+
+        self.detailed_job_display_layout.addWidget(self.job_details_view)
+        self.job_details_view.hide() # Shown once a career is selected
+
+        self.no_job_selected_label = QLabel("សូមជ្រើសរើសប្រភេទការងារពីបញ្ជីខាងឆ្វេង។")
+        self.no_job_selected_label.setFont(QFont("Khmer OS Siemreap", 12))
+        self.no_job_selected_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.detailed_job_display_layout.addWidget(self.no_job_selected_label)
+        self.detailed_job_display_layout.addStretch(1)
+
+        self.rendered_job_details = {} # career -> rendered text and documents of each section
+        self.displayed_career = None
+
         self.scroll_area_right_panel = QScrollArea()
         self.scroll_area_right_panel.setWidgetResizable(True)
         self.scroll_area_right_panel.setWidget(right_content_widget)
@@ -1048,137 +724,68 @@ class CareerApp(QWidget):
 
         if JOB_DETAILS:
             # Display details for the first job by default
-            first_job = sorted(JOB_DETAILS.keys())[0]
+            first_job = CATALOG.names[0]
             self.display_job_details(first_job)
 
         return widget
 
-    def populate_career_list_job_details_page(self):
-        """Populates the list widget on the job details page."""
-        self.career_list_widget_job_details_page.clear()
-        for career in sorted(JOB_DETAILS.keys()):
-            self.career_list_widget_job_details_page.addItem(career)
-
     def filter_career_list_job_details_page(self, text):
-        """Filters the career list on the job details page."""
-        self.career_list_widget_job_details_page.clear()
-        for career in sorted(JOB_DETAILS.keys()):
-            if text.lower() in career.lower():
-                self.career_list_widget_job_details_page.addItem(career)
-
-    def on_career_selected(self, item):
-        """Handler for when a career is selected from the list."""
-        career_name = item.text()
+        """Filters the career list on the job details page by a full-text search of the catalog."""
+        self.career_filter_model.set_query(text)
+
+    def on_career_selected(self, index, previous=None):
+        """Handler for when a career is selected from the list, by click or with the arrow keys."""
+        if not index.isValid():
+            return
+        career_name = index.data()
         self.display_job_details(career_name)
 
+    def render_job_details(self, career_name, details):
+        """
+        Renders a career's detail view once: the rich-text sections are parsed into
+        QTextDocuments that the text boxes can be switched to without re-parsing.
+        """
+        rendered = render_job_details_html(career_name, details)
+        for section, text_edit in self.job_section_texts.items():
+            document = QTextDocument(self)
+            document.setDefaultFont(text_edit.font())
+            document.setHtml(rendered[section])
+            rendered[section] = document
+        return rendered
+
     def display_job_details(self, career_name):
         """
-        Populates the detailed job display area with information for the given career,
-        including its associated image.
+        Shows the given career in the detail view, including its associated image.
+        Only the text, documents and image of the persistent widgets change; each career
+        is rendered once and cached.
         """
-        # Clear existing content
-        for i in reversed(range(self.detailed_job_display_layout.count())):
-            widget = self.detailed_job_display_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-
-        if career_name in JOB_DETAILS:
-            details = JOB_DETAILS[career_name]
-
-            # Job Title
-            job_title_label = QLabel(f"ព័ត៌មានលម្អិតសម្រាប់៖ {career_name}")
-            job_title_label.setFont(QFont("Khmer OS Muol Light", 16, QFont.Weight.Bold))
-            job_title_label.setStyleSheet("color: #007bff; margin-bottom: 10px;") # Removed border and padding
-            job_title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.detailed_job_display_layout.addWidget(job_title_label)
-
-            # Image Display - Moved here, and border removed
-            if 'image_path' in details and details['image_path']:
-                job_image_label = QLabel()
-                pixmap = QPixmap(details['image_path']).scaled(400, 200, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                if pixmap.isNull():
-                    print(f"Error: Could not load image for {career_name} from {details['image_path']}.")
-                job_image_label.setPixmap(pixmap)
-                job_image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                job_image_label.setStyleSheet("margin-bottom: 15px;") # Keep some margin below it
-                self.detailed_job_display_layout.addWidget(job_image_label)
-            else:
-                # Add a placeholder if no image path is provided
-                no_image_label = QLabel("រូបភាពមិនមាន")
-                # Corrected: Pass True for italic directly
-                no_image_label.setFont(QFont("Khmer OS Siemreap", 12, QFont.Weight.Normal, True)) 
-                no_image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                no_image_label.setStyleSheet("color: #888; margin-bottom: 15px;")
-                self.detailed_job_display_layout.addWidget(no_image_label)
-
-
-            # Description
-            desc_label = QLabel("អំពីការងារ:")
-            desc_label.setFont(QFont("Khmer OS Siemreap", 12, QFont.Weight.Bold))
-            self.detailed_job_display_layout.addWidget(desc_label)
-            description_text = QTextEdit()
-            description_text.setReadOnly(True)
-            description_text.setFont(QFont("Khmer OS Siemreap", 11))
-            description_text.setHtml(f"<p>{details['description']}</p>")
-            description_text.setFixedHeight(120)
-            description_text.setStyleSheet("background-color: #f0f0f0; border-radius: 5px; padding: 10px;")
-            self.detailed_job_display_layout.addWidget(description_text)
-
-            # Skill Requirements
-            skills_label = QLabel("តម្រូវការជំនាញនេះ:")
-            skills_label.setFont(QFont("Khmer OS Siemreap", 12, QFont.Weight.Bold))
-            self.detailed_job_display_layout.addWidget(skills_label)
-            skills_text = QTextEdit()
-            skills_text.setReadOnly(True)
-            skills_text.setFont(QFont("Khmer OS Siemreap", 11))
-            skills_list = "".join([f"<li>{skill}</li>" for skill in details.get('skills', [])])
-            skills_text.setHtml(f"<ul>{skills_list}</ul>")
-            skills_text.setFixedHeight(100)
-            skills_text.setStyleSheet("background-color: #f0f0f0; border-radius: 5px; padding: 10px;")
-            self.detailed_job_display_layout.addWidget(skills_text)
-
-            # Schools
-            schools_label = QLabel("សាលាដែលមានបង្រៀនជំនាញនេះ:")
-            schools_label.setFont(QFont("Khmer OS Siemreap", 12, QFont.Weight.Bold))
-            self.detailed_job_display_layout.addWidget(schools_label)
-            schools_text = QTextEdit()
-            schools_text.setReadOnly(True)
-            schools_text.setFont(QFont("Khmer OS Siemreap", 11))
-            schools_list = "".join([f"<li>{school}</li>" for school in details.get('schools', [])])
-            schools_text.setHtml(f"<ul>{schools_list}</ul>")
-            schools_text.setFixedHeight(80)
-            schools_text.setStyleSheet("background-color: #f0f0f0; border-radius: 5px; padding: 10px;")
-            self.detailed_job_display_layout.addWidget(schools_text)
-
-
-            # Example Companies
-            companies_label = QLabel("ក្រុមហ៊ុនដែលអាចរកការងារនេះបានមាន:")
-            companies_label.setFont(QFont("Khmer OS Siemreap", 12, QFont.Weight.Bold))
-            self.detailed_job_display_layout.addWidget(companies_label)
-            companies_text = QTextEdit()
-            companies_text.setReadOnly(True)
-            companies_text.setFont(QFont("Khmer OS Siemreap", 11))
-            companies_list = "".join([f"<li>{company}</li>" for company in details.get('companies', [])])
-            companies_text.setHtml("<ul>" + companies_list + "</ul>")
-            companies_text.setFixedHeight(100)
-            companies_text.setStyleSheet("background-color: #f0f0f0; border-radius: 5px; padding: 10px;")
-            self.detailed_job_display_layout.addWidget(companies_text)
-
-            # Salary Range
-            salary_label = QLabel("ប្រាក់ខែដែលអាចទទួលបាន:")
-            salary_label.setFont(QFont("Khmer OS Siemreap", 12, QFont.Weight.Bold))
-            self.detailed_job_display_layout.addWidget(salary_label)
-            salary_value_label = QLabel(details['salary_range'])
-            salary_value_label.setFont(QFont("Khmer OS Siemreap", 11))
-            self.detailed_job_display_layout.addWidget(salary_value_label)
-            
-        else:
-            no_details_label = QLabel("សូមជ្រើសរើសប្រភេទការងារពីបញ្ជីខាងឆ្វេង។")
-            no_details_label.setFont(QFont("Khmer OS Siemreap", 12))
-            no_details_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.detailed_job_display_layout.addWidget(no_details_label)
+        if career_name == self.displayed_career:
+            return
+        details = JOB_DETAILS.get(career_name)
+        if details is None:
+            self.displayed_career = None
+            self.job_details_view.hide()
+            self.no_job_selected_label.show()
+            return
 
-        self.detailed_job_display_layout.addStretch(1)
+        rendered = self.rendered_job_details.get(career_name)
+        if rendered is None:
+            rendered = self.rendered_job_details[career_name] = self.render_job_details(career_name, details)
+        self.job_title_label.setText(rendered['title'])
+        for section, text_edit in self.job_section_texts.items():
+            text_edit.setDocument(rendered[section])
+        self.job_salary_label.setText(rendered['salary'])
+
+        dpr = self.devicePixelRatioF()
+        image_path = self.asset_manifest.career_image(career_name, JOB_IMAGE, dpr)
+        self.pixmap_cache.set_label_image(self.job_image_label, image_path, JOB_IMAGE_SIZE, dpr)
+        if image_path is None:
+            self.job_image_label.setText("រូបភាពមិនមាន") # No image for this career
+
+        self.displayed_career = career_name
+        self.no_job_selected_label.hide()
+        self.job_details_view.show()
+        self.scroll_area_right_panel.verticalScrollBar().setValue(0)
 
 
     def create_history_page(self):
@@ -1194,11 +801,26 @@ class CareerApp(QWidget):
         header_label.setStyleSheet("color: #2c3e50; margin-bottom: 25px;")
         layout.addWidget(header_label)
 
+        # Rows are fetched page by page as the table scrolls
+        self.history_model = HistoryTableModel(self.repository, self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
+        self.history_table.setFont(QFont("Khmer OS Siemreap", 10))
+        self.history_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.history_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.history_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.history_table.verticalHeader().setVisible(False)
+        self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.history_table.setStyleSheet("background-color: #f8f8f8; border-radius: 10px;")
+        self.history_table.selectionModel().currentRowChanged.connect(self.display_history_breakdown)
+        layout.addWidget(self.history_table, 2)
+
+        # Per-question answers of the selected row, loaded on demand
         self.history_text_area = QTextEdit()
         self.history_text_area.setReadOnly(True)
         self.history_text_area.setFont(QFont("Khmer OS Siemreap", 10))
         self.history_text_area.setStyleSheet("background-color: #f8f8f8; border-radius: 10px; padding: 15px;")
-        layout.addWidget(self.history_text_area)
+        layout.addWidget(self.history_text_area, 1)
 
         back_button = QPushButton("ត្រឡប់ទៅទំព័រដើម")
         back_button.setFont(QFont("Khmer OS Siemreap", 11))
@@ -1212,60 +834,50 @@ class CareerApp(QWidget):
             "background-color: #5a6268; "
             "}"
         )
-        back_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(3)) # Back to main job details view
+        back_button.clicked.connect(lambda: self.pages.show('job_details')) # Back to main job details view
         layout.addWidget(back_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
         return widget
 
     def show_history_page(self):
-        """Populates and displays the history page."""
+        """Reloads the first page of history and displays the history page."""
+        self.pages.page('history') # Built on first use
         self.history_text_area.clear()
-        conn = sqlite3.connect(DATABASE_NAME)
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, student_name, preferred_industry, recommended_career, recommendation_score, timestamp, raw_survey_responses FROM survey_responses ORDER BY timestamp DESC")
-        results = cursor.fetchall()
-        conn.close()
+        self.history_model.reload()
 
-        if not results:
+        if self.history_model.rowCount() == 0:
             self.history_text_area.setText("មិនទាន់មានទិន្នន័យប្រវត្តិស្ទង់មតិនៅឡើយទេ។")
             self.history_text_area.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        else:
-            history_html = "<h3>ប្រវត្តិនៃលទ្ធផលការស្ទង់មតិ:</h3><br>"
-            for i, row in enumerate(results):
-                id, student_name, preferred_industry, recommended_career, recommendation_score, timestamp, raw_survey_responses_json = row
-                
-                history_html += (
-                    f"<div style='margin-bottom: 20px; padding: 15px; border: 1px solid #e0e0e0; border-radius: 8px; background-color: #f9f9f9;'>"
-                    f"<strong>ID:</strong> {id}<br>"
-                    f"<strong>ឈ្មោះនិស្សិត:</strong> {student_name}<br>"
-                    f"<strong>ឧស្សាហកម្មពេញចិត្ត:</strong> {preferred_industry}<br>"
-                    f"<strong>អាជីពណែនាំ:</strong> {recommended_career}<br>"
-                    f"<strong>អត្រាសមត្ថភាព:</strong> {recommendation_score:.2f}%<br>"
-                    f"<strong>កាលបរិច្ឆេទ:</strong> {timestamp}<br>"
-                )
 
-                if raw_survey_responses_json:
-                    history_html += "<br><strong>ចម្លើយស្ទង់មតិ:</strong><br>"
-                    raw_responses = json.loads(raw_survey_responses_json)
-                    sorted_q_keys = sorted(raw_responses.keys(), key=lambda x: int(x[1:]))
-                    for q_key in sorted_q_keys:
-                        q_num = int(q_key[1:])
-                        question_text = self.questions[q_num - 1] if q_num <= len(self.questions) else f"សំណួរ {q_num}"
-                        
-                        response_value = raw_responses[q_key]
-                        response_map = {
-                            1: "Strongly Disagree", 2: "Disagree", 3: "Slightly Disagree",
-                            4: "Neutral", 5: "Slightly Agree", 6: "Agree", 7: "Strongly Agree"
-                        }
-                        display_response = response_map.get(response_value, f"Value ({response_value})")
-
-                        history_html += f"&nbsp;&nbsp;&nbsp;&nbsp;<strong>សំណួរ {q_num}:</strong> {question_text}<br>"
-                        history_html += f"&nbsp;&nbsp;&nbsp;&nbsp;<strong>ចម្លើយ:</strong> {display_response} ({response_value})<br>"
-                history_html += "</div>"
-            self.history_text_area.setHtml(history_html)
-            self.history_text_area.setAlignment(Qt.AlignmentFlag.AlignLeft)
-
-        self.stacked_widget.setCurrentIndex(4)
+        self.pages.show('history')
+
+    def display_history_breakdown(self, current, previous=None):
+        """Fetches and shows the per-question answers for the selected history row."""
+        if not current.isValid():
+            self.history_text_area.clear()
+            return
+        record = self.history_model.record(current.row())
+        raw_responses = self.repository.submission_answers(record.id)
+
+        history_html = (
+            f"<strong>ID:</strong> {record.id}<br>"
+            f"<strong>ឈ្មោះនិស្សិត:</strong> {record.student_name}<br>"
+            f"<strong>អាជីពណែនាំ:</strong> {record.recommended_career}<br>"
+        )
+        if raw_responses:
+            history_html += "<br><strong>ចម្លើយស្ទង់មតិ:</strong><br>"
+            sorted_q_keys = sorted(raw_responses.keys(), key=lambda x: int(x[1:]))
+            for q_key in sorted_q_keys:
+                q_num = int(q_key[1:])
+                question_text = self.questions[q_num - 1] if q_num <= len(self.questions) else f"សំណួរ {q_num}"
+
+                response_value = raw_responses[q_key]
+                display_response = RESPONSE_LABELS.get(response_value, f"Value ({response_value})")
+
+                history_html += f"&nbsp;&nbsp;&nbsp;&nbsp;<strong>សំណួរ {q_num}:</strong> {question_text}<br>"
+                history_html += f"&nbsp;&nbsp;&nbsp;&nbsp;<strong>ចម្លើយ:</strong> {display_response} ({response_value})<br>"
+        self.history_text_area.setHtml(history_html)
+        self.history_text_area.setAlignment(Qt.AlignmentFlag.AlignLeft)
 
 
     def show_results_page(self, student_name, recommended_career, recommendation_score, top_careers_for_display):
@@ -1273,71 +885,46 @@ class CareerApp(QWidget):
         Switches to the results page and displays the recommendation.
         Also updates the visualization to a pie chart.
         """
+        self.pages.page('results') # Built on first use
         self.results_student_name_label.setText(f"ឈ្មោះនិស្សិត: {student_name}")
         self.recommended_career_label.setText(f"អាជីពដែលបានណែនាំ: {recommended_career}")
         self.recommendation_score_label.setText(f"អត្រាសមត្ថភាព: {recommendation_score:.2f}%")
 
-        self.ax.clear()
+        self.results_chart.set_top_careers(top_careers_for_display)
+        self.pages.show('results')
 
-        labels = [f"{career} ({score:.1f}%)" for career, score in top_careers_for_display]
-        sizes = [score for career, score in top_careers_for_display]
-        
-        if not sizes or sum(sizes) == 0:
-            self.ax.text(0.5, 0.5, "មិនមានទិន្នន័យគ្រប់គ្រាន់សម្រាប់បង្ហាញក្រាហ្វិកទេ។",
-                         horizontalalignment='center', verticalalignment='center',
-                         transform=self.ax.transAxes, fontsize=12, color='gray')
-            self.ax.set_xticks([])
-            self.ax.set_yticks([])
-        else:
-            sizes = [max(0, s) for s in sizes]
-            total_size = sum(sizes)
-            if total_size == 0:
-                self.ax.text(0.5, 0.5, "មិនមានទិន្នន័យគ្រប់គ្រាន់សម្រាប់បង្ហាញក្រាហ្វិកទេ។",
-                             horizontalalignment='center', verticalalignment='center',
-                             transform=self.ax.transAxes, fontsize=12, color='gray')
-                self.ax.set_xticks([])
-                self.ax.set_yticks([])
-            else:
-                colors = plt.cm.Paired(np.linspace(0, 1, len(labels)))
-                
-                wedges, texts, autotexts = self.ax.pie(sizes, autopct='%1.1f%%', startangle=90, colors=colors,
-                                                       pctdistance=0.85,
-                                                       wedgeprops=dict(width=0.4, edgecolor='w'))
-
-                for autotext in autotexts:
-                    autotext.set_color('white')
-                    autotext.set_fontsize(10)
-                    autotext.set_fontweight('bold')
-
-                self.ax.legend(wedges, labels,
-                               title="Careers",
-                               loc="center left",
-                               bbox_to_anchor=(1, 0, 0.5, 1))
-                
-                self.ax.axis('equal')
-        
-        self.fig.tight_layout()
-        self.canvas.draw()
-        self.stacked_widget.setCurrentIndex(2)
+        # Warm the image cache for the careers the student is most likely to open next
+        top_careers = [career for career, score in top_careers_for_display]
+        QTimer.singleShot(0, lambda: self.prefetch_career_images(top_careers))
+
+    def prefetch_career_images(self, careers):
+        """Decodes and scales the job details images of the given careers ahead of time."""
+        dpr = self.devicePixelRatioF()
+        paths = [self.asset_manifest.career_image(career, JOB_IMAGE, dpr) for career in careers]
+        self.pixmap_cache.prefetch([path for path in paths if path], JOB_IMAGE_SIZE, dpr)
 
     def show_job_details_for_recommended_career(self):
         """
         Switches to the job details page and automatically displays the details
         for the most recently recommended career.
         """
-        conn = sqlite3.connect(DATABASE_NAME)
-        cursor = conn.cursor()
-        cursor.execute("SELECT recommended_career FROM survey_responses ORDER BY timestamp DESC LIMIT 1")
-        last_recommended_career = cursor.fetchone()
-        conn.close()
+        last_recommended_career = self.repository.latest_recommendation()
 
         if last_recommended_career:
-            self.display_job_details(last_recommended_career[0])
-            self.stacked_widget.setCurrentIndex(3)
+            self.display_job_details(last_recommended_career)
+            self.pages.show('job_details')
         else:
             QMessageBox.information(self, "No Recommendation Yet", "សូមបំពេញការស្ទង់មតិជាមុនសិន ដើម្បីទទួលបានការណែនាំអាជីព។")
 
 
+    def selected_industry_preferences(self):
+        """Returns the preferred industries as a preference string: the first choice, weighted above the optional second one."""
+        weights = {self.survey_industry_combo.currentText(): FIRST_INDUSTRY_WEIGHT}
+        second_industry = self.survey_second_industry_combo.currentData()
+        if second_industry and second_industry not in weights:
+            weights[second_industry] = SECOND_INDUSTRY_WEIGHT
+        return format_industry_preferences(weights)
+
     def submit_survey(self):
         """Collects survey responses, processes them, and displays results."""
         student_name = self.student_name_input.text().strip()
@@ -1359,25 +946,20 @@ class CareerApp(QWidget):
             QMessageBox.warning(self, "Missing Responses", "សូមឆ្លើយគ្រប់សំណួរទាំងអស់។")
             return
 
-        preferred_industry = self.survey_industry_combo.currentText()
+        preferred_industry = self.selected_industry_preferences()
 
         # Get ML recommendation
         recommended_career, recommendation_score, top_careers_for_display = \
-            get_ml_career_recommendation(
+            self.recommendation_cache.recommend(
                 self.ml_model, self.feature_names, self.career_outcomes,
-                raw_responses, preferred_industry
+                raw_responses, preferred_industry, top_n=TOP_CAREERS_SHOWN
             )
 
         # Save to database
         try:
-            conn = sqlite3.connect(DATABASE_NAME)
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO survey_responses (student_name, raw_survey_responses, preferred_industry, recommended_career, recommendation_score) VALUES (?, ?, ?, ?, ?)",
-                (student_name, json.dumps(raw_responses), preferred_industry, recommended_career, recommendation_score)
+            self.repository.insert_submission(
+                student_name, raw_responses, preferred_industry, recommended_career, recommendation_score
             )
-            conn.commit()
-            conn.close()
             QMessageBox.information(self, "Submission Successful", "ការស្ទង់មតិត្រូវបានដាក់ស្នើដោយជោគជ័យ!")
             self.show_results_page(student_name, recommended_career, top_careers_for_display[0][1], top_careers_for_display) # Pass the score of the top career for display
         except sqlite3.Error as e:
@@ -0,0 +1,179 @@
+from collections import OrderedDict
+
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
+
+# Enough for every career image at each display size with room to spare
+DEFAULT_MAX_ENTRIES = 64
+# Decoding is I/O and CPU bound per image; two workers keep up with fast career switching
+DECODE_THREADS = 2
+# Shown in an image label while its image is decoded in the background
+LOADING_TEXT = "កំពុងផ្ទុករូបភាព..."
+MISSING_TEXT = "Image Not Found"
+
+
+def decode_scaled_image(path, size, device_pixel_ratio=1.0):
+    """
+    Decodes the image at path straight to the size that fits size (in device-independent
+    pixels) at device_pixel_ratio. Formats whose decoder supports scaled decoding (JPEG)
+    never allocate the full-resolution bitmap; others are scaled by the reader after decoding.
+    Safe to call from any thread. Returns a null QImage if the file could not be read.
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if source_size.isValid():
+        target = QSize(round(size.width() * device_pixel_ratio), round(size.height() * device_pixel_ratio))
+        reader.setScaledSize(source_size.scaled(target, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if not image.isNull():
+        image.setDevicePixelRatio(device_pixel_ratio)
+    return image
+
+
+class ImageDecodeTask(QRunnable):
+    """Decodes one image on a thread pool worker and hands it to the cache's decoded signal."""
+
+    def __init__(self, cache, key):
+        super().__init__()
+        self.cache = cache
+        self.key = key
+
+    def run(self):
+        path, width, height, device_pixel_ratio = self.key
+        image = decode_scaled_image(path, QSize(width, height), device_pixel_ratio)
+        self.cache.decoded.emit(self.key, image)
+
+
+class PixmapCache(QObject):
+    """
+    Bounded LRU cache of decoded, pre-scaled pixmaps keyed by
+    (path, target width, target height, device pixel ratio).
+    Files that fail to load are cached as null pixmaps so they are not retried on every view.
+    Images can be fetched synchronously with get() or decoded on a background thread with request().
+    Must be used from the GUI thread.
+    """
+    decoded = pyqtSignal(object, QImage)
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, parent=None):
+        super().__init__(parent)
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.pending = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(DECODE_THREADS)
+        self.decoded.connect(self._on_decoded, Qt.ConnectionType.QueuedConnection)
+
+    @staticmethod
+    def _key(path, size, device_pixel_ratio):
+        return (path, size.width(), size.height(), device_pixel_ratio)
+
+    def _lookup(self, key):
+        pixmap = self.entries.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return pixmap
+
+    def _store(self, key, pixmap):
+        self.entries[key] = pixmap
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, path, size, device_pixel_ratio=1.0):
+        """
+        Returns the image at path scaled to fit size (in device-independent pixels),
+        decoding and scaling it only on a cache miss. The result is null if the file could not be loaded.
+        """
+        key = self._key(path, size, device_pixel_ratio)
+        pixmap = self._lookup(key)
+        if pixmap is not None:
+            return pixmap
+
+        self.misses += 1
+        pixmap = QPixmap.fromImage(decode_scaled_image(path, size, device_pixel_ratio))
+        self._store(key, pixmap)
+        return pixmap
+
+    def request(self, path, size, device_pixel_ratio=1.0, callback=None):
+        """
+        Calls callback(pixmap) with the scaled image at path: immediately if it is cached,
+        otherwise once a background worker has decoded it. Requests for an image already being
+        decoded share that decode.
+
+        Returns:
+            bool: True if callback was called immediately from the cache.
+        """
+        key = self._key(path, size, device_pixel_ratio)
+        pixmap = self._lookup(key)
+        if pixmap is not None:
+            if callback:
+                callback(pixmap)
+            return True
+
+        callbacks = self.pending.get(key)
+        if callbacks is None:
+            self.misses += 1
+            callbacks = self.pending[key] = []
+            self.thread_pool.start(ImageDecodeTask(self, key))
+        if callback:
+            callbacks.append(callback)
+        return False
+
+    @pyqtSlot(object, QImage)
+    def _on_decoded(self, key, image):
+        # QPixmap may only be created on the GUI thread, so the worker hands over a QImage
+        if image.isNull():
+            print(f"Error: Could not load image from {key[0]}.")
+        pixmap = QPixmap.fromImage(image)
+        self._store(key, pixmap)
+        for callback in self.pending.pop(key, []):
+            callback(pixmap)
+
+    def set_label_image(self, label, path, size, device_pixel_ratio=1.0):
+        """
+        Shows the image at path in label, with a loading placeholder until it is decoded.
+        If the label has since been given another image, or deleted, the stale result is dropped.
+        A path of None (no image for this item) shows the missing-image text.
+        """
+        label.setProperty('image_path', path)
+        if path is None:
+            label.clear()
+            label.setText(MISSING_TEXT)
+            return
+
+        def apply(pixmap):
+            if sip.isdeleted(label) or label.property('image_path') != path:
+                return
+            if pixmap.isNull():
+                label.setText(MISSING_TEXT)
+            else:
+                label.setPixmap(pixmap)
+
+        if not self.request(path, size, device_pixel_ratio, apply):
+            label.clear()
+            label.setText(LOADING_TEXT)
+
+    def prefetch(self, paths, size, device_pixel_ratio=1.0):
+        """Decodes and scales any of paths not already cached in the background, so their first view is instant."""
+        for path in paths:
+            if self._key(path, size, device_pixel_ratio) not in self.entries:
+                self.request(path, size, device_pixel_ratio)
+
+    def wait_for_pending(self):
+        """Blocks until every background decode has finished; call before the application exits."""
+        self.thread_pool.waitForDone()
+
+    def stats(self):
+        """Returns hit/miss/eviction counters and the current number of entries."""
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'entries': len(self.entries)}
+
+    def clear(self):
+        """Drops every cached pixmap; counters are kept."""
+        self.entries.clear()
@@ -0,0 +1,109 @@
+import os
+import re
+import json
+import pickle
+import tempfile
+
+# --- Career Catalog Setup ---
+# The catalog (descriptions, salaries, skills, schools, companies, images and industries of
+# every career) lives in careers.json next to this module; edit that file, not code.
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_PATH = os.path.join(PROJECT_DIR, 'careers.json')
+CATALOG_FORMAT_VERSION = 1
+
+# Parsed catalog and its derived structures, reused while careers.json is unchanged
+CACHE_PATH = os.path.join(PROJECT_DIR, '__pycache__', 'careers.catalog.pickle')
+CACHE_FORMAT_VERSION = 1
+
+# "$11,000 - $40,000 per year (Annual)" -> (11000, 40000)
+SALARY_RANGE_PATTERN = re.compile(r'\$([\d,]+)\s*-\s*\$([\d,]+)')
+
+
+def parse_salary_range(salary_range):
+    """Returns (low, high) in US dollars per year, or None if salary_range has no "$low - $high" range."""
+    match = SALARY_RANGE_PATTERN.search(salary_range or '')
+    if match is None:
+        return None
+    return tuple(int(amount.replace(',', '')) for amount in match.groups())
+
+
+class CareerCatalog:
+    """
+    The career catalog with the structures derived from it, computed once per catalog file.
+
+    Attributes:
+        details (dict): career name -> details, in file order
+        names (list): career names, sorted
+        industry_mapping (dict): career name -> list of industries it belongs to
+        industries (list): every industry named in the catalog, sorted
+        salary_ranges (dict): career name -> (low, high) yearly salary, for parsable ranges
+    """
+
+    def __init__(self, details):
+        self.details = details
+        self.names = sorted(details)
+        self.industry_mapping = {name: list(career.get('industries', [])) for name, career in details.items()}
+        self.industries = sorted({industry for industries in self.industry_mapping.values() for industry in industries})
+        self.salary_ranges = {}
+        for name, career in details.items():
+            salary_range = parse_salary_range(career.get('salary_range'))
+            if salary_range is not None:
+                self.salary_ranges[name] = salary_range
+
+
+def _file_key(path):
+    status = os.stat(path)
+    return (CACHE_FORMAT_VERSION, os.path.abspath(path), status.st_mtime_ns, status.st_size)
+
+def read_catalog_file(path=CATALOG_PATH):
+    """Parses the catalog JSON file and returns a CareerCatalog. Raises ValueError if the file is not a catalog."""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get('format_version') != CATALOG_FORMAT_VERSION:
+        raise ValueError(f"{path}: not a career catalog (format version {CATALOG_FORMAT_VERSION} expected)")
+    return CareerCatalog(data['careers'])
+
+def _read_cache(cache_path, key):
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, catalog = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError, TypeError):
+        return None
+    return catalog if cached_key == key else None
+
+def _write_cache(cache_path, key, catalog):
+    # Written atomically, like the model artifact, so a concurrent reader never sees half a file
+    directory = os.path.dirname(cache_path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.careers-', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((key, catalog), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def load_catalog(path=CATALOG_PATH, cache_path=CACHE_PATH):
+    """
+    Returns the CareerCatalog of the catalog file at path. The parsed catalog is cached in a
+    binary file keyed by the catalog's modification time and size, so the JSON is parsed and
+    the derived structures are rebuilt only after the catalog has been edited.
+    """
+    key = _file_key(path)
+    catalog = _read_cache(cache_path, key)
+    if catalog is not None:
+        return catalog
+
+    catalog = read_catalog_file(path)
+    try:
+        _write_cache(cache_path, key, catalog)
+    except OSError as e:
+        print(f"Warning: could not write career catalog cache {cache_path}: {e}")
+    return catalog
+
+
+# --- JOB DETAILS ---
+CATALOG = load_catalog()
+JOB_DETAILS = CATALOG.details
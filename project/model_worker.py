@@ -0,0 +1,25 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from career_model import MODEL_ARTIFACT_PATH, load_career_model
+
+
+class ModelLoaderThread(QThread):
+    """
+    Loads (or, when the artifact is stale, trains) the career model off the UI thread.
+    Emits model_ready(ml_model, feature_names, career_outcomes) on success and
+    failed(message) if the model could not be prepared.
+    """
+    model_ready = pyqtSignal(object, object, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, artifact_path=MODEL_ARTIFACT_PATH, parent=None):
+        super().__init__(parent)
+        self.artifact_path = artifact_path
+
+    def run(self):
+        try:
+            ml_model, feature_names, career_outcomes = load_career_model(self.artifact_path)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.model_ready.emit(ml_model, feature_names, career_outcomes)
@@ -0,0 +1,39 @@
+import time
+
+
+class PageRegistry:
+    """
+    Builds the pages of a QStackedWidget on first navigation instead of all at start-up.
+    Each page is registered by name with a factory that returns its widget; a page that is
+    never shown is never built. How long each page took to build is kept in build_times and
+    printed, so a page that becomes expensive to build shows up straight away.
+    """
+
+    def __init__(self, stacked_widget):
+        self.stacked_widget = stacked_widget
+        self.factories = {}
+        self.pages = {}
+        self.build_times = {}
+
+    def register(self, name, factory):
+        """Registers factory() as the builder of page name; nothing is built yet."""
+        self.factories[name] = factory
+
+    def is_built(self, name):
+        return name in self.pages
+
+    def page(self, name):
+        """Returns the widget of page name, building it and adding it to the stack on first use."""
+        widget = self.pages.get(name)
+        if widget is None:
+            start_time = time.perf_counter()
+            widget = self.factories[name]()
+            self.stacked_widget.addWidget(widget)
+            self.build_times[name] = time.perf_counter() - start_time
+            self.pages[name] = widget
+            print(f"Built {name} page in {self.build_times[name] * 1000:.1f} ms.")
+        return widget
+
+    def show(self, name):
+        """Builds page name if needed and makes it the current page."""
+        self.stacked_widget.setCurrentWidget(self.page(name))
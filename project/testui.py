@@ -1,597 +1,64 @@
 import sys
 import sqlite3
-import pandas as pd
-import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QComboBox, QScrollArea, QFrame, QMessageBox,
     QTextEdit, QStackedWidget, QRadioButton, QButtonGroup, QSpacerItem, QSizePolicy,
+    QProgressBar,
     QListWidget # Added for the left panel career list
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont, QColor, QPalette, QBrush, QLinearGradient, QPixmap
-
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-
-import json
-from collections import defaultdict
-
-# --- Scikit-learn imports ---
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
-from sklearn.tree import DecisionTreeClassifier
-
-# --- Database Setup ---
-DATABASE_NAME = 'career_data.db'
-
-def init_db():
-    """Initializes the SQLite database and creates the survey_responses table."""
-    conn = sqlite3.connect(DATABASE_NAME)
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS survey_responses (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_name TEXT NOT NULL,
-            raw_survey_responses TEXT,
-            preferred_industry TEXT,
-            recommended_career TEXT,
-            recommendation_score REAL,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    conn.commit()
-    conn.close()
-    print("Database initialized successfully.")
-
-# --- JOB DETAILS (Incorporating all data from Ai_Jobs.docx) ---
-JOB_DETAILS = {
-    "Doctor": {
-        "description": "Diagnose and treat illnesses, perform check-ups, prescribe medicine, and guide patients to recovery.",
-        "salary_range": "$11,000 - $40,000 per year (Annual)",
-        "skills": [
-            "Clinical Diagnosis",
-            "Treatment Planning",
-            "Patient Care",
-            "Medical Procedures",
-            "Communication",
-            "Problem-solving"
-        ],
-        "schools": [
-            "University of Health Sciences",
-            "International University",
-            "Norton University",
-            "University of Puthisastra",
-            "Cambodian University for Specialties"
-        ],
-        "companies": [
-            "Royal Phnom Penh Hospital",
-            "Calmette Hospital",
-            "Sunrise Japan Hospital Phnom Penh",
-            "SenSok International University Hospital",
-            "Raffles Medical Phnom Penh"
-        ],
-        "image_path": "img/doctor.jpg"
-    },
-    "Project Manager": {
-        "description": "leads and oversees projects from start to finish—planning, coordinating resources, ensuring timelines and budgets are met, managing teams, and communicating with stakeholders.",
-        "salary_range": "$5,000 - $19,000 per year (Annual)",
-        "skills": [
-            "Planning",
-            "Budget Management",
-            "Team Leadership",
-            "Risk Management",
-            "Communication"
-        ],
-        "schools": [
-            "CamEd Business School",
-            "University of Puthisatra",
-            "National Institute of Business",
-            "National University of Management",
-            "Norton University"
-        ],
-        "companies": [
-            "Vattanac Bank Cambodia",
-            "ACLEDA Company",
-            "Oddatelier Company"
-        ],
-        "image_path": "img/Project manager.png"
-    },
-    "Researcher": {
-        "description": "Researchers conduct systematic investigations to establish facts, develop new theories, or revise existing ones. They often work in academic institutions, government agencies, or private companies, designing experiments, collecting and analyzing data, and reporting their findings. Strong analytical skills, attention to detail, and a commitment to scientific integrity are crucial.",
-        "salary_range": "$5,000 - $18,000 per year (Annual)",
-        "skills": [
-            "Research Design",
-            "Data Collection",
-            "Statistical Analysis",
-            "Report Writing",
-            "Critical Thinking"
-        ],
-        "schools": [
-            "Royal University of Phnom Penh (RUPP)",
-            "University of Health Sciences (UHS)",
-            "Institute of Technology of Cambodia (ITC)",
-            "American University of Phnom Penh (AUPP)"
-        ],
-        "companies": [
-            "Universities",
-            "Government Labs",
-            "Pharmaceutical Companies",
-            "R&D Departments",
-            "Innovative Research Firms"
-        ],
-        "image_path": "img/Researcher.png"
-    },
-    "UX/UI Designer": {
-        "description": "focuses on creating intuitive, efficient, and enjoyable user experiences for websites, apps, and software. They research user needs, design interfaces, and test prototypes to ensure products are user-friendly.",
-        "salary_range": "$6,000 - $20,000 per year (Annual)",
-        "skills": [
-            "User Research",
-            "Wireframing",
-            "Prototyping",
-            "Usability Testing",
-            "Figma/Sketch/Adobe XD",
-            "Communication"
-        ],
-        "schools": [
-            "Limkokwing University of Creative Technology",
-            "Royal University of Phnom Penh (RUPP)",
-            "Pannasastra University of Cambodia (PUC)",
-            "Cambodia Academy of Digital Technology (CADT)"
-        ],
-        "companies": [
-            "Tech Startups",
-            "Digital Agencies",
-            "E-commerce Companies",
-            "Software Development Firms",
-            "Banks"
-        ],
-        "image_path": "img/ux ui.png"
-    },
-    "Data Scientist": {
-        "description": "Data Scientists analyze complex datasets to extract insights and knowledge. They use statistical analysis, machine learning, and programming to build predictive models and inform business decisions. A strong background in mathematics and statistics is beneficial.",
-        "salary_range": "$7,000 - $24,000 per year (Annual)",
-        "skills": [
-            "Programming (Python, R, SQL)",
-            "Data Analysis Tools",
-            "Machine Learning",
-            "Data Visualization",
-            "Problem-solving",
-            "Critical thinking",
-            "Communication"
-        ],
-        "schools": [
-            "American University of Phnom Penh (AUPP)",
-            "Institute of Technology of Cambodia (ITC)",
-            "Royal University of Phnom Penh (RUPP)",
-            "Step IT Academy",
-            "Cambodia Academy of Digital Technology (CADT)"
-        ],
-        "companies": [
-            "Banks & Microfinance Company: ABA Bank, Acleda Bank, Wing Bank",
-            "Telecom: Smart Axiata, Metfone, Cellcard",
-            "Tech Companies / Startups: Codingate, Pathmazing, Slash"
-        ],
-        "image_path": "img/Data Scientist.png"
-    },
-    "Software Engineer": {
-        "description": "design, develop, and maintain software applications. They apply engineering principles to build robust, scalable, and efficient systems.",
-        "salary_range": "$6,000 - $22,000 per year (Annual)",
-        "skills": [
-            "Programming (Java, Python, C++, JavaScript)",
-            "Data Structures & Algorithms",
-            "Software Development Life Cycle (SDLC)",
-            "Database Management",
-            "Problem-solving",
-            "Teamwork"
-        ],
-        "schools": [
-            "Royal University of Phnom Penh (RUPP)",
-            "Institute of Technology of Cambodia (ITC)",
-            "National University of Management (NUM)",
-            "American University of Phnom Penh (AUPP)",
-            "SETEC Institute"
-        ],
-        "companies": [
-            "Tech Companies (e.g., Agoda, Pruksa)",
-            "Banks & FinTech",
-            "Telecoms",
-            "Software Outsourcing Firms",
-            "E-commerce Platforms"
-        ],
-        "image_path": "img/Software enginee.png"
-    },
-    "Fire Fighter": {
-        "description": "Firefighters respond to emergencies, extinguish fires, rescue people from dangerous situations, and provide first aid. They also educate the public on fire safety.",
-        "salary_range": "$3,000 - $8,000 per year (Annual)",
-        "skills": [
-            "Emergency Response",
-            "First Aid/CPR",
-            "Physical Fitness",
-            "Teamwork",
-            "Stress Management"
-        ],
-        "schools": [
-            "National Police Academy of Cambodia (specific firefighter training programs)",
-            "Various provincial training centers"
-        ],
-        "companies": [
-            "Fire and Rescue Department (under Ministry of Interior)",
-            "Airport Fire Services",
-            "Industrial Fire Brigades (large factories, complexes)"
-        ],
-        "image_path": "img/firefigher.jpg" 
-    },
-    "Lawyer": {
-        "description": "Lawyers provide legal advice, represent clients in court, and prepare legal documents. They specialize in various fields like criminal law, civil law, or corporate law.",
-        "salary_range": "$8,000 - $30,000 per year (Annual)",
-        "skills": [
-            "Legal Research",
-            "Advocacy",
-            "Negotiation",
-            "Contract Drafting",
-            "Communication",
-            "Analytical Thinking"
-        ],
-        "schools": [
-            "Royal University of Law and Economics (RULE)",
-            "Pannasastra University of Cambodia (PUC)",
-            "National University of Management (NUM)",
-            "University of Cambodia (UC)"
-        ],
-        "companies": [
-            "Law Firms",
-            "Corporate Legal Departments",
-            "Government Ministries",
-            "NGOs",
-            "International Organizations"
-        ],
-        "image_path": "img/lawyer.jpg"
-    },
-    "High School Teacher": {
-        "description": "High school teachers educate students in various subjects, prepare lesson plans, assess student progress, and foster a positive learning environment.",
-        "salary_range": "$3,000 - $10,000 per year (Annual)",
-        "skills": [
-            "Lesson Planning",
-            "Classroom Management",
-            "Subject Matter Expertise",
-            "Communication",
-            "Student Assessment",
-            "Adaptability"
-        ],
-        "schools": [
-            "National Institute of Education (NIE)",
-            "Royal University of Phnom Penh (RUPP) - Education Dept.",
-            "Phnom Penh International University (PPIU) - Education Dept."
-        ],
-        "companies": [
-            "Public High Schools (Ministry of Education, Youth and Sport)",
-            "Private International Schools",
-            "Community Learning Centers"
-        ],
-        "image_path": "img/teacher.jpg" 
-    },
-    "Accountant": {
-        "description": "Accountants prepare and examine financial records, ensure financial statements are accurate, and help individuals and businesses manage their finances and comply with tax laws.",
-        "salary_range": "$4,000 - $15,000 per year (Annual)",
-        "skills": [
-            "Financial Reporting",
-            "Tax Preparation",
-            "Auditing",
-            "Bookkeeping",
-            "Data Analysis",
-            "Attention to Detail"
-        ],
-        "schools": [
-            "CamEd Business School",
-            "National University of Management (NUM)",
-            "Royal University of Law and Economics (RULE)",
-            "University of Cambodia (UC)"
-        ],
-        "companies": [
-            "Accounting Firms",
-            "Banks & Financial Institutions",
-            "Manufacturing Companies",
-            "NGOs",
-            "Government Agencies"
-        ],
-        "image_path": "img/accountant.jpg"
-    },
-    "Civil Site Engineer": {
-        "description": "Civil Site Engineers plan, design, and manage construction projects such as buildings, roads, bridges, and infrastructure, ensuring they are built safely and efficiently.",
-        "salary_range": "$5,000 - $18,000 per year (Annual)",
-        "skills": [
-            "Project Management",
-            "Structural Analysis",
-            "AutoCAD/Design Software",
-            "Site Supervision",
-            "Problem-solving",
-            "Safety Regulations"
-        ],
-        "schools": [
-            "Institute of Technology of Cambodia (ITC)",
-            "National University of Management (NUM)",
-            "Norton University",
-            "Royal University of Phnom Penh (RUPP) - Engineering Dept."
-        ],
-        "companies": [
-            "Construction Companies",
-            "Real Estate Developers",
-            "Consulting Engineering Firms",
-            "Government Public Works Departments",
-            "Infrastructure Development Companies"
-        ],
-        "image_path": "img/enginee.jpg"
-    },
-    "Architecture": {
-        "description": "Architects design buildings and other physical structures. They blend aesthetics with functionality, considering safety, sustainability, and client needs.",
-        "salary_range": "$5,000 - $17,000 per year (Annual)",
-        "skills": [
-            "Architectural Design",
-            "AutoCAD/Revit",
-            "Sketching & Rendering",
-            "Building Codes",
-            "Project Management",
-            "Creativity"
-        ],
-        "schools": [
-            "Royal University of Phnom Penh (RUPP) - Dept. of Architecture",
-            "Limkokwing University of Creative Technology",
-            "Pannasastra University of Cambodia (PUC) - Architecture"
-        ],
-        "companies": [
-            "Architectural Firms",
-            "Construction Companies",
-            "Real Estate Development Firms",
-            "Interior Design Companies",
-            "Government Urban Planning Departments"
-        ],
-        "image_path": "img/architect.jpg"
-    },
-    "Artist": {
-        "description": "Artists create visual, performing, or literary works. This broad field includes painters, sculptors, musicians, writers, and digital artists, who use their creativity to express ideas and evoke emotions.",
-        "salary_range": "$2,000 - $10,000 per year (Annual) - Highly variable",
-        "skills": [
-            "Creativity",
-            "Specific Art Medium (e.g., painting, digital art, music)",
-            "Self-promotion",
-            "Attention to Detail",
-            "Adaptability"
-        ],
-        "schools": [
-            "Royal University of Fine Arts (RUFA)",
-            "Limkokwing University of Creative Technology",
-            "Phare Ponleu Selpak (Artistic training NGO)"
-        ],
-        "companies": [
-            "Art Galleries",
-            "Design Studios",
-            "Entertainment Industry",
-            "Advertising Agencies",
-            "Freelance/Self-employed"
-        ],
-        "image_path": "img/job1.png"
-    },
-    "Digital Marketer": {
-        "description": "Digital marketers promote products or services online using various digital channels like social media, search engines, email, and websites. They focus on increasing brand awareness, driving traffic, and generating leads.",
-        "salary_range": "$2,000 - $9,000 per year (Annual)",
-        "skills": [
-            "Social Media Marketing",
-            "Content Creation",
-            "SEO (Search Engine Optimization)",
-            "Email Marketing",
-            "Google Analytics",
-            "Campaign Management"
-        ],
-        "schools": [
-            "National University of Management (NUM) - Marketing",
-            "Pannasastra University of Cambodia (PUC) - Marketing",
-            "Royal University of Phnom Penh (RUPP) - Media & Communication"
-        ],
-        "companies": [
-            "Digital Marketing Agencies",
-            "E-commerce Businesses",
-            "Tech Startups",
-            "Large Corporations (in-house marketing teams)",
-            "NGOs"
-        ],
-        "image_path": "img/Digital marketer.png"
-    },
-    "Human Resource (HR)": {
-        "description": "manages recruitment, employee relations, training, and company policies to support staff and help the organization run smoothly.",
-        "salary_range": "$2,000 - $9,000 per year (Annual)",
-        "skills": [
-            "Recruitment and interviewing",
-            "Knowledge of Cambodian labor law",
-            "Payroll and benefits administration",
-            "Communication and interpersonal skills",
-            "Problem-solving and conflict management"
-        ],
-        "schools": [
-            "Human Resource University",
-            "Pannasastra University of Cambodia",
-            "Royal University of Phnom Penh",
-            "The Knowledge Academy",
-            "Cambodian Mekong University"
-        ],
-        "companies": [
-            "private companies",
-            "non-profit organizations",
-            "government agencies",
-            "Consulting Firms",
-            "International Organizations"
-        ],
-        "image_path": "img/HR.jpg"
-    }
-}
-
-
-# --- Dummy Data Generation for ML Model Training ---
-def generate_dummy_data(num_samples=200):
-    """
-    Generates a synthetic dataset for training the ML model.
-    Maps aggregated survey responses to career outcomes.
-    """
-    # Define the aggregated features (0-10 scale)
-    feature_names = [
-        'math_interest', 'science_interest', 'coding_interest', 'design_interest',
-        'problem_solving_skill', 'communication_skill', 'creativity_skill', 'leadership_skill'
-    ]
-    
-    # Define possible career outcomes - using all keys from JOB_DETAILS
-    career_outcomes = list(JOB_DETAILS.keys())
-
-    data = []
-    labels = []
-
-    for _ in range(num_samples):
-        # Generate random aggregated scores
-        features = {name: np.random.uniform(1, 10) for name in feature_names}
-        
-        # Simple logic to assign a career based on features (mimicking real patterns)
-        # This mapping needs to be expanded to cover all new careers
-        career = np.random.choice(career_outcomes) # Default random pick
-
-        # More specific assignments
-        if features['coding_interest'] > 7 and features['problem_solving_skill'] > 6:
-            career = np.random.choice(["Software Engineer", "Data Scientist"])
-        elif features['math_interest'] > 7 and features['science_interest'] > 6:
-            career = np.random.choice(["Data Scientist", "Researcher"])
-        elif features['design_interest'] > 7 and features['creativity_skill'] > 6:
-            career = "UX/UI Designer"
-        elif features['leadership_skill'] > 7 and features['communication_skill'] > 6:
-            career = np.random.choice(["Project Manager", "Human Resource (HR)"])
-        elif features['science_interest'] > 7 and features['problem_solving_skill'] > 6:
-            career = np.random.choice(["Doctor", "Researcher"])
-        elif features['communication_skill'] > 7 and features['creativity_skill'] > 6:
-            career = np.random.choice(["Artist", "Digital Marketer"])
-        elif features['math_interest'] > 7 and features['problem_solving_skill'] > 6:
-            career = np.random.choice(["Accountant", "Civil Site Engineer", "Architecture"])
-        elif features['leadership_skill'] > 7 and features['problem_solving_skill'] > 6:
-            career = np.random.choice(["Fire Fighter", "Lawyer"])
-        # Add more specific rules as needed for better accuracy
-
-        data.append(list(features.values()))
-        labels.append(career)
-
-    X = pd.DataFrame(data, columns=feature_names)
-    y = pd.Series(labels)
-    
-    return X, y, feature_names, career_outcomes
-
-# --- Machine Learning Model Training ---
-def train_career_model():
-    """
-    Trains a Decision Tree Classifier model for career recommendation.
-    """
-    X, y, feature_names, career_outcomes = generate_dummy_data()
-
-    # Create a pipeline with scaling and a classifier
-    model_pipeline = Pipeline([
-        ('scaler', StandardScaler()),
-        ('classifier', DecisionTreeClassifier(random_state=42))
-    ])
-
-    model_pipeline.fit(X, y)
-    print("Machine Learning model trained successfully.")
-    return model_pipeline, feature_names, career_outcomes
-
-# --- ML-based Recommendation Logic ---
-def get_ml_career_recommendation(ml_model, feature_names, career_outcomes, raw_survey_responses, preferred_industry):
-    """
-    Uses the trained ML model to get career recommendations.
-
-    Args:
-        ml_model (Pipeline): The trained Scikit-learn pipeline.
-        feature_names (list): List of feature names used during training.
-        career_outcomes (list): List of possible career outcomes.
-        raw_survey_responses (dict): A dictionary containing responses to the 20 questions (1-7 scale).
-        preferred_industry (str): The user's selected preferred industry.
-
-    Returns:
-        tuple: (recommended_career, recommendation_score, top_careers_for_display)
-    """
-    def map_scale(value):
-        return (value - 1) * (10 / 6) # Map 1-7 scale to 0-10
-
-    # Aggregate raw survey responses into interest/skill categories (0-10 scale)
-    category_scores = defaultdict(float)
-    category_counts = defaultdict(int)
-
-    # Mapping survey questions to aggregated features
-    q_to_category = {
-        'q1': 'math_interest', 'q2': 'math_interest',
-        'q3': 'science_interest', 'q4': 'science_interest',
-        'q5': 'coding_interest', 'q6': 'coding_interest', 'q7': 'coding_interest',
-        'q8': 'design_interest', 'q9': 'design_interest',
-        'q10': 'problem_solving_skill', 'q11': 'problem_solving_skill', 'q12': 'problem_solving_skill',
-        'q13': 'communication_skill', 'q14': 'communication_skill', 'q15': 'communication_skill',
-        'q16': 'creativity_skill', 'q17': 'creativity_skill',
-        'q18': 'leadership_skill', 'q19': 'leadership_skill', 'q20': 'leadership_skill',
-    }
-
-    for q_key, response_value in raw_survey_responses.items():
-        category = q_to_category.get(q_key)
-        if category:
-            category_scores[category] += map_scale(response_value)
-            category_counts[category] += 1
-
-    aggregated_data = {}
-    for feature in feature_names:
-        if category_counts[feature] > 0:
-            aggregated_data[feature] = category_scores[feature] / category_counts[feature]
-        else:
-            aggregated_data[feature] = map_scale(4) # Default to neutral (4 on 1-7 scale, mapped to ~5 on 0-10) if no questions contributed
-
-    # Prepare features for the model in the correct order
-    input_features = pd.DataFrame([list(aggregated_data.values())], columns=feature_names)
-
-    # Get probability predictions for each career
-    probabilities = ml_model.predict_proba(input_features)[0]
-    
-    # Create a dictionary of career probabilities
-    career_probs = {career: prob for career, prob in zip(ml_model.classes_, probabilities)}
-
-    # Apply preferred industry boost (post-prediction)
-    industry_boost_factor = 1.2
-    career_industry_mapping = {
-        "Software Engineer": ["IT", "Technology"],
-        "Data Scientist": ["IT", "Research", "Finance"],
-        "UX/UI Designer": ["Design", "IT"],
-        "Project Manager": ["Management", "General"],
-        "Researcher": ["Research", "Science"],
-        "Doctor": ["Healthcare"],
-        "Fire Fighter": ["Public Service", "General"],
-        "Lawyer": ["Legal", "General"],
-        "High School Teacher": ["Education", "General"],
-        "Accountant": ["Finance", "General"],
-        "Civil Site Engineer": ["Engineering", "Construction"],
-        "Architecture": ["Design", "Construction"],
-        "Artist": ["Arts", "Design"],
-        "Digital Marketer": ["Marketing", "IT"],
-        "Human Resource (HR)": ["Management", "General"]
-    }
-
-    for career, prob in career_probs.items():
-        if preferred_industry in career_industry_mapping.get(career, []):
-            career_probs[career] = min(1.0, prob * industry_boost_factor) # Cap at 1.0
-
-    # Convert probabilities to scores (e.g., out of 100)
-    career_scores = {career: prob * 100 for career, prob in career_probs.items()}
-
-    # Get the top recommended career and its score
-    if career_scores:
-        recommended_career = max(career_scores, key=career_scores.get)
-        recommendation_score = career_scores[recommended_career]
-    else:
-        recommended_career = "Uncertain"
-        recommendation_score = 0.0
-
-    # Get top 3 careers for pie chart display
-    sorted_careers = sorted(career_scores.items(), key=lambda item: item[1], reverse=True)
-    top_careers_for_display = [(career, score) for career, score in sorted_careers[:3]]
-
-    return recommended_career, recommendation_score, top_careers_for_display
+from PyQt6.QtCore import Qt, QSize, QTimer
+from PyQt6.QtGui import QFont, QColor, QPalette, QBrush, QLinearGradient
+
+from database import SurveyRepository, format_timestamp
+from job_details import CATALOG, JOB_DETAILS
+from career_model import INDUSTRIES, RecommendationCache, format_industry_preferences
+from model_worker import ModelLoaderThread
+from image_cache import PixmapCache
+from assets import AssetManifest, display_size
+from career_chart import create_results_chart
+from page_registry import PageRegistry
+
+
+# Survey questions, in q1..q20 order
+SURVEY_QUESTIONS = [
+    "I enjoy solving complex mathematical problems.",
+    "I find working with numbers and data engaging.",
+    "I am curious about how the natural world and scientific principles work.",
+    "I enjoy learning about new scientific discoveries and theories.",
+    "I enjoy writing code and developing software applications.",
+    "I like to build and troubleshoot computer systems.",
+    "I am interested in artificial intelligence and machine learning.",
+    "I enjoy creating visual designs and artistic layouts.",
+    "I pay attention to user experience and interface aesthetics.",
+    "I enjoy breaking down complex problems into smaller, manageable parts.",
+    "I like to find innovative solutions to challenges.",
+    "I am good at analytical thinking and logical reasoning.",
+    "I am comfortable presenting ideas and information to groups.",
+    "I enjoy collaborating with others to achieve a common goal.",
+    "I can clearly explain complex topics to different audiences.",
+    "I enjoy generating new and original ideas.",
+    "I am comfortable thinking outside the box and experimenting.",
+    "I like to take charge and guide a team towards a goal.",
+    "I am good at organizing tasks and managing resources.",
+    "I enjoy motivating others and resolving conflicts."
+]
+
+# Display sizes (see assets.DISPLAY_SIZES) of the job details panel images and the intro panel illustration
+JOB_IMAGE = 'job_square'
+JOB_IMAGE_SIZE = display_size(JOB_IMAGE)
+INTRO_IMAGE = 'intro'
+INTRO_IMAGE_SIZE = display_size(INTRO_IMAGE)
+
+# Results chart renderer (see career_chart.RENDERERS); 'matplotlib' restores the original chart
+RESULTS_CHART_RENDERER = 'native'
+# Careers listed in the results chart
+TOP_CAREERS_SHOWN = 3
+
+# Preferred industry selected when the survey opens, and how a second industry choice is weighted against the first
+DEFAULT_INDUSTRY = "IT"
+FIRST_INDUSTRY_WEIGHT = 2
+SECOND_INDUSTRY_WEIGHT = 1
 
 
 # --- Main Application Window ---
@@ -601,10 +68,50 @@ class CareerApp(QWidget):
         self.setWindowTitle("ប្រព័ន្ធវិភាគសមត្ថភាព និងផ្តល់យោបល់ការងារ") # Competency Analysis and Career Counseling System
         self.setGeometry(100, 100, 1200, 800) # Increased width
 
-        self.ml_model, self.feature_names, self.career_outcomes = train_career_model()
-
+        # The model is prepared on a worker thread; the survey submit button waits for it
+        self.ml_model, self.feature_names, self.career_outcomes = None, None, None
+        self.model_error = None
+        self.model_loader = ModelLoaderThread(parent=self)
+        self.model_loader.model_ready.connect(self.on_model_ready)
+        self.model_loader.failed.connect(self.on_model_failed)
+        QTimer.singleShot(0, self.model_loader.start) # Started from the event loop, once the window has been shown
+
+        self.repository = SurveyRepository()
+        self.asset_manifest = AssetManifest()
+        self.pixmap_cache = PixmapCache()
+        self.recommendation_cache = RecommendationCache() # Repeated answer patterns are not re-scored
+        self.questions = SURVEY_QUESTIONS
         self.init_ui()
-        init_db()
+
+    def on_model_ready(self, ml_model, feature_names, career_outcomes):
+        """Stores the prepared model and enables survey submission."""
+        self.ml_model, self.feature_names, self.career_outcomes = ml_model, feature_names, career_outcomes
+        if self.pages.is_built('survey'):
+            self.update_model_status()
+
+    def on_model_failed(self, message):
+        """Reports that the model could not be prepared; submission stays disabled."""
+        self.model_error = message
+        if self.pages.is_built('survey'):
+            self.update_model_status()
+
+    def update_model_status(self):
+        """Shows the model's loading state on the survey page and enables submission once it is ready."""
+        if self.ml_model is not None:
+            self.model_status_label.hide()
+            self.model_progress_bar.hide()
+            self.submit_button.setEnabled(True)
+        elif self.model_error is not None:
+            self.model_progress_bar.hide()
+            self.model_status_label.setText(f"មិនអាចរៀបចំម៉ូដែលបានទេ: {self.model_error}") # Could not prepare the model
+            self.model_status_label.setStyleSheet("color: #dc3545;")
+
+    def closeEvent(self, event):
+        """Waits for the background workers and closes the database connection when the window closes."""
+        self.model_loader.wait()
+        self.pixmap_cache.wait_for_pending()
+        self.repository.close()
+        super().closeEvent(event)
 
     def init_ui(self):
         """Initializes the user interface."""
@@ -628,20 +135,15 @@ class CareerApp(QWidget):
         main_layout.addWidget(self.stacked_widget)
 
 
-        # self.home_page = self.create_home_page() # Removed as per user request
-        self.survey_page = self.create_survey_page()
-        self.results_page = self.create_results_page()
-        self.job_details_page = self.create_job_details_page() # This page will now be used by the left panel
-        self.history_page = self.create_history_page()
-
-        # self.stacked_widget.addWidget(self.home_page) # Removed
-        self.stacked_widget.addWidget(self.survey_page) # Index 0
-        self.stacked_widget.addWidget(self.results_page) # Index 1
-        self.stacked_widget.addWidget(self.job_details_page) # Index 2
-        self.stacked_widget.addWidget(self.history_page) # Index 3
+        # Pages are built on first navigation; the home page was removed as per user request
+        self.pages = PageRegistry(self.stacked_widget)
+        self.pages.register('survey', self.create_survey_page)
+        self.pages.register('results', self.create_results_page)
+        self.pages.register('job_details', self.create_job_details_page) # This page will now be used by the left panel
+        self.pages.register('history', self.create_history_page)
 
         # Start on the main career details page with the intro showing by default
-        self.stacked_widget.setCurrentIndex(2) # Display job_details_page initially (its new index)
+        self.pages.show('job_details') # Display job_details_page initially; other pages are built on first visit
 
 
     # Removed create_home_page method as per user request
@@ -691,15 +193,7 @@ class CareerApp(QWidget):
         industry_label = QLabel("ឧស្សាហកម្មដែលពេញចិត្ត:")
         industry_label.setFont(QFont("Khmer OS Siemreap", 12)) # Increased font size
         self.survey_layout.addWidget(industry_label)
-        self.survey_industry_combo = QComboBox()
-        # Updated industry options to cover all new jobs better
-        self.survey_industry_combo.addItems([
-            "IT", "Design", "Management", "Research", "Finance",
-            "Education", "Healthcare", "Public Service", "Legal",
-            "Construction", "Engineering", "Arts", "Marketing", "General"
-        ])
-        self.survey_industry_combo.setFont(QFont("Khmer OS Siemreap", 11))
-        self.survey_industry_combo.setStyleSheet(
+        combo_style = (
             "QComboBox { "
             "padding: 10px; border: 1px solid #a0a0a0; border-radius: 8px; "
             "background-color: #f8f8f8; "
@@ -707,32 +201,24 @@ class CareerApp(QWidget):
             "}"
             "QComboBox::drop-down { border: none; }"
         )
+        self.survey_industry_combo = QComboBox()
+        self.survey_industry_combo.addItems(INDUSTRIES) # Same industry list the recommendation boost uses
+        self.survey_industry_combo.setCurrentText(DEFAULT_INDUSTRY)
+        self.survey_industry_combo.setFont(QFont("Khmer OS Siemreap", 11))
+        self.survey_industry_combo.setStyleSheet(combo_style)
         self.survey_layout.addWidget(self.survey_industry_combo)
-        self.survey_layout.addSpacing(30)
-
 
-        self.questions = [
-            "I enjoy solving complex mathematical problems.",
-            "I find working with numbers and data engaging.",
-            "I am curious about how the natural world and scientific principles work.",
-            "I enjoy learning about new scientific discoveries and theories.",
-            "I enjoy writing code and developing software applications.",
-            "I like to build and troubleshoot computer systems.",
-            "I am interested in artificial intelligence and machine learning.",
-            "I enjoy creating visual designs and artistic layouts.",
-            "I pay attention to user experience and interface aesthetics.",
-            "I enjoy breaking down complex problems into smaller, manageable parts.",
-            "I like to find innovative solutions to challenges.",
-            "I am good at analytical thinking and logical reasoning.",
-            "I am comfortable presenting ideas and information to groups.",
-            "I enjoy collaborating with others to achieve a common goal.",
-            "I can clearly explain complex topics to different audiences.",
-            "I enjoy generating new and original ideas.",
-            "I am comfortable thinking outside the box and experimenting.",
-            "I like to take charge and guide a team towards a goal.",
-            "I am good at organizing tasks and managing resources.",
-            "I enjoy motivating others and resolving conflicts."
-        ]
+        second_industry_label = QLabel("ឧស្សាហកម្មទីពីរ (ស្រេចចិត្ត):") # Second industry (optional)
+        second_industry_label.setFont(QFont("Khmer OS Siemreap", 12))
+        self.survey_layout.addWidget(second_industry_label)
+        self.survey_second_industry_combo = QComboBox()
+        self.survey_second_industry_combo.addItem("-", "") # No second industry
+        for industry in INDUSTRIES:
+            self.survey_second_industry_combo.addItem(industry, industry)
+        self.survey_second_industry_combo.setFont(QFont("Khmer OS Siemreap", 11))
+        self.survey_second_industry_combo.setStyleSheet(combo_style)
+        self.survey_layout.addWidget(self.survey_second_industry_combo)
+        self.survey_layout.addSpacing(30)
 
         self.question_button_groups = {}
         for i, q_text in enumerate(self.questions):
@@ -785,10 +271,22 @@ class CareerApp(QWidget):
 
         self.survey_layout.addSpacing(30)
 
-        submit_button = QPushButton("បំពេញការស្ទង់មតិ")
-        submit_button.setFont(QFont("Khmer OS Siemreap", 14, QFont.Weight.Bold))
-        submit_button.setFixedSize(250, 55)
-        submit_button.setStyleSheet(
+        # Shown until the model has been loaded or trained in the background
+        self.model_status_label = QLabel("កំពុងរៀបចំម៉ូដែល...") # Preparing the model...
+        self.model_status_label.setFont(QFont("Khmer OS Siemreap", 10))
+        self.model_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.model_status_label.setStyleSheet("color: #555555;")
+        self.survey_layout.addWidget(self.model_status_label)
+        self.model_progress_bar = QProgressBar()
+        self.model_progress_bar.setRange(0, 0) # Busy indicator
+        self.model_progress_bar.setFixedWidth(250)
+        self.model_progress_bar.setTextVisible(False)
+        self.survey_layout.addWidget(self.model_progress_bar, alignment=Qt.AlignmentFlag.AlignCenter)
+
+        self.submit_button = QPushButton("បំពេញការស្ទង់មតិ")
+        self.submit_button.setFont(QFont("Khmer OS Siemreap", 14, QFont.Weight.Bold))
+        self.submit_button.setFixedSize(250, 55)
+        self.submit_button.setStyleSheet(
             "QPushButton { "
             "background-color: #28a745; color: white; border-radius: 27px; "
             "border: none; padding: 10px 20px; "
@@ -796,9 +294,14 @@ class CareerApp(QWidget):
             "QPushButton:hover { "
             "background-color: #218838; "
             "}"
+            "QPushButton:disabled { "
+            "background-color: #a5d6b1; "
+            "}"
         )
-        submit_button.clicked.connect(self.submit_survey)
-        self.survey_layout.addWidget(submit_button, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.submit_button.setEnabled(False)
+        self.submit_button.clicked.connect(self.submit_survey)
+        self.survey_layout.addWidget(self.submit_button, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.update_model_status() # The model may have finished loading before this page was first shown
 
         back_button = QPushButton("ត្រឡប់ទៅការងារ")
         back_button.setFont(QFont("Khmer OS Siemreap", 11))
@@ -812,12 +315,20 @@ class CareerApp(QWidget):
             "background-color: #5a6268; "
             "}"
         )
-        back_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(2)) # Back to job details page (new index)
+        back_button.clicked.connect(lambda: self.pages.show('job_details')) # Back to job details page
         self.survey_layout.addWidget(back_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
         self.survey_layout.addStretch(1) # Push content to the top
         return widget
 
+    def selected_industry_preferences(self):
+        """Returns the preferred industries as a preference string: the first choice, weighted above the optional second one."""
+        weights = {self.survey_industry_combo.currentText(): FIRST_INDUSTRY_WEIGHT}
+        second_industry = self.survey_second_industry_combo.currentData()
+        if second_industry and second_industry not in weights:
+            weights[second_industry] = SECOND_INDUSTRY_WEIGHT
+        return format_industry_preferences(weights)
+
     def submit_survey(self):
         """Collects survey responses, gets ML recommendation, saves to DB, and shows results."""
         student_name = self.student_name_input.text().strip()
@@ -839,25 +350,20 @@ class CareerApp(QWidget):
             QMessageBox.warning(self, "Missing Responses", "សូមឆ្លើយគ្រប់សំណួរទាំងអស់។") # Please answer all questions.
             return
 
-        preferred_industry = self.survey_industry_combo.currentText()
+        preferred_industry = self.selected_industry_preferences()
 
         # Get ML recommendation
         recommended_career, recommendation_score, top_careers_for_display = \
-            get_ml_career_recommendation(
+            self.recommendation_cache.recommend(
                 self.ml_model, self.feature_names, self.career_outcomes,
-                raw_responses, preferred_industry
+                raw_responses, preferred_industry, top_n=TOP_CAREERS_SHOWN
             )
 
         # Save to database
         try:
-            conn = sqlite3.connect(DATABASE_NAME)
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO survey_responses (student_name, raw_survey_responses, preferred_industry, recommended_career, recommendation_score) VALUES (?, ?, ?, ?, ?)",
-                (student_name, json.dumps(raw_responses), preferred_industry, recommended_career, recommendation_score)
+            self.repository.insert_submission(
+                student_name, raw_responses, preferred_industry, recommended_career, recommendation_score
             )
-            conn.commit()
-            conn.close()
             QMessageBox.information(self, "Submission Successful", "ការស្ទង់មតិត្រូវបានដាក់ស្នើដោយជោគជ័យ!")
             self.show_results_page(student_name, recommended_career, top_careers_for_display[0][1], top_careers_for_display) # Pass the score of the top career for display
         except sqlite3.Error as e:
@@ -895,12 +401,11 @@ class CareerApp(QWidget):
         self.recommendation_score_label.setStyleSheet("color: #555555;")
         layout.addWidget(self.recommendation_score_label)
 
-        # Matplotlib figure for pie chart
-        self.fig, self.ax = plt.subplots(figsize=(6, 6))
-        self.canvas = FigureCanvas(self.fig)
-        self.canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.canvas.setMinimumSize(QSize(400, 400)) # Set a minimum size for the chart
-        layout.addWidget(self.canvas, alignment=Qt.AlignmentFlag.AlignCenter)
+        # Pie chart of the top careers
+        self.results_chart = create_results_chart(RESULTS_CHART_RENDERER, 'pie', figsize=(6, 6))
+        self.results_chart.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.results_chart.setMinimumSize(QSize(400, 400)) # Set a minimum size for the chart
+        layout.addWidget(self.results_chart, alignment=Qt.AlignmentFlag.AlignCenter)
 
         details_button = QPushButton("មើលព័ត៌មានលម្អិតការងារ")
         details_button.setFont(QFont("Khmer OS Siemreap", 12))
@@ -929,7 +434,7 @@ class CareerApp(QWidget):
             "background-color: #5a6268; "
             "}"
         )
-        new_survey_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(0)) # Back to survey (new index)
+        new_survey_button.clicked.connect(lambda: self.pages.show('survey')) # Back to survey
         layout.addWidget(new_survey_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
         layout.addStretch(1) # Push content to the top
@@ -937,28 +442,24 @@ class CareerApp(QWidget):
 
     def show_results_page(self, student_name, recommended_career, recommendation_score, top_careers_for_display):
         """Displays the results page with the recommendation."""
+        self.pages.page('results') # Built on first use
         self.student_name_result_label.setText(f"ឈ្មោះនិស្សិត: {student_name}")
         self.recommended_career_label.setText(f"អាជីពដែលបានណែនាំ: {recommended_career}")
         self.recommendation_score_label.setText(f"ពិន្ទុភាពស័ក្តិសម: {recommendation_score:.2f}%")
         self.current_recommended_career = recommended_career # Store for details button
 
-        # Clear previous plot
-        self.ax.clear()
-
-        # Prepare data for the pie chart
-        labels = [f"{career} ({score:.1f}%)" for career, score in top_careers_for_display]
-        sizes = [score for career, score in top_careers_for_display]
-        colors = ['#4CAF50', '#FFC107', '#2196F3'] # Green, Yellow, Blue for top 3
-        explode = [0.1 if i == 0 else 0 for i in range(len(top_careers_for_display))] # Explode the largest slice
+        self.results_chart.set_top_careers(top_careers_for_display)
+        self.pages.show('results') # Show results page
 
-        self.ax.pie(sizes, explode=explode, labels=labels, colors=colors,
-                    autopct=lambda p: '{:.1f}%'.format(p) if p > 0 else '', # Only show percentage if > 0
-                    shadow=True, startangle=140, textprops={'fontsize': 10, 'color': 'black', 'fontname': 'Khmer OS Siemreap'})
-        self.ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
-        self.ax.set_title("ការណែនាំអាជីពកំពូលទាំង ៣", fontsize=14, fontname='Khmer OS Muol Light')
+        # Warm the image cache for the careers the student is most likely to open next
+        top_careers = [career for career, score in top_careers_for_display]
+        QTimer.singleShot(0, lambda: self.prefetch_career_images(top_careers))
 
-        self.canvas.draw()
-        self.stacked_widget.setCurrentIndex(1) # Show results page (new index)
+    def prefetch_career_images(self, careers):
+        """Decodes and scales the job details images of the given careers ahead of time."""
+        dpr = self.devicePixelRatioF()
+        paths = [self.asset_manifest.career_image(career, JOB_IMAGE, dpr) for career in careers]
+        self.pixmap_cache.prefetch([path for path in paths if path], JOB_IMAGE_SIZE, dpr)
 
     def show_recommended_job_details(self):
         """Switches to the job details page for the currently recommended career."""
@@ -1016,25 +517,25 @@ class CareerApp(QWidget):
             "background-color: #5a6268; "
             "}"
         )
-        back_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(2)) # Back to job details page (new index)
+        back_button.clicked.connect(lambda: self.pages.show('job_details')) # Back to job details page
         layout.addWidget(back_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
         return widget
 
     def show_history_page(self):
         """Fetches and displays survey history."""
+        self.pages.page('history') # Built on first use
         self.history_list_widget.clear()
         self.history_details_text.clear()
         try:
-            conn = sqlite3.connect(DATABASE_NAME)
-            cursor = conn.cursor()
-            cursor.execute("SELECT student_name, recommended_career, recommendation_score, timestamp, raw_survey_responses, preferred_industry FROM survey_responses ORDER BY timestamp DESC")
-            records = cursor.fetchall()
-            conn.close()
+            records = self.repository.list_history()
 
             self.history_data = [] # Store full data for details
             for i, record in enumerate(records):
-                student_name, career, score, timestamp, raw_responses_json, preferred_industry = record
+                student_name, career, score, timestamp, raw_responses, preferred_industry = (
+                    record.student_name, record.recommended_career, record.recommendation_score,
+                    format_timestamp(record.timestamp), record.raw_survey_responses, record.preferred_industry
+                )
                 display_text = f"{i+1}. ឈ្មោះ: {student_name} | អាជីពណែនាំ: {career} ({score:.2f}%) | ថ្ងៃទី: {timestamp}"
                 self.history_list_widget.addItem(display_text)
                 self.history_data.append({
@@ -1042,13 +543,13 @@ class CareerApp(QWidget):
                     "recommended_career": career,
                     "recommendation_score": score,
                     "timestamp": timestamp,
-                    "raw_survey_responses": json.loads(raw_responses_json),
+                    "raw_survey_responses": raw_responses,
                     "preferred_industry": preferred_industry
                 })
         except sqlite3.Error as e:
             QMessageBox.critical(self, "Database Error", f"មានបញ្ហាជាមួយមូលដ្ឋានទិន្នន័យនៅពេលទាញយកប្រវត្តិ: {e}")
         
-        self.stacked_widget.setCurrentIndex(3) # Show history page (new index)
+        self.pages.show('history') # Show history page
 
     def display_history_details(self, item):
         """Displays detailed information for a selected history item."""
@@ -1129,7 +630,7 @@ class CareerApp(QWidget):
             "QPushButton:hover { background-color: #3b536b; }"
             "QPushButton:pressed { background-color: #2c3e50; }"
         )
-        survey_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(0)) # Link to survey page (new index)
+        survey_button.clicked.connect(lambda: self.pages.show('survey')) # Link to survey page
         left_layout.addWidget(survey_button)
 
         # History Button
@@ -1166,7 +667,7 @@ class CareerApp(QWidget):
             "QListWidget::item:hover { background-color: #5d7a96; }"
             "QListWidget::item:selected { background-color: #1abc9c; color: white; border-radius: 5px; }"
         )
-        for job_name in sorted(JOB_DETAILS.keys()):
+        for job_name in CATALOG.names:
             self.job_list_widget.addItem(job_name)
         self.job_list_widget.itemClicked.connect(lambda item: self.display_job_details(item.text()))
         left_layout.addWidget(self.job_list_widget)
@@ -1298,11 +799,10 @@ class CareerApp(QWidget):
 
         # Add an image
         image_label = QLabel()
-        pixmap = QPixmap("img/allbots.png") # Using one of the uploaded images
-        if not pixmap.isNull():
-            image_label.setPixmap(pixmap.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-            image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            intro_layout.addWidget(image_label)
+        image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        dpr = self.devicePixelRatioF()
+        self.pixmap_cache.set_label_image(image_label, self.asset_manifest.image('allbots', INTRO_IMAGE, dpr), INTRO_IMAGE_SIZE, dpr) # Using one of the uploaded images
+        intro_layout.addWidget(image_label)
 
         instruction_label = QLabel(
             "សូមចុចប៊ូតុង 'បំពេញការស្ទង់មតិ' នៅផ្នែកខាងឆ្វេង ដើម្បីចាប់ផ្តើមវិភាគសមត្ថភាពរបស់អ្នក និងទទួលបានការណែនាំអាជីពផ្ទាល់ខ្លួន។"
@@ -1329,13 +829,9 @@ class CareerApp(QWidget):
             self.companies_label.setText("<b>ក្រុមហ៊ុនដែលពាក់ព័ន្ធ:</b> " + ", ".join(job_info['companies']))
 
             # Load image
-            pixmap = QPixmap(job_info['image_path'])
-            if not pixmap.isNull():
-                self.job_image_label.setPixmap(pixmap.scaled(200, 200, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-            else:
-                self.job_image_label.clear()
-                self.job_image_label.setText("Image Not Found")
-                self.job_image_label.setStyleSheet("color: red;")
+            dpr = self.devicePixelRatioF()
+            image_path = self.asset_manifest.career_image(job_name, JOB_IMAGE, dpr)
+            self.pixmap_cache.set_label_image(self.job_image_label, image_path, JOB_IMAGE_SIZE, dpr)
         else:
             self.right_panel_stacked_widget.setCurrentIndex(0) # Go back to intro if job_name is invalid or None
 
@@ -0,0 +1,275 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import itertools
+import statistics
+
+import numpy as np
+
+from career_model import (
+    MODEL_ARTIFACT_PATH, TRAINING_PARAMS, CLASSIFIER_PARAMS,
+    generate_dummy_data, load_career_model, load_classifier_params, save_classifier_params, classifier_params_path,
+    model_fingerprint, installed_sklearn_version
+)
+from tree_engine import export_pipeline
+
+# scikit-learn and joblib are imported inside the functions that use them, as in career_model.
+
+# --- Search Setup ---
+REPORT_FORMAT_VERSION = 1
+DEFAULT_REPORT = 'train_search_report.json'
+DEFAULT_FOLDS = 5
+DEFAULT_JOBS = -1 # All CPU cores
+SEARCH_RANDOM_STATE = 42
+LATENCY_REPEAT = 200 # Single-survey predictions timed per candidate; the median is reported
+
+# Estimator name -> parameter grid. The decision tree grid includes the default unpruned tree.
+SEARCH_SPACE = {
+    'decision_tree': {'max_depth': [None, 4, 6, 8, 12], 'min_samples_leaf': [1, 2, 4, 8]},
+    'random_forest': {'n_estimators': [100], 'max_depth': [None, 8], 'min_samples_leaf': [1, 4]},
+    'logistic_regression': {'C': [0.1, 1.0, 10.0]},
+    'k_neighbors': {'n_neighbors': [5, 15]},
+}
+
+# DecisionTreeClassifier's defaults for the searched parameters, to find the current model's candidate
+# when its published parameters do not set them
+DECISION_TREE_DEFAULTS = {'max_depth': None, 'min_samples_leaf': 1}
+
+# Only a single decision tree can be exported to the NumPy model the app scores with;
+# the other estimators are evaluated for the report but never published.
+PUBLISHABLE_ESTIMATORS = ('decision_tree',)
+
+
+def make_pipeline(estimator, params):
+    """Returns an unfitted scaler + classifier Pipeline, built like train_career_model's."""
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    if estimator == 'decision_tree':
+        from sklearn.tree import DecisionTreeClassifier
+        classifier = DecisionTreeClassifier(**dict(CLASSIFIER_PARAMS, **params))
+    elif estimator == 'random_forest':
+        from sklearn.ensemble import RandomForestClassifier
+        classifier = RandomForestClassifier(random_state=SEARCH_RANDOM_STATE, **params)
+    elif estimator == 'logistic_regression':
+        from sklearn.linear_model import LogisticRegression
+        classifier = LogisticRegression(max_iter=1000, **params)
+    elif estimator == 'k_neighbors':
+        from sklearn.neighbors import KNeighborsClassifier
+        classifier = KNeighborsClassifier(**params)
+    else:
+        raise ValueError(f"unknown estimator: {estimator}")
+    return Pipeline([('scaler', StandardScaler()), ('classifier', classifier)])
+
+def search_candidates(search_space=SEARCH_SPACE):
+    """Returns every (estimator, params) combination of the search space."""
+    candidates = []
+    for estimator, grid in search_space.items():
+        names = sorted(grid)
+        for values in itertools.product(*(grid[name] for name in names)):
+            candidates.append((estimator, dict(zip(names, values))))
+    return candidates
+
+def single_predict_seconds(predict_proba, rows):
+    """Median seconds of predict_proba on one survey's features, the app's scoring call."""
+    times = []
+    for i in range(LATENCY_REPEAT):
+        row = rows[i % len(rows)].reshape(1, -1)
+        start_time = time.perf_counter()
+        predict_proba(row)
+        times.append(time.perf_counter() - start_time)
+    return statistics.median(times)
+
+def evaluate_fold(estimator, params, X, y, train_index, test_index):
+    """
+    Fits one candidate on one cross-validation fold and returns its accuracy on the held-out
+    rows. Runs in a worker process.
+    """
+    pipeline = make_pipeline(estimator, params).fit(X[train_index], y[train_index])
+    return float(np.mean(pipeline.predict(X[test_index]) == y[test_index]))
+
+def measure_timings(estimator, params, X, y):
+    """
+    Times fitting one candidate on all training data and its single-survey predictions.
+    Called in the main process once the cross-validation workers have finished, one
+    candidate at a time, so the timings are not skewed by other fits competing for the CPU.
+
+    Returns:
+        dict: fit_ms and predict_ms (scikit-learn), plus engine_predict_ms (NumPy model)
+        for publishable estimators
+    """
+    pipeline = make_pipeline(estimator, params)
+    start_time = time.perf_counter()
+    pipeline.fit(X, y)
+    timings = {
+        'fit_ms': (time.perf_counter() - start_time) * 1000,
+        'predict_ms': single_predict_seconds(pipeline.predict_proba, X) * 1000,
+    }
+    if estimator in PUBLISHABLE_ESTIMATORS:
+        timings['engine_predict_ms'] = single_predict_seconds(export_pipeline(pipeline).predict_proba, X) * 1000
+    return timings
+
+def summarize(estimator, params, accuracies, timings):
+    """Combines the fold accuracies and the timings of one candidate into its report entry."""
+    return {
+        'estimator': estimator,
+        'params': params,
+        'publishable': estimator in PUBLISHABLE_ESTIMATORS,
+        'accuracy_mean': statistics.mean(accuracies),
+        'accuracy_std': statistics.pstdev(accuracies),
+        **timings,
+    }
+
+def serving_ms(entry):
+    """Single-survey latency of a candidate as the app would score it."""
+    return entry.get('engine_predict_ms', entry['predict_ms'])
+
+def run_search(folds=DEFAULT_FOLDS, jobs=DEFAULT_JOBS, search_space=SEARCH_SPACE, artifact_path=MODEL_ARTIFACT_PATH):
+    """
+    Cross-validates every candidate of search_space on the training data, running the
+    (candidate, fold) fits in parallel worker processes. The candidate with the parameters
+    the artifact at artifact_path is currently trained with is reported as the baseline.
+
+    Returns:
+        dict: the report, with candidates sorted by accuracy and the publishable winner
+    """
+    from joblib import Parallel, delayed, effective_n_jobs
+    from sklearn.model_selection import StratifiedKFold
+
+    X, y, feature_names, career_outcomes = generate_dummy_data(**TRAINING_PARAMS)
+    X, y = X.to_numpy(), y.to_numpy()
+
+    # Stratified folds need every career in every fold
+    smallest_class = int(np.unique(y, return_counts=True)[1].min())
+    if smallest_class < folds:
+        print(f"Using {smallest_class} folds: the rarest career has only {smallest_class} training samples.")
+        folds = smallest_class
+    if folds < 2:
+        raise ValueError("not enough training samples per career to cross-validate")
+    splits = list(StratifiedKFold(n_splits=folds, shuffle=True, random_state=SEARCH_RANDOM_STATE).split(X, y))
+
+    candidates = search_candidates(search_space)
+    print(f"Cross-validating {len(candidates)} candidates x {folds} folds on {effective_n_jobs(jobs)} worker(s)...")
+    start_time = time.perf_counter()
+    fold_accuracies = Parallel(n_jobs=jobs)(
+        delayed(evaluate_fold)(estimator, params, X, y, train_index, test_index)
+        for estimator, params in candidates
+        for train_index, test_index in splits
+    )
+    elapsed = time.perf_counter() - start_time
+
+    print(f"Timing fits and single-survey predictions of {len(candidates)} candidates, one at a time...")
+    entries = [
+        summarize(estimator, params, fold_accuracies[i * folds:(i + 1) * folds], measure_timings(estimator, params, X, y))
+        for i, (estimator, params) in enumerate(candidates)
+    ]
+    entries.sort(key=lambda entry: (-entry['accuracy_mean'], serving_ms(entry)))
+
+    # Most accurate publishable candidate; ties go to the faster one
+    winner = next(entry for entry in entries if entry['publishable'])
+    current_params = load_classifier_params(artifact_path)
+    baseline_params = {name: current_params.get(name, default) for name, default in DECISION_TREE_DEFAULTS.items()}
+    baseline = next((entry for entry in entries if entry['estimator'] == 'decision_tree' and entry['params'] == baseline_params), None)
+
+    return {
+        'format_version': REPORT_FORMAT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'jobs': effective_n_jobs(jobs),
+            'numpy': np.__version__,
+            'sklearn': installed_sklearn_version(),
+        },
+        'training_params': TRAINING_PARAMS,
+        'training_samples': len(y),
+        'folds': folds,
+        'cross_validation_s': elapsed,
+        'baseline': baseline,
+        'winner': winner,
+        'published': None,
+        'candidates': entries,
+    }
+
+def publish_winner(report, path=MODEL_ARTIFACT_PATH):
+    """
+    Publishes the winning decision tree's parameters as the artifact's params file, then
+    retrains the artifact with them. Later retrains of the artifact (retrain, or after it
+    goes stale) keep using the published parameters.
+    """
+    classifier_params = dict(CLASSIFIER_PARAMS, **report['winner']['params'])
+    save_classifier_params(classifier_params, path)
+    load_career_model(path, force_retrain=True)
+    report['published'] = {
+        'artifact': path,
+        'params_file': classifier_params_path(path),
+        'classifier_params': classifier_params,
+        'fingerprint': model_fingerprint(classifier_params),
+    }
+
+def write_report(report, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+
+def format_params(params):
+    return ', '.join(f"{name}={value}" for name, value in params.items())
+
+def print_report(report):
+    print(f"{'estimator':20} {'params':52} {'accuracy':>15} {'fit':>10} {'predict':>10}")
+    for entry in report['candidates']:
+        marker = '*' if entry is report['winner'] else ' '
+        print(f"{marker}{entry['estimator']:19} {format_params(entry['params']):52} "
+              f"{entry['accuracy_mean']:7.3f} ±{entry['accuracy_std']:6.3f} "
+              f"{entry['fit_ms']:7.2f} ms {serving_ms(entry):7.3f} ms")
+    print("fit: all training data; predict: one survey, scored with the NumPy model for decision trees and")
+    print("scikit-learn otherwise. Both are timed one candidate at a time, after cross-validation.")
+    winner, baseline = report['winner'], report['baseline']
+    print(f"Best publishable: {winner['estimator']} ({format_params(winner['params'])}), accuracy {winner['accuracy_mean']:.3f}.")
+    if baseline is not None:
+        print(f"Current parameters ({format_params(baseline['params'])}): accuracy {baseline['accuracy_mean']:.3f}.")
+    best = report['candidates'][0]
+    if not best['publishable']:
+        print(f"Note: {best['estimator']} scored higher ({best['accuracy_mean']:.3f}) but cannot be exported to the NumPy model.")
+
+
+# --- Command Line Interface ---
+def main(argv=None):
+    """Runs the cross-validated search, writes the report and publishes the winning model artifact."""
+    parser = argparse.ArgumentParser(description="Cross-validated model selection for the career model.")
+    parser.add_argument('--folds', type=int, default=DEFAULT_FOLDS, help="Cross-validation folds.")
+    parser.add_argument('--jobs', type=int, default=DEFAULT_JOBS, help="Worker processes (-1: all CPU cores).")
+    parser.add_argument('--report', default=DEFAULT_REPORT, help="Where to write the search report JSON.")
+    parser.add_argument('--artifact', default=MODEL_ARTIFACT_PATH, help="Path of the model artifact file.")
+    parser.add_argument('--no-publish', action='store_true', help="Only write the report; leave the artifact and its parameters alone.")
+    args = parser.parse_args(argv)
+
+    if args.folds < 2:
+        parser.error("--folds must be at least 2")
+    if args.jobs == 0:
+        parser.error("--jobs must not be 0")
+
+    try:
+        report = run_search(args.folds, args.jobs, artifact_path=args.artifact)
+        if not args.no_publish:
+            publish_winner(report, args.artifact)
+        write_report(report, args.report)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print_report(report)
+    print(f"Report written to {args.report}.")
+    if report['published']:
+        published = report['published']
+        print(f"Classifier parameters {published['classifier_params']} published to {published['params_file']}.")
+        print(f"Model artifact written to {args.artifact}; retrains keep these parameters.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
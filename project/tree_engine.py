@@ -0,0 +1,95 @@
+import numpy as np
+
+# Child index of a leaf node in sklearn's tree arrays
+TREE_LEAF = -1
+
+# Arrays (and the class list) that fully describe an exported model
+ARRAY_NAMES = ('mean', 'scale', 'children_left', 'children_right', 'feature', 'threshold', 'value')
+
+
+class TreeModel:
+    """
+    A fitted StandardScaler + DecisionTreeClassifier pipeline as plain NumPy arrays, with a
+    vectorized traversal that reproduces the pipeline's predict_proba exactly. Scoring with it
+    needs neither scikit-learn nor its input validation.
+
+    Has the predict_proba()/classes_ interface the recommendation functions use, so it can
+    stand in for the pipeline. fingerprint identifies the training setup of the model it was
+    exported from (see career_model.model_fingerprint), when known.
+    """
+
+    def __init__(self, classes, mean, scale, children_left, children_right, feature, threshold, value, fingerprint=None):
+        self.fingerprint = fingerprint
+        self.classes_ = np.asarray(classes)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.children_left = np.asarray(children_left, dtype=np.intp)
+        self.children_right = np.asarray(children_right, dtype=np.intp)
+        self.feature = np.asarray(feature, dtype=np.intp)
+        self.threshold = np.asarray(threshold, dtype=np.float64)
+        self.value = np.asarray(value, dtype=np.float64)
+
+    def to_arrays(self):
+        """Returns the model as a dict of NumPy arrays plus the class list, for storing in an artifact."""
+        arrays = {name: getattr(self, name) for name in ARRAY_NAMES}
+        arrays['classes'] = self.classes_.tolist()
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays, fingerprint=None):
+        return cls(arrays['classes'], *(arrays[name] for name in ARRAY_NAMES), fingerprint=fingerprint)
+
+    def apply(self, X):
+        """Returns the index of the leaf each row of X (already scaled, float32) ends up in."""
+        num_rows, num_features = X.shape
+        flat = np.ascontiguousarray(X).ravel()
+        nodes = np.zeros(num_rows, dtype=np.intp)
+        active = np.flatnonzero(self.children_left[nodes] != TREE_LEAF)
+        # One step down the tree per iteration for the rows not yet at a leaf
+        while active.size:
+            current = nodes[active]
+            go_left = flat[active * num_features + self.feature[current]] <= self.threshold[current]
+            current = np.where(go_left, self.children_left[current], self.children_right[current])
+            nodes[active] = current
+            active = active[self.children_left[current] != TREE_LEAF]
+        return nodes
+
+    def predict_proba(self, X):
+        """
+        Returns class probabilities for each row of X, an (N, num_features) array of unscaled features.
+        Matches Pipeline.predict_proba: features are standardized in float64 and compared with
+        the thresholds in float32, as DecisionTreeClassifier does.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        scaled = ((X - self.mean) / self.scale).astype(np.float32)
+        return self.value[self.apply(scaled)]
+
+
+def export_pipeline(pipeline, fingerprint=None):
+    """
+    Exports a fitted Pipeline([('scaler', StandardScaler()), ('classifier', DecisionTreeClassifier())])
+    to a TreeModel. Works on the fitted objects' attributes; scikit-learn is not imported here.
+    """
+    scaler = pipeline.named_steps['scaler']
+    classifier = pipeline.named_steps['classifier']
+    if getattr(classifier, 'n_outputs_', 1) != 1:
+        raise ValueError("Only single-output decision trees can be exported.")
+    tree = classifier.tree_
+    num_features = tree.n_features
+
+    mean = scaler.mean_ if scaler.with_mean and scaler.mean_ is not None else np.zeros(num_features)
+    scale = scaler.scale_ if scaler.with_std and scaler.scale_ is not None else np.ones(num_features)
+
+    # Normalize each node's class values the way predict_proba does: scikit-learn 1.4+ stores
+    # class fractions, older versions weighted class counts
+    value = np.array(tree.value[:, 0, :len(classifier.classes_)], dtype=float)
+    normalizer = value.sum(axis=1, keepdims=True)
+    normalizer[normalizer == 0.0] = 1.0
+    value /= normalizer
+
+    return TreeModel(
+        classifier.classes_, mean, scale,
+        tree.children_left, tree.children_right, tree.feature, tree.threshold, value, fingerprint
+    )